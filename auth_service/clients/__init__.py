@@ -0,0 +1,13 @@
+from auth_service.clients.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerStats,
+    CircuitState,
+)
+from auth_service.clients.pdf_client import PDFServiceClient
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitBreakerStats",
+    "CircuitState",
+    "PDFServiceClient",
+]
@@ -0,0 +1,107 @@
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitBreakerStats:
+    """
+    Point-in-time snapshot of a circuit breaker.
+    """
+
+    state: str
+    consecutive_failures: int
+    failure_threshold: int
+    recovery_timeout_seconds: float
+    rejected: int
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    After ``failure_threshold`` failures in a row the circuit opens and
+    every call is rejected for ``recovery_timeout`` seconds. Then a single
+    probe call is let through (half-open): success closes the circuit,
+    failure opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        recovery_timeout: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._failure_threshold = max(1, failure_threshold)
+        self._recovery_timeout = recovery_timeout
+        self._clock = clock
+
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    def allow_request(self) -> bool:
+        if self._state is CircuitState.OPEN:
+            if self._clock() - self._opened_at < self._recovery_timeout:
+                self._rejected += 1
+                return False
+            self._state = CircuitState.HALF_OPEN
+
+        if self._state is CircuitState.HALF_OPEN:
+            if self._probe_in_flight:
+                self._rejected += 1
+                return False
+            self._probe_in_flight = True
+
+        return True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._probe_in_flight = False
+        self._state = CircuitState.CLOSED
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._probe_in_flight = False
+        if (
+            self._state is CircuitState.HALF_OPEN
+            or self._failures >= self._failure_threshold
+        ):
+            self._state = CircuitState.OPEN
+            self._opened_at = self._clock()
+
+    def release(self) -> None:
+        """
+        Give back a half-open probe slot without recording an outcome,
+        e.g. when the call was cancelled.
+        """
+        self._probe_in_flight = False
+
+    def retry_after(self) -> int:
+        """
+        Seconds until the next probe is allowed (at least 1).
+        """
+        remaining = self._recovery_timeout - (self._clock() - self._opened_at)
+        return max(1, int(remaining + 0.999))
+
+    def stats(self) -> CircuitBreakerStats:
+        return CircuitBreakerStats(
+            state=self._state.value,
+            consecutive_failures=self._failures,
+            failure_threshold=self._failure_threshold,
+            recovery_timeout_seconds=self._recovery_timeout,
+            rejected=self._rejected,
+        )
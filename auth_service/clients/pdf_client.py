@@ -0,0 +1,110 @@
+import logging
+
+import httpx
+
+from auth_service.clients.circuit_breaker import CircuitBreaker
+from auth_service.exceptions import PDFServiceUnavailableError
+
+logger = logging.getLogger(__name__)
+
+# Answers pdf_service sends when it sheds load on purpose.
+_LOAD_SHEDDING_STATUSES = (429, 503)
+
+
+class PDFServiceClient:
+    """
+    Long-lived, pooled HTTP client for auth_service -> pdf_service calls.
+
+    Connections are kept alive and reused across requests. A circuit
+    breaker fails calls fast while pdf_service is unhealthy instead of
+    letting every request wait out the timeout. Load shedding (429/503
+    with Retry-After) means pdf_service is healthy but busy, so it is
+    passed through without counting as a failure.
+    """
+
+    def __init__(
+        self,
+        breaker: CircuitBreaker,
+        timeout: float,
+        max_connections: int,
+        max_keepalive_connections: int,
+        keepalive_expiry: float,
+        http2: bool = False,
+    ):
+        self._breaker = breaker
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        try:
+            self._client = httpx.AsyncClient(
+                timeout=timeout, limits=limits, http2=http2
+            )
+        except ImportError:
+            logger.warning(
+                "HTTP/2 requested but 'h2' is not installed, using HTTP/1.1"
+            )
+            self._client = httpx.AsyncClient(timeout=timeout, limits=limits)
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        return self._breaker
+
+    async def post(
+        self, url: str, json: dict, headers: dict[str, str]
+    ) -> httpx.Response:
+        """
+        Send a POST request to pdf_service through the circuit breaker.
+
+        Raises:
+            PDFServiceUnavailableError: If the circuit is open or the request
+                could not be completed.
+        """
+        request = self._client.build_request(
+            "POST", url=url, json=json, headers=headers
+        )
+        return await self._send(request, stream=False)
+
+    async def stream_post(
+        self, url: str, json: dict, headers: dict[str, str]
+    ) -> httpx.Response:
+        """
+        Like post(), but returns as soon as the response headers arrive.
+        The body must be consumed with ``aiter_raw()``/``aiter_bytes()`` and
+        the response closed with ``aclose()`` by the caller.
+        """
+        request = self._client.build_request(
+            "POST", url=url, json=json, headers=headers
+        )
+        return await self._send(request, stream=True)
+
+    async def _send(
+        self, request: httpx.Request, stream: bool
+    ) -> httpx.Response:
+        if not self._breaker.allow_request():
+            raise PDFServiceUnavailableError()
+
+        try:
+            response = await self._client.send(request, stream=stream)
+        except httpx.RequestError as err:
+            self._breaker.record_failure()
+            logger.warning(f"PDF service request failed: {err!r}")
+            raise PDFServiceUnavailableError() from err
+        except BaseException:
+            self._breaker.release()
+            raise
+
+        if (
+            response.status_code in _LOAD_SHEDDING_STATUSES
+            and "retry-after" in response.headers
+        ):
+            self._breaker.release()
+        elif response.status_code >= 500:
+            self._breaker.record_failure()
+        else:
+            self._breaker.record_success()
+        return response
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
@@ -1,17 +1,37 @@
 from auth_service.config.settings import Settings
 from auth_service.config.dependencies import (
+    AppResources,
     get_settings,
+    init_resources,
+    close_resources,
+    get_resources,
     get_jwt_manager,
+    get_password_hasher,
+    get_principal_cache,
+    get_pdf_client,
     SettingsDep,
     JWTManagerDep,
+    PasswordHasherDep,
+    PrincipalCacheDep,
+    PDFClientDep,
 )
 from auth_service.config.logging_config import setup_logging
 
 __all__ = [
     "Settings",
+    "AppResources",
     "get_settings",
+    "init_resources",
+    "close_resources",
+    "get_resources",
     "get_jwt_manager",
+    "get_password_hasher",
+    "get_principal_cache",
+    "get_pdf_client",
     "SettingsDep",
     "JWTManagerDep",
+    "PasswordHasherDep",
+    "PrincipalCacheDep",
+    "PDFClientDep",
     "setup_logging",
 ]
@@ -1,31 +1,137 @@
-import os
+from functools import lru_cache
 from typing import Annotated
 
 from fastapi import Depends
 
+from auth_service.clients import CircuitBreaker, PDFServiceClient
 from auth_service.config import Settings
-from auth_service.security import JWTAuthManager
+from auth_service.security import (
+    JWTAuthManager,
+    AsyncPasswordHasher,
+    PrincipalCache,
+)
 
 
+class AppResources:
+    """
+    Application-scoped singletons shared by every request.
+
+    Built once in the lifespan (or lazily on first use outside of it, e.g.
+    in scripts and tests) from the settings get_settings resolves to,
+    overrides included, and handed out by the dependency functions below.
+    """
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self.jwt_manager = JWTAuthManager(
+            secret_key_access=settings.SECRET_KEY_ACCESS,
+            secret_key_refresh=settings.SECRET_KEY_REFRESH,
+            algorithm=settings.JWT_SIGNING_ALGORITHM,
+        )
+        self.password_hasher = AsyncPasswordHasher(
+            workers=settings.PASSWORD_HASH_WORKERS,
+            max_queue_size=settings.PASSWORD_HASH_MAX_QUEUE,
+            use_processes=settings.PASSWORD_HASH_USE_PROCESSES,
+        )
+        self.principal_cache = PrincipalCache(
+            ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+            max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+        )
+        self.pdf_client = PDFServiceClient(
+            breaker=CircuitBreaker(
+                failure_threshold=settings.PDF_SERVICE_BREAKER_FAILURE_THRESHOLD,
+                recovery_timeout=settings.PDF_SERVICE_BREAKER_RECOVERY_SECONDS,
+            ),
+            timeout=settings.PDF_SERVICE_TIMEOUT_SECONDS,
+            max_connections=settings.PDF_SERVICE_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.PDF_SERVICE_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.PDF_SERVICE_KEEPALIVE_EXPIRY_SECONDS,
+            http2=settings.PDF_SERVICE_HTTP2,
+        )
+
+    async def aclose(self) -> None:
+        self.password_hasher.shutdown()
+        self.principal_cache.clear()
+        await self.pdf_client.aclose()
+
+
+_resources: AppResources | None = None
+
+
+@lru_cache
 def get_settings() -> Settings:
     """
     Retrieve the application settings based on the current environment.
+
+    Settings are parsed once per process.
     """
     return Settings()
 
 
-def get_jwt_manager(
+def init_resources(settings: Settings | None = None) -> AppResources:
+    """
+    Build the application resources container. Called from the lifespan.
+    """
+    global _resources
+    _resources = AppResources(settings or get_settings())
+    return _resources
+
+
+async def close_resources() -> None:
+    """
+    Release the resources container on application shutdown.
+    """
+    global _resources
+    if _resources is not None:
+        await _resources.aclose()
+        _resources = None
+
+
+def get_resources(
     settings: Annotated[Settings, Depends(get_settings)],
-) -> JWTAuthManager:
+) -> AppResources:
+    """
+    Return the current resources container, building it from ``settings``
+    if the lifespan has not run.
+    """
+    if _resources is None:
+        return init_resources(settings)
+    return _resources
+
+
+ResourcesDep = Annotated[AppResources, Depends(get_resources)]
+
+
+def get_jwt_manager(resources: ResourcesDep) -> JWTAuthManager:
+    """
+    Return the shared JWT authentication manager instance.
+    """
+    return resources.jwt_manager
+
+
+def get_password_hasher(resources: ResourcesDep) -> AsyncPasswordHasher:
+    """
+    Return the shared password hasher.
+    """
+    return resources.password_hasher
+
+
+def get_principal_cache(resources: ResourcesDep) -> PrincipalCache:
+    """
+    Return the shared cache of authenticated users.
+    """
+    return resources.principal_cache
+
+
+def get_pdf_client(resources: ResourcesDep) -> PDFServiceClient:
     """
-    Create and return a JWT authentication manager instance.
+    Return the shared pooled HTTP client for pdf_service.
     """
-    return JWTAuthManager(
-        secret_key_access=settings.SECRET_KEY_ACCESS,
-        secret_key_refresh=settings.SECRET_KEY_REFRESH,
-        algorithm=settings.JWT_SIGNING_ALGORITHM,
-    )
+    return resources.pdf_client
 
 
 SettingsDep = Annotated[Settings, Depends(get_settings)]
 JWTManagerDep = Annotated[JWTAuthManager, Depends(get_jwt_manager)]
+PasswordHasherDep = Annotated[AsyncPasswordHasher, Depends(get_password_hasher)]
+PrincipalCacheDep = Annotated[PrincipalCache, Depends(get_principal_cache)]
+PDFClientDep = Annotated[PDFServiceClient, Depends(get_pdf_client)]
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 from pydantic import Field, computed_field
@@ -23,6 +24,18 @@ class Settings(BaseSettings):
     SECRET_KEY_REFRESH: str = Field("placeholder_refresh", alias="SECRET_KEY_REFRESH")
     JWT_SIGNING_ALGORITHM: str = "HS256"
 
+    PASSWORD_HASH_WORKERS: int = Field(default_factory=lambda: os.cpu_count() or 1)
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+    PASSWORD_HASH_USE_PROCESSES: bool = False
+
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 30.0
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10_000
+
+    TOKEN_SWEEP_ENABLED: bool = True
+    TOKEN_SWEEP_INTERVAL_SECONDS: float = 3600.0
+    TOKEN_SWEEP_BATCH_SIZE: int = 1000
+    TOKEN_SWEEP_BATCH_PAUSE_SECONDS: float = 0.5
+
     PDF_SERVICE_URL: str = Field(
         "http://pdf_service:8001/pdf/generate", alias="PDF_SERVICE_URL"
     )
@@ -30,6 +43,19 @@ class Settings(BaseSettings):
         "http://127.0.0.1:8001/pdf/generate-in-storage",
         alias="PDF_SERVICE_URL_IN_STORAGE",
     )
+    PDF_SERVICE_TIMEOUT_SECONDS: float = 10.0
+    PDF_SERVICE_MAX_CONNECTIONS: int = 100
+    PDF_SERVICE_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    PDF_SERVICE_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    PDF_SERVICE_HTTP2: bool = False
+    PDF_SERVICE_BREAKER_FAILURE_THRESHOLD: int = 5
+    PDF_SERVICE_BREAKER_RECOVERY_SECONDS: float = 30.0
+
+    # Part of every profile ETag. pdf_service cannot be asked for its
+    # template version per request, so bump this together with its
+    # PROFILE_TEMPLATE_VERSION, or clients keep getting 304 for old PDFs.
+    PROFILE_PDF_VERSION: str = "1"
+    PROFILE_CACHE_CONTROL: str = "private, no-cache"
 
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
@@ -4,10 +4,12 @@ from auth_service.crud.user import (
     logout_user,
     refresh_token,
 )
+from auth_service.crud.token import purge_expired_refresh_tokens
 
 __all__ = [
     "create_new_user",
     "login_user",
     "logout_user",
     "refresh_token",
+    "purge_expired_refresh_tokens",
 ]
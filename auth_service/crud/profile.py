@@ -1,12 +1,14 @@
+import hashlib
 import logging
 from typing import Annotated
 
 import httpx
 
-from fastapi import HTTPException, status, Request, Response
+from fastapi import Request
 from fastapi.params import Depends
 
-from auth_service.config import setup_logging
+from auth_service.clients import PDFServiceClient
+from auth_service.config import setup_logging, get_pdf_client
 from auth_service.schemas import UserReadSchema
 from auth_service.security.utils import get_current_user
 
@@ -14,20 +16,83 @@ setup_logging()
 logger = logging.getLogger(__name__)
 
 
+def build_profile_etag(user: UserReadSchema, variant: str, version: str) -> str | None:
+    """
+    Build a weak ETag for a profile representation from the user id and
+    the row's ``updated_at``. ``variant`` distinguishes representations
+    of the profile and ``version`` lets a deploy invalidate all tags.
+
+    Returns None when the user version is unknown.
+    """
+    if user.updated_at is None:
+        return None
+
+    raw = f"{variant}:{version}:{user.id}:{user.updated_at.isoformat()}"
+    digest = hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str | None) -> bool:
+    """
+    Weak comparison of an If-None-Match header against an ETag.
+    """
+    if not if_none_match or not etag:
+        return False
+
+    opaque_tag = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque_tag:
+            return True
+    return False
+
+
 async def generate_pdf_report(
     request: Request,
     user: Annotated[UserReadSchema, Depends(get_current_user)],
     url: str,
-) -> Response:
+    pdf_client: Annotated[PDFServiceClient, Depends(get_pdf_client)],
+) -> httpx.Response:
+    """
+    Forward the authenticated user's data to pdf_service.
+
+    Raises:
+        PDFServiceUnavailableError: If pdf_service is unreachable or the
+            circuit breaker is open.
+    """
     auth_header = request.headers.get("Authorization")
 
     logger.info(f"Generating PDF report for {url}")
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            url=url,
-            json=user.model_dump(mode="json"),
-            headers={"Authorization": auth_header},
-            timeout=10.0,
-        )
-        return response
+    return await pdf_client.post(
+        url=url,
+        json=user.model_dump(mode="json"),
+        headers={"Authorization": auth_header},
+    )
+
+
+async def stream_pdf_report(
+    request: Request,
+    user: Annotated[UserReadSchema, Depends(get_current_user)],
+    url: str,
+    pdf_client: Annotated[PDFServiceClient, Depends(get_pdf_client)],
+) -> httpx.Response:
+    """
+    Same as generate_pdf_report, but returns once pdf_service has sent the
+    response headers, leaving the body unread so it can be streamed.
+
+    The caller owns the returned response and must close it.
+
+    Raises:
+        PDFServiceUnavailableError: If pdf_service is unreachable or the
+            circuit breaker is open.
+    """
+    auth_header = request.headers.get("Authorization")
+
+    logger.info(f"Streaming PDF report from {url}")
+
+    return await pdf_client.stream_post(
+        url=url,
+        json=user.model_dump(mode="json"),
+        headers={"Authorization": auth_header},
+    )
@@ -0,0 +1,42 @@
+from sqlalchemy import select, delete, func
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from auth_service.database.models import RefreshTokenModel
+
+
+async def purge_expired_refresh_tokens(
+    db: AsyncSession, batch_size: int
+) -> int:
+    """
+    Deletes at most ``batch_size`` expired refresh tokens in one short
+    transaction.
+
+    Rows already locked by a concurrent sweeper are skipped, so several
+    service replicas can purge at the same time without waiting on each
+    other.
+
+    Args:
+        db (AsyncSession): Database session.
+        batch_size (int): Maximum number of rows to delete.
+
+    Returns:
+        int: Number of deleted rows.
+    """
+    expired_ids = (
+        select(RefreshTokenModel.id)
+        .where(RefreshTokenModel.expires_at < func.now())
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    stmt = delete(RefreshTokenModel).where(
+        RefreshTokenModel.id.in_(expired_ids)
+    )
+
+    try:
+        result = await db.execute(stmt)
+        await db.commit()
+    except SQLAlchemyError:
+        await db.rollback()
+        raise
+    return result.rowcount
@@ -6,7 +6,13 @@ from sqlalchemy import select, delete
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from auth_service.config import Settings, get_jwt_manager, get_settings
+from auth_service.config import (
+    Settings,
+    get_jwt_manager,
+    get_settings,
+    get_password_hasher,
+    get_principal_cache,
+)
 from auth_service.database import get_db
 from auth_service.database.models import UserModel, RefreshTokenModel
 from auth_service.exceptions import (
@@ -24,7 +30,12 @@ from auth_service.schemas import (
     RefreshTokenSchema,
     RefreshTokenResponseSchema,
 )
-from auth_service.security import JWTAuthManagerInterface
+from auth_service.security import (
+    JWTAuthManagerInterface,
+    AsyncPasswordHasher,
+    PrincipalCache,
+    hash_token,
+)
 from auth_service.security.utils import get_current_user
 
 
@@ -44,7 +55,9 @@ async def _get_user_by_email(email: str, db: AsyncSession) -> UserModel:
 
 
 async def create_new_user(
-    user_data: UserCreateSchema, db: Annotated[AsyncSession, Depends(get_db)]
+    user_data: UserCreateSchema,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    password_hasher: Annotated[AsyncPasswordHasher, Depends(get_password_hasher)],
 ) -> UserReadSchema:
     """
     Registers a new user in the system.
@@ -55,10 +68,12 @@ async def create_new_user(
     Args:
         user_data (UserCreateSchema): Data for the new user.
         db (DBDep): Async database session.
+        password_hasher (PasswordHasherDep): Off-loop bcrypt executor.
 
     Raises:
         UserAlreadyExistsException: If the email is already registered.
         UserCreateException: If a database error occurs during commitment.
+        PasswordHasherBusyError: If the hashing queue is full.
 
     Returns:
         UserReadSchema: The newly created user's public information.
@@ -70,12 +85,13 @@ async def create_new_user(
             message="User with provided email already exists"
         )
 
+    hashed_password = await password_hasher.hash(user_data.password)
     user = UserModel.create(
         email=user_data.email,
         name=user_data.name,
         surname=user_data.surname,
         date_of_birth=user_data.date_of_birth,
-        raw_password=user_data.password,
+        hashed_password=hashed_password,
     )
     db.add(user)
 
@@ -95,6 +111,8 @@ async def login_user(
     db: Annotated[AsyncSession, Depends(get_db)],
     jwt_manager: Annotated[JWTAuthManagerInterface, Depends(get_jwt_manager)],
     settings: Annotated[Settings, Depends(get_settings)],
+    password_hasher: Annotated[AsyncPasswordHasher, Depends(get_password_hasher)],
+    principal_cache: Annotated[PrincipalCache, Depends(get_principal_cache)],
 ) -> LoginResponseSchema:
     """
     Authenticates a user and generates access/refresh tokens.
@@ -107,16 +125,21 @@ async def login_user(
         db (DBDep): Async database session.
         jwt_manager (JWTManagerDep): Service for token generation.
         settings (SettingsDep): Application configuration.
+        password_hasher (PasswordHasherDep): Off-loop bcrypt executor.
+        principal_cache (PrincipalCacheDep): Authenticated users cache.
 
     Raises:
         UserNotFoundException: If credentials do not match any user.
         AuthException: If a database error occurs while saving refresh tokens.
+        PasswordHasherBusyError: If the hashing queue is full.
 
     Returns:
         LoginResponseSchema: A set of JWT tokens and token type.
     """
     user = await _get_user_by_email(login_data.email, db)
-    if not user or not user.check_password(login_data.password):
+    if not user or not await password_hasher.verify(
+        login_data.password, user.hashed_password
+    ):
         raise UserNotFoundException(message="Incorrect email or password")
     token_data = {
         "user_id": user.id,
@@ -137,6 +160,7 @@ async def login_user(
     db.add(db_token)
     try:
         await db.commit()
+        principal_cache.invalidate(user.id)
         return LoginResponseSchema(
             access_token=access_token,
             refresh_token=refresh_token,
@@ -152,6 +176,7 @@ async def login_user(
 async def logout_user(
     db: Annotated[AsyncSession, Depends(get_db)],
     auth_user: Annotated[UserReadSchema, Depends(get_current_user)],
+    principal_cache: Annotated[PrincipalCache, Depends(get_principal_cache)],
 ) -> CommonResponseSchema:
     """
     Invalides user sessions by deleting refresh tokens.
@@ -159,6 +184,7 @@ async def logout_user(
     Args:
         db (AsyncSession): Database session.
         auth_user (UserReadSchema): Currently authenticated user.
+        principal_cache (PrincipalCache): Authenticated users cache.
 
     Returns:
         CommonResponseSchema: Success message.
@@ -171,6 +197,8 @@ async def logout_user(
     except SQLAlchemyError:
         await db.rollback()
         raise
+    finally:
+        principal_cache.invalidate(auth_user.id)
     return CommonResponseSchema(
         message="Successfully logged out from all devices",
     )
@@ -198,7 +226,7 @@ async def refresh_token(
         UserBaseException: If token is invalid or not found in DB.
     """
     stmt = select(RefreshTokenModel).where(
-        RefreshTokenModel.token == token.refresh_token
+        RefreshTokenModel.token_hash == hash_token(token.refresh_token)
     )
     result = await db.execute(stmt)
     db_token = result.scalar_one_or_none()
@@ -208,7 +236,7 @@ async def refresh_token(
 
     payload = jwt_manager.decode_refresh_token(token.refresh_token)
 
-    user_id = payload.get("id")
+    user_id = payload.get("user_id")
     email = payload.get("email")
 
     if not user_id or not email:
@@ -0,0 +1,35 @@
+"""index_refresh_tokens_expires_at
+
+Revision ID: 5b7d0c3e9f12
+Revises: 8c4f2e91a7d3
+Create Date: 2026-10-18 12:20:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa  # noqa
+
+# revision identifiers, used by Alembic.
+revision: str = "5b7d0c3e9f12"
+down_revision: Union[str, Sequence[str], None] = "8c4f2e91a7d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        op.f("ix_refresh_tokens_expires_at"),
+        "refresh_tokens",
+        ["expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_refresh_tokens_expires_at"), table_name="refresh_tokens"
+    )
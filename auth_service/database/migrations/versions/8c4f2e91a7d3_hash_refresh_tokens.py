@@ -0,0 +1,68 @@
+"""hash_refresh_tokens
+
+Revision ID: 8c4f2e91a7d3
+Revises: 13df13adc1e1
+Create Date: 2026-10-18 12:10:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "8c4f2e91a7d3"
+down_revision: Union[str, Sequence[str], None] = "13df13adc1e1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "refresh_tokens",
+        sa.Column("token_hash", sa.String(length=64), nullable=True),
+    )
+    # Backfill digests for existing sessions (same SHA-256 hex as hash_token).
+    op.execute(
+        "UPDATE refresh_tokens "
+        "SET token_hash = encode(sha256(convert_to(token, 'UTF8')), 'hex')"
+    )
+    # Tokens issued for the same user within one second were identical,
+    # keep a single row per digest so the unique index can be built.
+    op.execute(
+        "DELETE FROM refresh_tokens a USING refresh_tokens b "
+        "WHERE a.token_hash = b.token_hash AND a.id > b.id"
+    )
+    op.alter_column("refresh_tokens", "token_hash", nullable=False)
+    op.create_index(
+        op.f("ix_refresh_tokens_token_hash"),
+        "refresh_tokens",
+        ["token_hash"],
+        unique=True,
+    )
+    op.create_index(
+        op.f("ix_refresh_tokens_user_id"),
+        "refresh_tokens",
+        ["user_id"],
+        unique=False,
+    )
+    op.drop_column("refresh_tokens", "token")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Raw tokens cannot be recovered from digests: drop all sessions.
+    op.execute("DELETE FROM refresh_tokens")
+    op.add_column(
+        "refresh_tokens",
+        sa.Column("token", sa.String(length=255), nullable=False),
+    )
+    op.drop_index(
+        op.f("ix_refresh_tokens_user_id"), table_name="refresh_tokens"
+    )
+    op.drop_index(
+        op.f("ix_refresh_tokens_token_hash"), table_name="refresh_tokens"
+    )
+    op.drop_column("refresh_tokens", "token_hash")
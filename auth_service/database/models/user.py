@@ -6,7 +6,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from auth_service.config import get_settings
 from auth_service.database import Base
-from auth_service.security import hash_password, verify_password
+from auth_service.security import hash_token
 
 settings = get_settings()
 
@@ -50,7 +50,7 @@ class UserModel(Base):
     def create(
         cls,
         email: str,
-        raw_password: str,
+        hashed_password: str,
         name: str,
         surname: str,
         date_of_birth: date,
@@ -58,47 +58,38 @@ class UserModel(Base):
         """
         Factory method to create a new UserModel instance.
 
-        This method simplifies the creation of a new user by handling
-        password hashing and setting required attributes.
+        Expects an already hashed password, so the bcrypt cost can be paid
+        off the event loop (see AsyncPasswordHasher).
         """
-        user = cls(
+        return cls(
             email=email,
             name=name,
             surname=surname,
             date_of_birth=date_of_birth,
+            _hashed_password=hashed_password,
         )
-        user.password = raw_password
-        return user
 
     @property
-    def password(self) -> None:
-        raise AttributeError(
-            "Password is write-only. Use the setter to set the password."
-        )
-
-    @password.setter
-    def password(self, password: str) -> None:
-        hashed_password = hash_password(password)
-
-        self._hashed_password = hashed_password
-
-    def check_password(self, password: str) -> bool:
-        return verify_password(password, self._hashed_password)
+    def hashed_password(self) -> str:
+        return self._hashed_password
 
 
 class RefreshTokenModel(Base):
     __tablename__ = "refresh_tokens"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    token: Mapped[str] = mapped_column(String(255), nullable=False)
+    token_hash: Mapped[str] = mapped_column(
+        String(64), nullable=False, unique=True, index=True
+    )
     expires_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
+        index=True,
         default=lambda: datetime.now(timezone.utc) + timedelta(days=1),
     )
 
     user_id: Mapped[int] = mapped_column(
-        ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     user: Mapped[UserModel] = relationship("UserModel", back_populates="refresh_tokens")
@@ -107,14 +98,20 @@ class RefreshTokenModel(Base):
     def create(cls, user_id: int | Mapped[int], token: str) -> "RefreshTokenModel":
         """
         Factory method to create a new RefreshTokenModel instance.
+
+        Only the digest of the token is stored (see hash_token).
         """
         expires_at = datetime.now(timezone.utc) + timedelta(
             days=settings.REFRESH_TOKEN_DAYS
         )
-        return cls(user_id=user_id, expires_at=expires_at, token=token)
+        return cls(
+            user_id=user_id,
+            expires_at=expires_at,
+            token_hash=hash_token(token),
+        )
 
     def __repr__(self) -> str:
         return (
             f"<RefreshTokenModel(id={self.id}, "
-            f"token={self.token}, expires_at={self.expires_at})>"
+            f"token_hash={self.token_hash}, expires_at={self.expires_at})>"
         )
@@ -8,8 +8,10 @@ from auth_service.exceptions.security import (
     TokenExpiredError,
     InvalidTokenError,
     PasswordChangeError,
+    PasswordHasherBusyError,
     BaseSecurityException,
 )
+from auth_service.exceptions.pdf_service import PDFServiceUnavailableError
 
 __all__ = [
     #  AUTH
@@ -21,5 +23,8 @@ __all__ = [
     "TokenExpiredError",
     "InvalidTokenError",
     "PasswordChangeError",
+    "PasswordHasherBusyError",
     "BaseSecurityException",
+    #  PDF service
+    "PDFServiceUnavailableError",
 ]
@@ -0,0 +1,7 @@
+class PDFServiceUnavailableError(Exception):
+    """Exception raised when pdf_service cannot be reached or is failing"""
+
+    def __init__(self, message: str | None = None) -> None:
+        if message is None:
+            message = "PDF service is currently unavailable"
+        super().__init__(message)
@@ -15,3 +15,7 @@ class InvalidTokenError(BaseSecurityException):
 
 class PasswordChangeError(BaseSecurityException):
     """Exception raised when a password is incorrect"""
+
+
+class PasswordHasherBusyError(BaseSecurityException):
+    """Exception raised when the password hasher queue is full"""
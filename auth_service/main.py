@@ -1,12 +1,20 @@
+import asyncio
+import contextlib
 import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 
-from auth_service.config import setup_logging
+from auth_service.config import (
+    setup_logging,
+    get_settings,
+    init_resources,
+    close_resources,
+)
 from auth_service.exceptions import UserBaseException
 from auth_service.routers import api_v1_router
+from auth_service.sweeper import run_sweeper
 
 setup_logging()
 logger = logging.getLogger(__name__)
@@ -15,8 +23,23 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):  # noqa
     logger.info("AUTH Service is starting up...")
+    # Resolve settings the way request dependencies do, so an override of
+    # get_settings also reaches the shared resources.
+    settings = app.dependency_overrides.get(get_settings, get_settings)()
+    init_resources(settings)
+
+    sweeper_task = None
+    if settings.TOKEN_SWEEP_ENABLED:
+        sweeper_task = asyncio.create_task(run_sweeper(settings))
+
     yield
 
+    if sweeper_task is not None:
+        sweeper_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await sweeper_task
+    await close_resources()
+
 
 app = FastAPI(title="Auth Service", lifespan=lifespan)
 
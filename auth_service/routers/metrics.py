@@ -0,0 +1,34 @@
+from dataclasses import asdict
+
+from fastapi import APIRouter
+
+from auth_service.config import (
+    PasswordHasherDep,
+    PrincipalCacheDep,
+    PDFClientDep,
+)
+
+metrics_router = APIRouter(tags=["Metrics"])
+
+
+@metrics_router.get(
+    "/metrics",
+    summary="Service load metrics",
+    description="Return in-process counters for the auth service workers.",
+)
+async def get_metrics(
+    password_hasher: PasswordHasherDep,
+    principal_cache: PrincipalCacheDep,
+    pdf_client: PDFClientDep,
+) -> dict:
+    """
+    Expose runtime metrics:
+    - **password_hasher**: bcrypt executor queue depth and wait time
+    - **principal_cache**: authenticated users cache size and hit ratio
+    - **pdf_service_breaker**: circuit breaker state for pdf_service calls
+    """
+    return {
+        "password_hasher": asdict(password_hasher.stats()),
+        "principal_cache": asdict(principal_cache.stats()),
+        "pdf_service_breaker": asdict(pdf_client.breaker.stats()),
+    }
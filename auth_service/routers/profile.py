@@ -1,17 +1,64 @@
-from typing import Annotated
+from typing import Annotated, AsyncIterator
 
 import httpx
-from fastapi import APIRouter, Depends, status, HTTPException, Response, Request
-from fastapi.responses import JSONResponse
+from fastapi import (
+    APIRouter,
+    Depends,
+    status,
+    HTTPException,
+    Response,
+    Request,
+    Header,
+)
+from fastapi.responses import JSONResponse, StreamingResponse
 
-from auth_service.config import Settings, get_settings
-from auth_service.crud.profile import generate_pdf_report
-from auth_service.exceptions import UserBaseException
+from auth_service.clients import PDFServiceClient, CircuitState
+from auth_service.config import Settings, get_settings, PDFClientDep
+from auth_service.crud.profile import (
+    generate_pdf_report,
+    stream_pdf_report,
+    build_profile_etag,
+    etag_matches,
+)
+from auth_service.exceptions import UserBaseException, PDFServiceUnavailableError
 from auth_service.schemas import UserReadSchema
 from auth_service.security.utils import get_current_user
 
 profile_router = APIRouter(tags=["Profile"])
 
+# Upstream headers forwarded as-is on the streamed PDF response.
+_PASSTHROUGH_HEADERS = ("content-length", "content-encoding")
+
+
+def _pdf_service_unavailable(
+    pdf_client: PDFServiceClient, err: PDFServiceUnavailableError
+) -> HTTPException:
+    headers = None
+    if pdf_client.breaker.state is CircuitState.OPEN:
+        headers = {"Retry-After": str(pdf_client.breaker.retry_after())}
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(err),
+        headers=headers,
+    )
+
+
+async def _relay_body(response: httpx.Response) -> AsyncIterator[bytes]:
+    # Closed here rather than in a background task, which does not run
+    # when the client disconnects mid-stream.
+    try:
+        async for chunk in response.aiter_raw():
+            yield chunk
+    finally:
+        await response.aclose()
+
+
+def _cache_headers(etag: str | None, settings: Settings) -> dict[str, str]:
+    headers = {"Cache-Control": settings.PROFILE_CACHE_CONTROL}
+    if etag:
+        headers["ETag"] = etag
+    return headers
+
 
 @profile_router.get(
     "/me/profile",
@@ -22,42 +69,68 @@ profile_router = APIRouter(tags=["Profile"])
             "content": {"application/pdf": {}},
             "description": "A PDF file representing the user profile.",
         },
+        304: {"description": "Profile has not changed since the given ETag"},
         401: {"description": "Invalid or expired token"},
+        503: {"description": "PDF service is unavailable"},
     },
 )
 async def get_profile(
     request: Request,
     user: Annotated[UserReadSchema, Depends(get_current_user)],
     settings: Annotated[Settings, Depends(get_settings)],
+    pdf_client: PDFClientDep,
+    if_none_match: Annotated[str | None, Header()] = None,
 ) -> Response:
     """
     Endpoint to retrieve the current user's profile in PDF format.
 
     - **Authentication**: Required via Bearer Token
-    - **Returns**: Binary PDF stream
+    - **Returns**: Binary PDF stream, relayed chunk by chunk from pdf_service
+    - **Caching**: ETag tied to the user version, 304 on `If-None-Match`
     """
+    etag = build_profile_etag(user, "pdf", settings.PROFILE_PDF_VERSION)
+    cache_headers = _cache_headers(etag, settings)
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers
+        )
 
     try:
-        response = await generate_pdf_report(
+        response = await stream_pdf_report(
             request=request,
             user=user,
             url=settings.PDF_SERVICE_URL,
-        )
-        return Response(
-            content=response.content,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f'attachment; filename="profile_{user.id}.pdf"'
-            },
+            pdf_client=pdf_client,
         )
     except UserBaseException as err:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(err))
-    except httpx.RequestError:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="PDF service is currently unavailable",
+    except PDFServiceUnavailableError as err:
+        raise _pdf_service_unavailable(pdf_client, err)
+
+    if not response.is_success:
+        content = await response.aread()
+        await response.aclose()
+        retry_after = response.headers.get("retry-after")
+        return Response(
+            content=content,
+            status_code=response.status_code,
+            media_type=response.headers.get("content-type"),
+            headers={"Retry-After": retry_after} if retry_after else None,
         )
 
+    headers = {
+        name: response.headers[name]
+        for name in _PASSTHROUGH_HEADERS
+        if name in response.headers
+    }
+    headers["Content-Disposition"] = f'attachment; filename="profile_{user.id}.pdf"'
+    headers.update(cache_headers)
+    return StreamingResponse(
+        content=_relay_body(response),
+        media_type=response.headers.get("content-type", "application/pdf"),
+        headers=headers,
+    )
+
 
 @profile_router.get(
     "/me/profile-in-storage",
@@ -69,12 +142,14 @@ async def get_profile(
             "description": "A PDF file representing the user profile.",
         },
         401: {"description": "Invalid or expired token"},
+        503: {"description": "PDF service is unavailable"},
     },
 )
 async def get_profile_in_storage(
     request: Request,
     user: Annotated[UserReadSchema, Depends(get_current_user)],
     settings: Annotated[Settings, Depends(get_settings)],
+    pdf_client: PDFClientDep,
 ) -> Response:
     """
     Endpoint to generate the current user's profile in PDF format and save it
@@ -82,20 +157,19 @@ async def get_profile_in_storage(
 
     - **Authentication**: Required via Bearer Token
     - **Returns**: Response with link inside
+    - **Caching**: none, every call enqueues a new render job
     """
-
     try:
         response = await generate_pdf_report(
             request=request,
             user=user,
             url=settings.PDF_SERVICE_URL_IN_STORAGE,
+            pdf_client=pdf_client,
+        )
+        return JSONResponse(
+            content=response.json(), status_code=response.status_code
         )
-        return JSONResponse(content=response.json(), status_code=response.status_code)
     except UserBaseException as err:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(err))
-    except httpx.RequestError as err:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            # detail="PDF service is currently unavailable"
-            detail=str(err),
-        )
+    except PDFServiceUnavailableError as err:
+        raise _pdf_service_unavailable(pdf_client, err)
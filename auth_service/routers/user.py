@@ -6,13 +6,19 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from auth_service.config import (
     JWTManagerDep,
     SettingsDep,
+    PasswordHasherDep,
+    PrincipalCacheDep,
     Settings,
     get_settings,
     get_jwt_manager,
 )
 from auth_service.crud import create_new_user, login_user, logout_user, refresh_token
 from auth_service.database import get_db
-from auth_service.exceptions import UserBaseException, BaseSecurityException
+from auth_service.exceptions import (
+    UserBaseException,
+    BaseSecurityException,
+    PasswordHasherBusyError,
+)
 from auth_service.schemas import (
     UserReadSchema,
     UserCreateSchema,
@@ -36,10 +42,13 @@ user_router = APIRouter(tags=["Authentication"])
     responses={
         400: {"description": "User already exists or validation error"},
         422: {"description": "Validation Error"},
+        503: {"description": "Too many concurrent authentication requests"},
     },
 )
 async def register(
-    user_data: UserCreateSchema, db: Annotated[AsyncSession, Depends(get_db)]
+    user_data: UserCreateSchema,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    password_hasher: PasswordHasherDep,
 ) -> UserReadSchema:
     """
     Register a new user in the system.
@@ -53,6 +62,13 @@ async def register(
         return await create_new_user(
             db=db,
             user_data=user_data,
+            password_hasher=password_hasher,
+        )
+    except PasswordHasherBusyError as err:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(err),
+            headers={"Retry-After": "1"},
         )
     except UserBaseException as err:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(err))
@@ -66,6 +82,7 @@ async def register(
     responses={
         400: {"description": "Invalid credentials"},
         401: {"description": "Unauthorized"},
+        503: {"description": "Too many concurrent authentication requests"},
     },
 )
 async def login(
@@ -73,6 +90,8 @@ async def login(
     db: Annotated[AsyncSession, Depends(get_db)],
     jwt_manager: JWTManagerDep,
     settings: SettingsDep,
+    password_hasher: PasswordHasherDep,
+    principal_cache: PrincipalCacheDep,
 ) -> LoginResponseSchema:
     """
     Authenticate a user and return JWT tokens.
@@ -87,8 +106,16 @@ async def login(
             jwt_manager=jwt_manager,
             settings=settings,
             login_data=login_data,
+            password_hasher=password_hasher,
+            principal_cache=principal_cache,
         )
         return result
+    except PasswordHasherBusyError as err:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(err),
+            headers={"Retry-After": "1"},
+        )
     except (UserBaseException, BaseSecurityException):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -107,6 +134,7 @@ async def login(
 async def logout(
     db: Annotated[AsyncSession, Depends(get_db)],
     auth_user: Annotated[UserReadSchema, Depends(get_current_user)],
+    principal_cache: PrincipalCacheDep,
 ) -> CommonResponseSchema:
     """
     Logout the current user:
@@ -114,7 +142,9 @@ async def logout(
     - **Action**: Deletes all refresh tokens associated with the user ID
     """
     try:
-        return await logout_user(db=db, auth_user=auth_user)
+        return await logout_user(
+            db=db, auth_user=auth_user, principal_cache=principal_cache
+        )
     except UserBaseException as err:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(err))
 
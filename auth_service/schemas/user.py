@@ -1,7 +1,7 @@
-from datetime import date
+from datetime import date, datetime
 
 from auth_service.validators import validate_password
-from pydantic import BaseModel, EmailStr, field_validator, ConfigDict
+from pydantic import BaseModel, EmailStr, field_validator, ConfigDict, Field
 
 
 class UserBaseSchema(BaseModel):
@@ -36,6 +36,8 @@ class UserReadSchema(UserBaseSchema):
 
     id: int
     email: EmailStr
+    # Internal version marker for conditional requests, never serialized.
+    updated_at: datetime | None = Field(default=None, exclude=True)
 
 
 class LoginRequestSchema(BaseModel):
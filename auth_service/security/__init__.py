@@ -1,13 +1,27 @@
 from auth_service.security.password import hash_password, verify_password
+from auth_service.security.digest import hash_token
 from auth_service.security.interfaces import JWTAuthManagerInterface
 from auth_service.security.token_manager import JWTAuthManager
+from auth_service.security.hasher import AsyncPasswordHasher, PasswordHasherStats
+from auth_service.security.principal_cache import (
+    PrincipalCache,
+    PrincipalCacheStats,
+)
 
 __all__ = [
     #  Password
     "hash_password",
     "verify_password",
+    #  Digest
+    "hash_token",
     #  Interface
     "JWTAuthManagerInterface",
     #  TokenManager
     "JWTAuthManager",
+    #  Hasher
+    "AsyncPasswordHasher",
+    "PasswordHasherStats",
+    #  Principal cache
+    "PrincipalCache",
+    "PrincipalCacheStats",
 ]
@@ -0,0 +1,9 @@
+import hashlib
+
+
+def hash_token(token: str) -> str:
+    """
+    Returns the fixed-length SHA-256 hex digest used to store and look up
+    refresh tokens, so the raw token never touches the database.
+    """
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
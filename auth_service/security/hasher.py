@@ -0,0 +1,151 @@
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from dataclasses import dataclass
+from typing import Callable, TypeVar
+
+from auth_service.exceptions import PasswordHasherBusyError
+from auth_service.security.password import hash_password, verify_password
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class PasswordHasherStats:
+    """
+    Point-in-time snapshot of the password hasher load.
+    """
+
+    workers: int
+    max_queue_size: int
+    queue_depth: int
+    in_progress: int
+    completed: int
+    rejected: int
+    avg_wait_ms: float
+    max_wait_ms: float
+
+
+class AsyncPasswordHasher:
+    """
+    Runs bcrypt hashing and verification in a bounded executor so the
+    event loop never blocks on the bcrypt cost.
+
+    At most ``workers`` operations run at once; up to ``max_queue_size``
+    further calls wait for a free worker. Anything beyond that is rejected
+    with PasswordHasherBusyError instead of piling up.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        max_queue_size: int,
+        use_processes: bool = False,
+    ):
+        self._workers = max(1, workers)
+        self._max_queue_size = max(0, max_queue_size)
+        self._use_processes = use_processes
+        self._executor: Executor | None = None
+        self._slots = asyncio.Semaphore(self._workers)
+
+        self._waiting = 0
+        self._in_progress = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self._use_processes:
+                # spawn: forking a process that runs an event loop and
+                # threads can deadlock the children.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                # bcrypt releases the GIL, so threads hash on all cores.
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._workers,
+                    thread_name_prefix="password-hasher",
+                )
+        return self._executor
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        if self._slots.locked() and self._waiting >= self._max_queue_size:
+            self._rejected += 1
+            raise PasswordHasherBusyError(
+                message="Too many authentication requests. Please try again."
+            )
+
+        self._waiting += 1
+        enqueued_at = time.perf_counter()
+        try:
+            await self._slots.acquire()
+        finally:
+            self._waiting -= 1
+
+        wait = time.perf_counter() - enqueued_at
+        self._total_wait += wait
+        self._max_wait = max(self._max_wait, wait)
+
+        self._in_progress += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_executor(), func, *args
+            )
+        finally:
+            self._in_progress -= 1
+            self._completed += 1
+            self._slots.release()
+
+    async def hash(self, password: str) -> str:
+        """
+        Hash a password without blocking the event loop.
+        """
+        return await self._run(hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verify a password against its hash without blocking the event loop.
+        """
+        return await self._run(
+            verify_password, plain_password, hashed_password
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        return self._waiting
+
+    def stats(self) -> PasswordHasherStats:
+        started = self._completed + self._in_progress
+        avg_wait = self._total_wait / started if started else 0.0
+        return PasswordHasherStats(
+            workers=self._workers,
+            max_queue_size=self._max_queue_size,
+            queue_depth=self._waiting,
+            in_progress=self._in_progress,
+            completed=self._completed,
+            rejected=self._rejected,
+            avg_wait_ms=round(avg_wait * 1000, 3),
+            max_wait_ms=round(self._max_wait * 1000, 3),
+        )
+
+    def shutdown(self) -> None:
+        """
+        Stop the underlying executor, dropping calls that have not started.
+        """
+        if self._executor is not None:
+            logger.info("Shutting down password hasher executor")
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
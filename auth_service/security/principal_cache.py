@@ -0,0 +1,95 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable
+
+from auth_service.schemas import UserReadSchema
+
+
+@dataclass(frozen=True)
+class PrincipalCacheStats:
+    """
+    Point-in-time snapshot of the principal cache.
+    """
+
+    size: int
+    max_size: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    evictions: int
+
+
+class PrincipalCache:
+    """
+    In-process TTL + LRU cache of authenticated users keyed by user id.
+
+    Only users with an active session are stored, so a hit lets
+    get_current_user skip the database entirely. Entries must be
+    invalidated explicitly when the session state changes (login/logout);
+    otherwise they expire after ``ttl_seconds``.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_size: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._ttl = ttl_seconds
+        self._max_size = max(0, max_size)
+        self._clock = clock
+        self._entries: OrderedDict[int, tuple[float, UserReadSchema]] = (
+            OrderedDict()
+        )
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_size > 0 and self._ttl > 0
+
+    def get(self, user_id: int) -> UserReadSchema | None:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        expires_at, principal = entry
+        if expires_at <= self._clock():
+            del self._entries[user_id]
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(user_id)
+        self._hits += 1
+        return principal
+
+    def set(self, user_id: int, principal: UserReadSchema) -> None:
+        if not self.enabled:
+            return
+
+        self._entries[user_id] = (self._clock() + self._ttl, principal)
+        self._entries.move_to_end(user_id)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, user_id: int) -> None:
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> PrincipalCacheStats:
+        return PrincipalCacheStats(
+            size=len(self._entries),
+            max_size=self._max_size,
+            ttl_seconds=self._ttl,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+        )
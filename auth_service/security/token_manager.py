@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta, timezone
 from typing import Optional, cast, Any
+from uuid import uuid4
 
 from jose import jwt, JWTError, ExpiredSignatureError
 
@@ -61,9 +62,12 @@ class JWTAuthManager(JWTAuthManagerInterface):
     ) -> str:
         """
         Create a new refresh token with a default or specified expiration time.
+
+        Each refresh token carries a random ``jti`` so tokens issued for the
+        same user within the same second are still distinct.
         """
         return self._create_token(
-            data,
+            {**data, "jti": uuid4().hex},
             self._secret_key_refresh,
             expires_delta or timedelta(minutes=self._REFRESH_KEY_TIMEDELTA_MINUTES),
         )
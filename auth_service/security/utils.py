@@ -5,12 +5,11 @@ from fastapi.security import (
     HTTPAuthorizationCredentials,
     HTTPBearer,
 )
-from sqlalchemy import select
+from sqlalchemy import select, exists
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
 from auth_service.database import get_db
-from auth_service.database.models import UserModel
+from auth_service.database.models import UserModel, RefreshTokenModel
 from auth_service.exceptions import (
     TokenExpiredError,
     InvalidTokenError,
@@ -18,8 +17,8 @@ from auth_service.exceptions import (
     UserBaseException,
 )
 from auth_service.schemas import UserReadSchema
-from auth_service.security import JWTAuthManagerInterface
-from auth_service.config import get_jwt_manager
+from auth_service.security import JWTAuthManagerInterface, PrincipalCache
+from auth_service.config import get_jwt_manager, get_principal_cache
 
 security_scheme = HTTPBearer()
 
@@ -28,6 +27,7 @@ async def get_current_user(
     db: Annotated[AsyncSession, Depends(get_db)],
     auth: Annotated[HTTPAuthorizationCredentials, Depends(security_scheme)],
     jwt_manager: Annotated[JWTAuthManagerInterface, Depends(get_jwt_manager)],
+    principal_cache: Annotated[PrincipalCache, Depends(get_principal_cache)],
 ) -> UserReadSchema:
     token = auth.credentials
     try:
@@ -38,21 +38,29 @@ async def get_current_user(
 
     user_id = user_data.get("user_id")
 
+    cached_user = principal_cache.get(user_id)
+    if cached_user is not None:
+        return cached_user
+
+    has_session = exists().where(RefreshTokenModel.user_id == UserModel.id)
     result = await db.execute(
-        select(UserModel)
-        .options(joinedload(UserModel.refresh_tokens))
-        .where(UserModel.id == user_id)
+        select(UserModel, has_session.label("has_session")).where(
+            UserModel.id == user_id
+        )
     )
-    auth_user = result.unique().scalar_one_or_none()
+    row = result.one_or_none()
 
-    if not auth_user:
+    if not row:
         raise UserNotFoundException(
             message="User not found with provided credentials.",
         )
 
-    if not auth_user.refresh_tokens:
+    auth_user, is_logged_in = row
+    if not is_logged_in:
         raise UserBaseException(
             message="You are not logged in. Please log in first",
         )
 
-    return UserReadSchema.model_validate(auth_user)
+    principal = UserReadSchema.model_validate(auth_user)
+    principal_cache.set(user_id, principal)
+    return principal
@@ -0,0 +1,81 @@
+import argparse
+import asyncio
+import logging
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from auth_service.config import Settings, get_settings, setup_logging
+from auth_service.crud.token import purge_expired_refresh_tokens
+from auth_service.database.engine import AsyncSessionLocal
+
+setup_logging()
+logger = logging.getLogger(__name__)
+
+
+async def sweep_expired_tokens(batch_size: int, batch_pause: float) -> int:
+    """
+    Deletes all currently expired refresh tokens in bounded batches,
+    pausing between batches so the sweep never holds long locks.
+
+    :return: Total number of deleted rows.
+    """
+    total = 0
+    while True:
+        async with AsyncSessionLocal() as db:
+            deleted = await purge_expired_refresh_tokens(db, batch_size)
+        total += deleted
+
+        if deleted < batch_size:
+            break
+        await asyncio.sleep(batch_pause)
+
+    logger.info(f"Token sweep removed {total} expired refresh tokens")
+    return total
+
+
+async def run_sweeper(settings: Settings) -> None:
+    """
+    Periodically purge expired refresh tokens until cancelled.
+    """
+    logger.info(
+        "Refresh token sweeper started "
+        f"(every {settings.TOKEN_SWEEP_INTERVAL_SECONDS}s, "
+        f"batch {settings.TOKEN_SWEEP_BATCH_SIZE})"
+    )
+    while True:
+        try:
+            await sweep_expired_tokens(
+                batch_size=settings.TOKEN_SWEEP_BATCH_SIZE,
+                batch_pause=settings.TOKEN_SWEEP_BATCH_PAUSE_SECONDS,
+            )
+        except asyncio.CancelledError:
+            raise
+        except SQLAlchemyError as error:
+            logger.error(f"Token sweep failed: {error}")
+        except Exception:
+            # Any other error must not end the loop for the process lifetime.
+            logger.exception("Token sweep failed")
+
+        await asyncio.sleep(settings.TOKEN_SWEEP_INTERVAL_SECONDS)
+
+
+async def main(once: bool) -> None:
+    settings = get_settings()
+    if once:
+        await sweep_expired_tokens(
+            batch_size=settings.TOKEN_SWEEP_BATCH_SIZE,
+            batch_pause=settings.TOKEN_SWEEP_BATCH_PAUSE_SECONDS,
+        )
+    else:
+        await run_sweeper(settings)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Purge expired refresh tokens"
+    )
+    parser.add_argument(
+        "--once", action="store_true", help="run a single sweep and exit"
+    )
+    args = parser.parse_args()
+    asyncio.run(main(once=args.once))
@@ -0,0 +1,89 @@
+"""
+Per-call overhead of a fresh aiobotocore client per S3 call (the old
+behaviour) against one long-lived pooled client.
+
+By default the calls go to a local stub HTTP endpoint so only client-side
+overhead is measured; pass --endpoint-url to run against localstack/S3.
+
+    python -m benchmarks.bench_aws_clients [--calls N] [--endpoint-url URL]
+"""
+
+import argparse
+import asyncio
+import time
+
+import aioboto3
+from aiobotocore.config import AioConfig
+from aiohttp import web
+
+from pdf_service.storage.aws_client import AWSClient
+
+BUCKET = "user-pdfs"
+BODY = b"%PDF-1.3 benchmark"
+
+
+async def start_stub_endpoint() -> tuple[web.AppRunner, str]:
+    async def ok(request: web.Request) -> web.Response:
+        await request.read()
+        return web.Response(headers={"ETag": '"stub"'})
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", ok)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+async def measure(client: AWSClient, calls: int) -> float:
+    started_at = time.perf_counter()
+    for index in range(calls):
+        async with client.client() as s3:
+            await s3.put_object(
+                Bucket=BUCKET, Key=f"bench/{index}.pdf", Body=BODY
+            )
+    return (time.perf_counter() - started_at) / calls * 1000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--endpoint-url")
+    args = parser.parse_args()
+
+    runner = None
+    endpoint_url = args.endpoint_url
+    if endpoint_url is None:
+        runner, endpoint_url = await start_stub_endpoint()
+
+    session = aioboto3.Session(
+        aws_access_key_id="test", aws_secret_access_key="test"
+    )
+    config = AioConfig(max_pool_connections=50, tcp_keepalive=True)
+
+    def make_client() -> AWSClient:
+        return AWSClient(session, "s3", endpoint_url, "us-east-1", config)
+
+    try:
+        per_call = await measure(make_client(), args.calls)
+
+        pooled = make_client()
+        await pooled.start()
+        try:
+            long_lived = await measure(pooled, args.calls)
+        finally:
+            await pooled.aclose()
+    finally:
+        if runner is not None:
+            await runner.cleanup()
+
+    print(f"{'calls':<26}{args.calls:>10}")
+    print(f"{'client per call':<26}{per_call:>10.3f} ms/call")
+    print(f"{'long-lived client':<26}{long_lived:>10.3f} ms/call")
+    print(f"{'speed-up':<26}{per_call / long_lived:>10.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
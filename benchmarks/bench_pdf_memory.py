@@ -0,0 +1,81 @@
+"""
+Peak bytes allocated per profile render with the old BytesIO pipeline and
+the single-buffer one.
+
+The render itself (layout, zlib state) is reported separately from the
+hand-off, i.e. everything between the finished document and the HTTP
+response body, which is where the buffer copies happen.
+
+    python -m benchmarks.bench_pdf_memory [--renders N]
+"""
+
+import argparse
+import tracemalloc
+from io import BytesIO
+from typing import Callable
+
+from fastapi import Response
+
+from pdf_service.schemas import UserReadSchema
+from pdf_service.services import generate_user_pdf
+
+USER = UserReadSchema(
+    id=1,
+    name="Ivan",
+    surname="Tester",
+    email="test@example.com",
+    date_of_birth="1995-01-01",
+)
+
+
+def buffered_response(pdf_output: bytes | bytearray) -> Response:
+    """
+    The previous pipeline: output -> BytesIO -> getvalue() -> Response.
+    """
+    pdf_buffer = BytesIO()
+    pdf_buffer.write(pdf_output)
+    pdf_buffer.seek(0)
+    return Response(
+        content=pdf_buffer.getvalue(), media_type="application/pdf"
+    )
+
+
+def direct_response(pdf_output: bytes) -> Response:
+    return Response(content=pdf_output, media_type="application/pdf")
+
+
+def median_peak(run: Callable[[], object], renders: int) -> int:
+    run()
+    peaks = []
+    for _ in range(renders):
+        tracemalloc.start()
+        result = run()
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        del result
+    return sorted(peaks)[len(peaks) // 2]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--renders", type=int, default=200)
+    args = parser.parse_args()
+
+    document = generate_user_pdf(USER)
+    # FPDF.output() hands out a bytearray.
+    fpdf_output = bytearray(document)
+
+    render = median_peak(lambda: generate_user_pdf(USER), args.renders)
+    before = median_peak(lambda: buffered_response(fpdf_output), args.renders)
+    after = median_peak(lambda: direct_response(document), args.renders)
+
+    print(f"{'document size':<28}{len(document):>10} bytes")
+    print(f"{'render peak':<28}{render:>10} bytes")
+    print(f"{'hand-off peak, before':<28}{before:>10} bytes")
+    print(f"{'hand-off peak, after':<28}{after:>10} bytes")
+    print(f"{'peak per render, before':<28}{render + before:>10} bytes")
+    print(f"{'peak per render, after':<28}{render + after:>10} bytes")
+
+
+if __name__ == "__main__":
+    main()
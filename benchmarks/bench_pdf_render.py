@@ -0,0 +1,56 @@
+"""
+Renders per second of the compiled profile template against a full FPDF
+render of the same document.
+
+    python -m benchmarks.bench_pdf_render [--renders N]
+"""
+
+import argparse
+import time
+from typing import Callable
+
+from pdf_service.schemas import UserReadSchema
+from pdf_service.services import generate_user_pdf
+from pdf_service.services.pdf_service import render_user_pdf_fpdf
+from pdf_service.services.pdf_template import get_profile_template
+
+
+def make_users(count: int) -> list[UserReadSchema]:
+    return [
+        UserReadSchema(
+            id=user_id,
+            name=f"Name{user_id}",
+            surname="Tester",
+            email=f"user{user_id}@example.com",
+            date_of_birth="1995-01-01",
+        )
+        for user_id in range(count)
+    ]
+
+
+def measure(render: Callable[[UserReadSchema], object], users: list) -> float:
+    started_at = time.perf_counter()
+    for user in users:
+        render(user)
+    return len(users) / (time.perf_counter() - started_at)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--renders", type=int, default=2000)
+    args = parser.parse_args()
+
+    users = make_users(args.renders)
+    get_profile_template()
+
+    fpdf_rate = measure(render_user_pdf_fpdf, users)
+    template_rate = measure(generate_user_pdf, users)
+
+    print(f"{'renders':<20}{args.renders:>10}")
+    print(f"{'fpdf':<20}{fpdf_rate:>10.1f} renders/s")
+    print(f"{'compiled template':<20}{template_rate:>10.1f} renders/s")
+    print(f"{'speed-up':<20}{template_rate / fpdf_rate:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,10 @@
 from pdf_service.config.settings import PDFSettings
 from pdf_service.config.dependencies import (
+    PDFResources,
     get_settings,
+    init_resources,
+    close_resources,
+    get_resources,
     # get_jwt_manager,
     # SettingsDep,
     # JWTManagerDep,
@@ -8,7 +12,11 @@ from pdf_service.config.dependencies import (
 
 __all__ = [
     "PDFSettings",
+    "PDFResources",
     "get_settings",
+    "init_resources",
+    "close_resources",
+    "get_resources",
     # "get_jwt_manager",
     # "SettingsDep",
     # "JWTManagerDep",
@@ -1,55 +1,225 @@
-from typing import Annotated
+from functools import lru_cache
 
-from fastapi import Depends
+import aioboto3
+from aiobotocore.config import AioConfig
 
 from pdf_service.config import PDFSettings
 from pdf_service.security.token_manager import JWTAuthManager
-from pdf_service.storage.interfaces import SQSStorageInterface
+from pdf_service.services import (
+    PDFBytes,
+    PDFCache,
+    PDFRenderPool,
+    SingleFlight,
+    SQSEnqueueBatcher,
+)
+from pdf_service.storage.interfaces import (
+    JobStatusStoreInterface,
+    SQSStorageInterface,
+)
+from pdf_service.storage.job_store import MemoryJobStatusStore, SQLiteJobStatusStore
 from pdf_service.storage.s3 import S3StorageClient
 from pdf_service.storage.sqs import SQSClient
 
-# from pdf_service.security import JWTAuthManager
+
+class PDFResources:
+    """
+    Application-scoped singletons shared by every request.
+
+    Built once in the lifespan (or at worker start) and handed out by the
+    dependency functions below. Outside of both it is built lazily on
+    first use.
+    """
+
+    def __init__(self, settings: PDFSettings):
+        self.settings = settings
+        self.jwt_manager = JWTAuthManager(
+            secret_key_access=settings.SECRET_KEY_ACCESS,
+            secret_key_refresh=settings.SECRET_KEY_REFRESH,
+            algorithm=settings.JWT_SIGNING_ALGORITHM,
+        )
+        self.aws_session = aioboto3.Session(
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        )
+        aws_config = AioConfig(
+            max_pool_connections=settings.AWS_MAX_POOL_CONNECTIONS,
+            connect_timeout=settings.AWS_CONNECT_TIMEOUT_SECONDS,
+            read_timeout=settings.AWS_READ_TIMEOUT_SECONDS,
+            tcp_keepalive=settings.AWS_TCP_KEEPALIVE,
+            connector_args={
+                "keepalive_timeout": settings.AWS_KEEPALIVE_TIMEOUT_SECONDS
+            },
+        )
+        self.s3_manager = S3StorageClient(
+            endpoint_url=settings.AWS_ENDPOINT_URL,
+            access_key=settings.AWS_ACCESS_KEY_ID,
+            secret_key=settings.AWS_SECRET_ACCESS_KEY,
+            bucket_name=settings.S3_BUCKET_NAME,
+            region_name=settings.AWS_REGION,
+            session=self.aws_session,
+            config=aws_config,
+            chunk_size=settings.S3_DOWNLOAD_CHUNK_SIZE,
+            public_endpoint_url=settings.AWS_PUBLIC_ENDPOINT_URL,
+            presigned_url_ttl=settings.PDF_PRESIGNED_URL_TTL_SECONDS,
+            presigned_url_cache_size=settings.PDF_PRESIGNED_URL_CACHE_SIZE,
+        )
+        self.sqs_manager = SQSClient(
+            endpoint_url=settings.AWS_ENDPOINT_URL,
+            access_key=settings.AWS_ACCESS_KEY_ID,
+            secret_key=settings.AWS_SECRET_ACCESS_KEY,
+            queue_name=settings.SQS_QUEUE_NAME,
+            region_name=settings.AWS_REGION,
+            session=self.aws_session,
+            config=aws_config,
+        )
+        self.sqs_dead_letter_manager = SQSClient(
+            endpoint_url=settings.AWS_ENDPOINT_URL,
+            access_key=settings.AWS_ACCESS_KEY_ID,
+            secret_key=settings.AWS_SECRET_ACCESS_KEY,
+            queue_name=settings.SQS_DEAD_LETTER_QUEUE_NAME,
+            region_name=settings.AWS_REGION,
+            session=self.aws_session,
+            config=aws_config,
+        )
+        self.render_pool = PDFRenderPool(
+            workers=settings.PDF_RENDER_WORKERS,
+            max_in_flight=settings.PDF_RENDER_MAX_IN_FLIGHT,
+            retry_after=settings.PDF_RENDER_RETRY_AFTER_SECONDS,
+        )
+        self.pdf_cache = PDFCache(
+            s3_manager=self.s3_manager,
+            max_memory_bytes=settings.PDF_CACHE_MAX_MEMORY_BYTES,
+            s3_tier=settings.PDF_CACHE_S3_ENABLED,
+            s3_prefix=settings.PDF_CACHE_S3_PREFIX,
+            s3_timeout=settings.PDF_CACHE_S3_TIMEOUT_SECONDS,
+        )
+        # Coalesces concurrent cache lookups/renders of identical profiles.
+        self.render_flight: SingleFlight[PDFBytes] = SingleFlight()
+        self.job_store: JobStatusStoreInterface
+        if settings.PDF_JOB_STORE_BACKEND == "sqlite":
+            self.job_store = SQLiteJobStatusStore(
+                path=settings.PDF_JOB_STORE_SQLITE_PATH,
+                ttl_seconds=settings.PDF_JOB_STORE_TTL_SECONDS,
+                poll_interval=settings.PDF_JOB_STORE_POLL_INTERVAL_SECONDS,
+            )
+        else:
+            self.job_store = MemoryJobStatusStore(
+                ttl_seconds=settings.PDF_JOB_STORE_TTL_SECONDS
+            )
+        self.enqueue_batcher = SQSEnqueueBatcher(
+            sqs_manager=self.sqs_manager,
+            max_batch_size=settings.PDF_ENQUEUE_MAX_BATCH_SIZE,
+            flush_window=settings.PDF_ENQUEUE_FLUSH_WINDOW_MS / 1000,
+        )
+
+    async def start(self) -> None:
+        await self.s3_manager.start()
+        await self.sqs_manager.start()
+        await self.sqs_dead_letter_manager.start()
+        await self.render_pool.start()
+
+    async def aclose(self) -> None:
+        await self.enqueue_batcher.aclose()
+        await self.pdf_cache.aclose()
+        self.render_pool.shutdown()
+        await self.sqs_dead_letter_manager.aclose()
+        await self.sqs_manager.aclose()
+        await self.s3_manager.aclose()
+        await self.job_store.aclose()
 
 
+_resources: PDFResources | None = None
+
+
+@lru_cache
 def get_settings() -> PDFSettings:
     """
     Retrieve the application settings based on the current environment.
+
+    Settings are parsed once per process.
     """
     return PDFSettings()
 
 
-async def get_s3_manager(
-    settings: Annotated[PDFSettings, Depends(get_settings)],
-) -> S3StorageClient:
-    return S3StorageClient(
-        endpoint_url=settings.AWS_ENDPOINT_URL,
-        access_key=settings.AWS_ACCESS_KEY_ID,
-        secret_key=settings.AWS_SECRET_ACCESS_KEY,
-        bucket_name=settings.S3_BUCKET_NAME,
-        region_name=settings.AWS_REGION,
-    )
-
-
-async def get_sqs_manager(
-    settings: Annotated[PDFSettings, Depends(get_settings)],
-) -> SQSStorageInterface:
-    return SQSClient(
-        endpoint_url=settings.AWS_ENDPOINT_URL,
-        access_key=settings.AWS_ACCESS_KEY_ID,
-        secret_key=settings.AWS_SECRET_ACCESS_KEY,
-        queue_name=settings.SQS_QUEUE_NAME,
-        region_name=settings.AWS_REGION,
-    )
-
-
-def get_jwt_manager(
-    settings: Annotated[PDFSettings, Depends(get_settings)],
-) -> JWTAuthManager:
-    """
-    Create and return a JWT authentication manager instance.
-    """
-    return JWTAuthManager(
-        secret_key_access=settings.SECRET_KEY_ACCESS,
-        secret_key_refresh=settings.SECRET_KEY_REFRESH,
-        algorithm=settings.JWT_SIGNING_ALGORITHM,
-    )
+def init_resources(settings: PDFSettings | None = None) -> PDFResources:
+    """
+    Build the application resources container.
+    """
+    global _resources
+    _resources = PDFResources(settings or get_settings())
+    return _resources
+
+
+async def close_resources() -> None:
+    """
+    Release the resources container on shutdown.
+    """
+    global _resources
+    if _resources is not None:
+        await _resources.aclose()
+        _resources = None
+
+
+def get_resources() -> PDFResources:
+    """
+    Return the current resources container, building it if needed.
+    """
+    if _resources is None:
+        return init_resources()
+    return _resources
+
+
+def get_s3_manager() -> S3StorageClient:
+    """
+    Return the shared S3 storage manager.
+    """
+    return get_resources().s3_manager
+
+
+def get_sqs_manager() -> SQSStorageInterface:
+    """
+    Return the shared SQS queue manager.
+    """
+    return get_resources().sqs_manager
+
+
+def get_enqueue_batcher() -> SQSEnqueueBatcher:
+    """
+    Return the shared micro-batching SQS enqueuer.
+    """
+    return get_resources().enqueue_batcher
+
+
+def get_job_store() -> JobStatusStoreInterface:
+    """
+    Return the shared background job status store.
+    """
+    return get_resources().job_store
+
+
+def get_render_pool() -> PDFRenderPool:
+    """
+    Return the shared PDF render process pool.
+    """
+    return get_resources().render_pool
+
+
+def get_pdf_cache() -> PDFCache:
+    """
+    Return the shared content-addressed PDF cache.
+    """
+    return get_resources().pdf_cache
+
+
+def get_render_flight() -> SingleFlight[PDFBytes]:
+    """
+    Return the shared single-flight group for synchronous renders.
+    """
+    return get_resources().render_flight
+
+
+def get_jwt_manager() -> JWTAuthManager:
+    """
+    Return the shared JWT authentication manager instance.
+    """
+    return get_resources().jwt_manager
@@ -1,4 +1,6 @@
+import os
 from pathlib import Path
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -28,4 +30,77 @@ class PDFSettings(BaseSettings):
     AWS_REGION: str = Field("us-east-1", alias="AWS_REGION")
 
     SQS_QUEUE_NAME: str = Field("pdf-jobs")
+    SQS_DEAD_LETTER_QUEUE_NAME: str = Field("pdf-jobs-dlq")
     S3_BUCKET_NAME: str = Field("user-pdfs")
+    S3_DOWNLOAD_CHUNK_SIZE: int = 64 * 1024
+
+    # "proxy": GET /pdf/{file_name} streams the file through this service.
+    # "redirect": it answers 302 to a presigned S3 URL, signed per request.
+    PDF_DOWNLOAD_MODE: Literal["proxy", "redirect"] = "proxy"
+    PDF_PUBLIC_BASE_URL: str = "http://127.0.0.1:8001"
+    AWS_PUBLIC_ENDPOINT_URL: str | None = None
+    PDF_PRESIGNED_URL_TTL_SECONDS: int = 300
+    PDF_PRESIGNED_URL_CACHE_SIZE: int = 10_000
+
+    AWS_MAX_POOL_CONNECTIONS: int = 50
+    AWS_KEEPALIVE_TIMEOUT_SECONDS: float = 60.0
+    AWS_TCP_KEEPALIVE: bool = True
+    AWS_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    AWS_READ_TIMEOUT_SECONDS: float = 60.0
+
+    PDF_RENDER_WORKERS: int = Field(default_factory=lambda: os.cpu_count() or 1)
+    PDF_RENDER_MAX_IN_FLIGHT: int = 64
+    PDF_RENDER_RETRY_AFTER_SECONDS: int = 1
+
+    PDF_CACHE_MAX_MEMORY_BYTES: int = 64 * 1024 * 1024
+    PDF_CACHE_S3_ENABLED: bool = True
+    PDF_CACHE_S3_PREFIX: str = "cache/"
+    # S3 cache lookups slower than this count as misses.
+    PDF_CACHE_S3_TIMEOUT_SECONDS: float = 0.5
+
+    PDF_BATCH_MAX_ITEMS: int = 500
+    PDF_BATCH_CONCURRENCY: int = 8
+
+    PDF_ENQUEUE_MAX_BATCH_SIZE: int = 10
+    PDF_ENQUEUE_FLUSH_WINDOW_MS: float = 5.0
+    # An identical job (same job_id and profile content) queued, rendering
+    # or done within this window is not enqueued again; 0 disables.
+    PDF_ENQUEUE_DEDUP_WINDOW_SECONDS: float = 300.0
+
+    PDF_WORKER_FETCH_CONCURRENCY: int = 1
+    PDF_WORKER_RENDER_CONCURRENCY: int = Field(
+        default_factory=lambda: os.cpu_count() or 1
+    )
+    PDF_WORKER_UPLOAD_CONCURRENCY: int = 8
+    PDF_WORKER_ACK_CONCURRENCY: int = 1
+    PDF_WORKER_QUEUE_SIZE: int = 20
+    PDF_WORKER_RECEIVE_BATCH_SIZE: int = 10
+    PDF_WORKER_STATS_INTERVAL_SECONDS: float = 30.0
+    PDF_WORKER_DRAIN_TIMEOUT_SECONDS: float = 30.0
+    # A failed job becomes visible again after RETRY_BASE * 2^(attempt - 1)
+    # seconds (capped); after MAX_ATTEMPTS it moves to the dead-letter queue.
+    PDF_WORKER_MAX_ATTEMPTS: int = 5
+    PDF_WORKER_RETRY_BASE_SECONDS: int = 5
+    PDF_WORKER_RETRY_MAX_SECONDS: int = 900
+    # In-flight jobs have their lease extended to VISIBILITY_TIMEOUT every
+    # HEARTBEAT_INTERVAL; keep the interval below the queue's own timeout.
+    PDF_WORKER_VISIBILITY_TIMEOUT_SECONDS: int = 60
+    PDF_WORKER_HEARTBEAT_INTERVAL_SECONDS: float = 10.0
+
+    # Supervisor (python -m pdf_service.supervisor). A worker process is
+    # recycled after MAX_JOBS settled jobs or once its process tree uses
+    # more than MAX_RSS_BYTES; 0 disables either limit.
+    PDF_SUPERVISOR_PROCESSES: int = Field(default_factory=lambda: os.cpu_count() or 1)
+    PDF_SUPERVISOR_MAX_JOBS: int = 5000
+    PDF_SUPERVISOR_MAX_RSS_BYTES: int = 512 * 1024 * 1024
+    PDF_SUPERVISOR_CHECK_INTERVAL_SECONDS: float = 2.0
+
+    # "memory" only works when the API and the worker share a process;
+    # "sqlite" shares one file between processes on the same node.
+    PDF_JOB_STORE_BACKEND: Literal["memory", "sqlite"] = "memory"
+    PDF_JOB_STORE_SQLITE_PATH: str = "/tmp/pdf_jobs.sqlite3"
+    PDF_JOB_STORE_TTL_SECONDS: float = 24 * 60 * 60
+    PDF_JOB_STORE_POLL_INTERVAL_SECONDS: float = 0.5
+    PDF_JOB_WAIT_MAX_SECONDS: float = 30.0
+    PDF_JOB_SSE_MAX_SECONDS: float = 300.0
+    PDF_JOB_SSE_HEARTBEAT_SECONDS: float = 15.0
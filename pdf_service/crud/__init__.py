@@ -1,11 +1,23 @@
 from pdf_service.crud.profile import (
     prepare_profile_pdf_response,
+    prepare_profile_pdf_batch_response,
     generate_profile_pdf_in_storage,
+    redirect_to_profile_pdf,
     retrieve_profile_pdf,
 )
+from pdf_service.crud.jobs import (
+    job_status_payload,
+    retrieve_job_status,
+    stream_job_status,
+)
 
 __all__ = [
     "prepare_profile_pdf_response",
+    "prepare_profile_pdf_batch_response",
     "generate_profile_pdf_in_storage",
+    "redirect_to_profile_pdf",
     "retrieve_profile_pdf",
+    "job_status_payload",
+    "retrieve_job_status",
+    "stream_job_status",
 ]
@@ -0,0 +1,116 @@
+import json
+import time
+from datetime import datetime, timezone
+from typing import Annotated, AsyncIterator
+
+from fastapi import Depends, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from pdf_service.config import PDFSettings
+from pdf_service.config.dependencies import get_job_store, get_settings
+from pdf_service.services import JobNotFoundError
+from pdf_service.storage.interfaces import JobStatus, JobStatusStoreInterface
+
+
+def job_status_payload(status: JobStatus) -> dict:
+    return {
+        "job_id": status.job_id,
+        "state": status.state.value,
+        "version": status.version,
+        "updated_at": datetime.fromtimestamp(
+            status.updated_at, tz=timezone.utc
+        ).isoformat(),
+        "error": status.error,
+    }
+
+
+async def retrieve_job_status(
+    job_id: str,
+    job_store: Annotated[JobStatusStoreInterface, Depends(get_job_store)],
+    settings: Annotated[PDFSettings, Depends(get_settings)],
+    wait: float = 0,
+    version: int = 0,
+) -> Response:
+    """
+    Return the status of a background PDF job, long-polling when asked.
+    Args:
+        :param job_id: The job identifier returned on enqueue.
+        :param job_store: Background job status store.
+        :param settings: PDF service settings (maximum wait).
+        :param wait: Seconds to hold the request while the job has not
+            moved past ``version``. Capped by ``PDF_JOB_WAIT_MAX_SECONDS``.
+        :param version: The last status version the client has seen.
+    Returns:
+        Response: JSON with the job state; unchanged after a timeout.
+    Raises:
+        JobNotFoundError: If the job is unknown or its status expired.
+    """
+    wait = min(wait, settings.PDF_JOB_WAIT_MAX_SECONDS)
+    if wait > 0:
+        status = await job_store.wait_for_update(job_id, version, wait)
+    else:
+        status = await job_store.get(job_id)
+    if status is None:
+        raise JobNotFoundError()
+
+    return JSONResponse(
+        content=job_status_payload(status),
+        headers={"Cache-Control": "no-store"},
+    )
+
+
+async def stream_job_status(
+    job_id: str,
+    job_store: Annotated[JobStatusStoreInterface, Depends(get_job_store)],
+    settings: Annotated[PDFSettings, Depends(get_settings)],
+    version: int = 0,
+) -> StreamingResponse:
+    """
+    Stream the status of a background PDF job as Server-Sent Events: one
+    ``status`` event per transition, until the job is done or failed.
+    Args:
+        :param job_id: The job identifier returned on enqueue.
+        :param job_store: Background job status store.
+        :param settings: PDF service settings (stream duration, heartbeat).
+        :param version: The last status version the client has seen, e.g.
+            from ``Last-Event-ID`` on reconnect.
+    Returns:
+        StreamingResponse: ``text/event-stream`` of job statuses.
+    Raises:
+        JobNotFoundError: If the job is unknown or its status expired.
+    """
+    status = await job_store.get(job_id)
+    if status is None:
+        raise JobNotFoundError()
+
+    async def events() -> AsyncIterator[str]:
+        current: JobStatus | None = status
+        last_version = version
+        deadline = time.monotonic() + settings.PDF_JOB_SSE_MAX_SECONDS
+        while current is not None:
+            if current.version > last_version:
+                last_version = current.version
+                yield (
+                    f"id: {current.version}\nevent: status\n"
+                    f"data: {json.dumps(job_status_payload(current))}\n\n"
+                )
+            else:
+                # Keeps proxies from closing an idle connection.
+                yield ": keep-alive\n\n"
+            if current.state.is_final:
+                return
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            current = await job_store.wait_for_update(
+                job_id,
+                last_version,
+                min(remaining, settings.PDF_JOB_SSE_HEARTBEAT_SECONDS),
+            )
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"},
+    )
@@ -1,60 +1,169 @@
+from email.utils import format_datetime
+from functools import partial
 from typing import Annotated
 
 from fastapi import Response, Depends, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, RedirectResponse, StreamingResponse
 
 from pdf_service.config import PDFSettings
 from pdf_service.config.dependencies import (
-    get_sqs_manager,
+    get_enqueue_batcher,
+    get_job_store,
     get_s3_manager,
     get_settings,
+    get_render_pool,
+    get_pdf_cache,
+    get_render_flight,
 )
 from pdf_service.schemas import UserReadSchema
-from pdf_service.services import generate_user_pdf
+from pdf_service.services import (
+    PDFBytes,
+    PDFCache,
+    PDFRenderPool,
+    SQSEnqueueBatcher,
+    SingleFlight,
+    profile_cache_key,
+    stream_pdf_archive,
+)
+from pdf_service.storage.interfaces import JobState, JobStatusStoreInterface
 from pdf_service.storage.s3 import S3StorageClient
-from pdf_service.storage.sqs import SQSClient
 
 
-def prepare_profile_pdf_response(user: UserReadSchema) -> Response:
+async def render_profile_pdf(
+    user: UserReadSchema,
+    render_pool: PDFRenderPool,
+    pdf_cache: PDFCache,
+    render_flight: SingleFlight[PDFBytes],
+    wait_for_capacity: bool = False,
+) -> PDFBytes:
+    """
+    Cached render of one profile. Concurrent calls for the same profile
+    content share one cache lookup and at most one render. With
+    ``wait_for_capacity`` a full render pool is waited on, not an error.
+
+    Only calls in the same mode share a render: a waiting caller must not
+    inherit a busy error, nor a non-waiting one lose its 503.
+    """
+    key = profile_cache_key(user)
+    if wait_for_capacity:
+        key = f"{key}:wait"
+    render = partial(render_pool.render, wait=wait_for_capacity)
+    return await render_flight.run(
+        key, lambda: pdf_cache.get_or_render(user, render)
+    )
+
+
+async def prepare_profile_pdf_response(
+    user: UserReadSchema,
+    render_pool: Annotated[PDFRenderPool, Depends(get_render_pool)],
+    pdf_cache: Annotated[PDFCache, Depends(get_pdf_cache)],
+    render_flight: Annotated[SingleFlight[PDFBytes], Depends(get_render_flight)],
+) -> Response:
     """
     Core logic to generate a PDF file from user data and wrap it in a Response.
+    Renders are served from the PDF cache when the profile was rendered
+    before; otherwise rendering runs in the process pool, off the event loop.
+    Concurrent requests for the same profile await one shared render.
     Args:
         :param user: (UserReadSchema): The authenticated user data.
+        :param render_pool: PDF render process pool.
+        :param pdf_cache: Content-addressed PDF cache.
+        :param render_flight: Single-flight group for concurrent renders.
     Returns:
         Response: FastAPI response object with PDF binary content and headers.
+    Raises:
+        RenderPoolBusyError: If the render pool is at its in-flight limit.
     """
-    pdf_buffer = generate_user_pdf(user)
+    pdf_bytes = await render_profile_pdf(user, render_pool, pdf_cache, render_flight)
 
     filename = f"profile_{user.id}.pdf"
     headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
 
     return Response(
-        content=pdf_buffer.getvalue(),
+        content=pdf_bytes,
         media_type="application/pdf",
         headers=headers,
     )
 
 
+async def prepare_profile_pdf_batch_response(
+    users: list[UserReadSchema],
+    render_pool: Annotated[PDFRenderPool, Depends(get_render_pool)],
+    pdf_cache: Annotated[PDFCache, Depends(get_pdf_cache)],
+    render_flight: Annotated[SingleFlight[PDFBytes], Depends(get_render_flight)],
+    settings: Annotated[PDFSettings, Depends(get_settings)],
+) -> StreamingResponse:
+    """
+    Render profile PDFs for many users and stream them back as a ZIP
+    archive while renders are still running.
+    Args:
+        :param users: Users to render, in request order.
+        :param render_pool: PDF render process pool.
+        :param pdf_cache: Content-addressed PDF cache.
+        :param render_flight: Single-flight group for concurrent renders.
+        :param settings: PDF service settings (batch concurrency).
+    Returns:
+        StreamingResponse: ZIP with one PDF per rendered user and a
+        manifest.json listing per-item results and failures.
+    """
+
+    # PDF_BATCH_CONCURRENCY already bounds the batch, so its items wait for
+    # render pool capacity rather than failing on their own siblings.
+    async def render(user: UserReadSchema) -> bytes:
+        return await render_profile_pdf(
+            user, render_pool, pdf_cache, render_flight, wait_for_capacity=True
+        )
+
+    return StreamingResponse(
+        stream_pdf_archive(users, render, settings.PDF_BATCH_CONCURRENCY),
+        media_type="application/zip",
+        headers={"Content-Disposition": 'attachment; filename="profiles.zip"'},
+    )
+
+
 async def generate_profile_pdf_in_storage(
     user_data: UserReadSchema,
-    sqs_manager: Annotated[SQSClient, Depends(get_sqs_manager)],
+    enqueue_batcher: Annotated[SQSEnqueueBatcher, Depends(get_enqueue_batcher)],
+    job_store: Annotated[JobStatusStoreInterface, Depends(get_job_store)],
+    settings: Annotated[PDFSettings, Depends(get_settings)],
 ) -> Response:
     """
     Function to generate a PDF file from user data and throw it into
-    SQS queue to save pdf in storage in background.
+    SQS queue to save pdf in storage in background. The message is sent
+    in a micro-batch with other concurrent requests, and the job is
+    recorded as ``queued`` in the job status store. A job identical to
+    one queued, rendering or done within ``PDF_ENQUEUE_DEDUP_WINDOW_SECONDS``
+    is not sent again; the response then reports the existing job.
     Args:
         :param user_data: The authenticated user data.
-        :param sqs_manager: SQS manager object.
-        :param s3_manager: S3 storage manager object.
+        :param enqueue_batcher: Micro-batching SQS enqueuer.
+        :param job_store: Background job status store.
+        :param settings: PDF service settings.
     Returns:
-        Response: FastAPI response object with PDF link in storage.
+        Response: FastAPI response object with the download endpoint link.
+        In redirect mode it presigns only when the file is requested, so
+        the link outlives slow or retried jobs.
+    Raises:
+        EnqueueFailedError: If SQS rejected the message.
     """
     full_name = f"{user_data.name}_{user_data.surname}_{user_data.id}"
     file_name = f"profile_{full_name}"
 
     payload = {"job_id": file_name, "user_data": user_data.model_dump()}
-    await sqs_manager.send_message(payload)
-    file_url = f"http://127.0.0.1:8001/pdf/{file_name}.pdf"
+    # Claimed before sending, so the worker's transitions always land on
+    # top of it.
+    job_status, claimed = await job_store.claim(
+        file_name,
+        fingerprint=profile_cache_key(user_data),
+        window=settings.PDF_ENQUEUE_DEDUP_WINDOW_SECONDS,
+    )
+    if claimed:
+        try:
+            await enqueue_batcher.enqueue(payload)
+        except Exception as error:
+            await job_store.set_state(file_name, JobState.FAILED, str(error))
+            raise
+    file_url = f"{settings.PDF_PUBLIC_BASE_URL}/pdf/{file_name}.pdf"
 
     return JSONResponse(
         status_code=status.HTTP_202_ACCEPTED,
@@ -63,23 +172,74 @@ async def generate_profile_pdf_in_storage(
             f"{user_data.name} {user_data.surname}",
             "job_id": file_name,
             "link": file_url,
+            "status_url": f"{settings.PDF_PUBLIC_BASE_URL}/pdf/jobs/{file_name}",
+            "state": job_status.state.value,
+            "deduplicated": not claimed,
         },
     )
 
 
+async def redirect_to_profile_pdf(
+    file_id: str,
+    s3_manager: Annotated[S3StorageClient, Depends(get_s3_manager)],
+) -> Response:
+    """
+    Redirect the client to a short-lived presigned S3 URL for the file, so
+    the bytes never pass through this service.
+    Args:
+        :param file_id: The file name in the S3 storage.
+        :param s3_manager: S3 storage client.
+    Returns:
+        Response: 302 redirect to the presigned URL.
+    """
+    file_url = await s3_manager.get_file_url(file_id)
+    return RedirectResponse(
+        file_url,
+        status_code=status.HTTP_302_FOUND,
+        headers={"Cache-Control": "no-store"},
+    )
+
+
 async def retrieve_profile_pdf(
     file_id: str,
-    settings: Annotated[PDFSettings, Depends(get_settings)],
     s3_manager: Annotated[S3StorageClient, Depends(get_s3_manager)],
-):
-    async with s3_manager.session.client(
-        "s3",
-        endpoint_url=settings.AWS_ENDPOINT_URL,
-    ) as client:
-        response = await client.get_object(Bucket=settings.S3_BUCKET_NAME, Key=file_id)
-        content = await response["Body"].read()
-        return Response(
-            content=content,
-            media_type="application/pdf",
-            headers={"Content-Disposition": f"inline; filename={file_id}"},
-        )
+    byte_range: str | None = None,
+) -> StreamingResponse:
+    """
+    Stream a stored PDF from S3 without buffering it.
+    Args:
+        :param file_id: Name of the file in the bucket.
+        :param s3_manager: S3 storage manager object.
+        :param byte_range: Optional HTTP ``Range`` header, forwarded to S3.
+    Returns:
+        StreamingResponse: 200 with the whole file, or 206 with
+        ``Content-Range`` when a range was requested.
+    Raises:
+        S3FileNotFoundError: If the file does not exist.
+        S3RangeNotSatisfiableError: If the range lies outside the file.
+    """
+    stream = await s3_manager.open_file(file_id, byte_range)
+
+    headers = {
+        "Content-Disposition": f"inline; filename={file_id}",
+        "Accept-Ranges": "bytes",
+    }
+    if stream.content_length is not None:
+        headers["Content-Length"] = str(stream.content_length)
+    if stream.etag:
+        headers["ETag"] = stream.etag
+    if stream.last_modified:
+        headers["Last-Modified"] = format_datetime(stream.last_modified, usegmt=True)
+    if stream.content_range:
+        headers["Content-Range"] = stream.content_range
+
+    return StreamingResponse(
+        stream.chunks,
+        status_code=(
+            status.HTTP_206_PARTIAL_CONTENT
+            if stream.content_range
+            else status.HTTP_200_OK
+        ),
+        media_type="application/pdf",
+        headers=headers,
+    )
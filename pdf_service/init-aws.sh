@@ -1,3 +1,10 @@
 #!/bin/bash
-awslocal sqs create-queue --queue-name pdf-jobs
-awslocal s3 mb s3://user-pdfs
\ No newline at end of file
+awslocal sqs create-queue --queue-name pdf-jobs-dlq
+DLQ_ARN=$(awslocal sqs get-queue-attributes \
+  --queue-url "$(awslocal sqs get-queue-url --queue-name pdf-jobs-dlq --output text)" \
+  --attribute-names QueueArn --query Attributes.QueueArn --output text)
+# The worker dead-letters jobs itself after PDF_WORKER_MAX_ATTEMPTS; the
+# redrive policy only catches messages a crashed worker never settled.
+awslocal sqs create-queue --queue-name pdf-jobs \
+  --attributes "{\"RedrivePolicy\":\"{\\\"deadLetterTargetArn\\\":\\\"${DLQ_ARN}\\\",\\\"maxReceiveCount\\\":\\\"10\\\"}\"}"
+awslocal s3 mb s3://user-pdfs
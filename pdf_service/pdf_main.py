@@ -4,8 +4,9 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, status, Request
 from fastapi.responses import JSONResponse
 
+from pdf_service.config import init_resources, close_resources
 from pdf_service.config.logging_config import setup_logging
-from pdf_service.router import pdf_router
+from pdf_service.router import pdf_router, metrics_router
 from pdf_service.security.exceptions import TokenExpiredError, InvalidTokenError
 
 setup_logging()
@@ -15,12 +16,16 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):  # noqa
     logger.info("PDF Service is starting up...")
+    resources = init_resources()
+    await resources.start()
     yield
+    await close_resources()
 
 
 app = FastAPI(title="PDF Service", lifespan=lifespan)
 
 app.include_router(pdf_router)
+app.include_router(metrics_router)
 
 
 @app.exception_handler(TokenExpiredError)
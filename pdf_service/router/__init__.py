@@ -1,3 +1,4 @@
 from pdf_service.router.pdf_router import pdf_router
+from pdf_service.router.metrics_router import metrics_router
 
-__all__ = ["pdf_router"]
+__all__ = ["pdf_router", "metrics_router"]
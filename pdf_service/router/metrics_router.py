@@ -0,0 +1,46 @@
+from dataclasses import asdict
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+
+from pdf_service.config.dependencies import (
+    get_render_pool,
+    get_pdf_cache,
+    get_enqueue_batcher,
+    get_render_flight,
+)
+from pdf_service.services import (
+    PDFBytes,
+    PDFCache,
+    PDFRenderPool,
+    SingleFlight,
+    SQSEnqueueBatcher,
+)
+
+metrics_router = APIRouter(tags=["Metrics"])
+
+
+@metrics_router.get("/metrics")
+async def get_metrics(
+    render_pool: Annotated[PDFRenderPool, Depends(get_render_pool)],
+    pdf_cache: Annotated[PDFCache, Depends(get_pdf_cache)],
+    enqueue_batcher: Annotated[
+        SQSEnqueueBatcher, Depends(get_enqueue_batcher)
+    ],
+    render_flight: Annotated[
+        SingleFlight[PDFBytes], Depends(get_render_flight)
+    ],
+) -> dict:
+    """
+    Expose runtime metrics:
+    - **render_pool**: pool size, in-flight renders, queue wait and render time
+    - **pdf_cache**: memory/S3 hits, misses, hit and miss ratios, memory use
+    - **enqueue**: pending jobs, SQS batches sent and average batch size
+    - **render_single_flight**: in-flight renders, coalesced requests
+    """
+    return {
+        "render_pool": asdict(render_pool.stats()),
+        "pdf_cache": asdict(pdf_cache.stats()),
+        "enqueue": asdict(enqueue_batcher.stats()),
+        "render_single_flight": asdict(render_flight.stats()),
+    }
@@ -1,63 +1,170 @@
+import logging
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
 
 from pdf_service.config import PDFSettings
 from pdf_service.config.dependencies import (
-    get_sqs_manager,
+    get_enqueue_batcher,
+    get_job_store,
     get_s3_manager,
     get_settings,
+    get_render_pool,
+    get_pdf_cache,
+    get_render_flight,
 )
 from pdf_service.crud import (
     prepare_profile_pdf_response,
+    prepare_profile_pdf_batch_response,
     generate_profile_pdf_in_storage,
+    redirect_to_profile_pdf,
     retrieve_profile_pdf,
+    retrieve_job_status,
+    stream_job_status,
 )
 from pdf_service.schemas import UserReadSchema
 from pdf_service.security.utils import get_current_user
+from pdf_service.services import (
+    PDFBytes,
+    PDFCache,
+    PDFRenderPool,
+    JobNotFoundError,
+    RenderPoolBusyError,
+    SingleFlight,
+    SQSEnqueueBatcher,
+)
+from pdf_service.storage.exceptions import (
+    S3FileNotFoundError,
+    S3RangeNotSatisfiableError,
+)
+from pdf_service.storage.interfaces import JobStatusStoreInterface
 from pdf_service.storage.s3 import S3StorageClient
-from pdf_service.storage.sqs import SQSClient
+
+logger = logging.getLogger(__name__)
 
 pdf_router = APIRouter()
 
 
 @pdf_router.post("/pdf/generate")
 async def generate_pdf(
-    user: UserReadSchema, auth_user: Annotated[None, Depends(get_current_user)]  # noqa
+    user: UserReadSchema,
+    render_pool: Annotated[PDFRenderPool, Depends(get_render_pool)],
+    pdf_cache: Annotated[PDFCache, Depends(get_pdf_cache)],
+    render_flight: Annotated[SingleFlight[PDFBytes], Depends(get_render_flight)],
+    auth_user: Annotated[None, Depends(get_current_user)],  # noqa
 ):
     try:
-        pdf_buffer = prepare_profile_pdf_response(user)
+        pdf_buffer = await prepare_profile_pdf_response(
+            user, render_pool, pdf_cache, render_flight
+        )
         return pdf_buffer
+    except RenderPoolBusyError as error:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(error),
+            headers={"Retry-After": str(error.retry_after)},
+        )
     except Exception as error:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
+        logger.exception("PDF render failed")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(error)
+        )
+
+
+@pdf_router.post("/pdf/generate-batch")
+async def generate_pdf_batch(
+    users: list[UserReadSchema],
+    settings: Annotated[PDFSettings, Depends(get_settings)],
+    render_pool: Annotated[PDFRenderPool, Depends(get_render_pool)],
+    pdf_cache: Annotated[PDFCache, Depends(get_pdf_cache)],
+    render_flight: Annotated[SingleFlight[PDFBytes], Depends(get_render_flight)],
+    auth_user: Annotated[None, Depends(get_current_user)],  # noqa
+):
+    if not users or len(users) > settings.PDF_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Batch must contain 1 to {settings.PDF_BATCH_MAX_ITEMS} users.",
+        )
+    return await prepare_profile_pdf_batch_response(
+        users, render_pool, pdf_cache, render_flight, settings
+    )
 
 
 @pdf_router.post("/pdf/generate-in-storage")
 async def start_pdf_generation(
     user_data: UserReadSchema,
-    sqs_manager: Annotated[SQSClient, Depends(get_sqs_manager)],
+    enqueue_batcher: Annotated[SQSEnqueueBatcher, Depends(get_enqueue_batcher)],
+    job_store: Annotated[JobStatusStoreInterface, Depends(get_job_store)],
+    settings: Annotated[PDFSettings, Depends(get_settings)],
     auth_user: Annotated[None, Depends(get_current_user)],  # noqa
 ):
     try:
         return await generate_profile_pdf_in_storage(
             user_data=user_data,
-            sqs_manager=sqs_manager,
+            enqueue_batcher=enqueue_batcher,
+            job_store=job_store,
+            settings=settings,
         )
     except Exception as error:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
 
 
+@pdf_router.get("/pdf/jobs/{job_id}")
+async def get_job_status(
+    job_id: str,
+    job_store: Annotated[JobStatusStoreInterface, Depends(get_job_store)],
+    settings: Annotated[PDFSettings, Depends(get_settings)],
+    wait: Annotated[float, Query(ge=0)] = 0,
+    version: Annotated[int, Query(ge=0)] = 0,
+    accept: Annotated[str | None, Header()] = None,
+    last_event_id: Annotated[str | None, Header(alias="Last-Event-ID")] = None,
+):
+    """
+    Status of a background PDF job. Long-polls with ``?wait=<seconds>``
+    (answering as soon as the job moves past ``version``) or streams
+    Server-Sent Events when requested with ``Accept: text/event-stream``.
+    """
+    try:
+        if accept and "text/event-stream" in accept:
+            if last_event_id and last_event_id.isdigit():
+                version = max(version, int(last_event_id))
+            return await stream_job_status(
+                job_id=job_id, job_store=job_store, settings=settings, version=version
+            )
+        return await retrieve_job_status(
+            job_id=job_id,
+            job_store=job_store,
+            settings=settings,
+            wait=wait,
+            version=version,
+        )
+    except JobNotFoundError as error:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(error))
+
+
 @pdf_router.get("/pdf/{file_name}")
 async def get_profile_pdf(
     file_name: str,
-    settings: Annotated[PDFSettings, Depends(get_settings)],
     s3_manager: Annotated[S3StorageClient, Depends(get_s3_manager)],
+    settings: Annotated[PDFSettings, Depends(get_settings)],
+    range_header: Annotated[str | None, Header(alias="Range")] = None,
 ):
     try:
+        if settings.PDF_DOWNLOAD_MODE == "redirect":
+            return await redirect_to_profile_pdf(
+                file_id=file_name, s3_manager=s3_manager
+            )
         return await retrieve_profile_pdf(
             file_id=file_name,
-            settings=settings,
             s3_manager=s3_manager,
+            byte_range=range_header,
+        )
+    except S3FileNotFoundError as error:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(error))
+    except S3RangeNotSatisfiableError as error:
+        raise HTTPException(
+            status_code=status.HTTP_416_RANGE_NOT_SATISFIABLE,
+            detail=str(error),
         )
     except Exception as error:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
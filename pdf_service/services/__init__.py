@@ -1,3 +1,44 @@
-from pdf_service.services.pdf_service import generate_user_pdf
+from pdf_service.services.pdf_service import PDFBytes, generate_user_pdf
+from pdf_service.services.exceptions import (
+    RenderPoolBusyError,
+    EnqueueFailedError,
+    JobNotFoundError,
+)
+from pdf_service.services.render_pool import PDFRenderPool, RenderPoolStats
+from pdf_service.services.pdf_cache import PDFCache, PDFCacheStats, profile_cache_key
+from pdf_service.services.pdf_archive import stream_pdf_archive
+from pdf_service.services.single_flight import SingleFlight, SingleFlightStats
+from pdf_service.services.enqueue_batcher import (
+    SQSEnqueueBatcher,
+    EnqueueBatcherStats,
+)
+from pdf_service.services.job_pipeline import (
+    PDFJob,
+    PDFJobPipeline,
+    PipelineStageConfig,
+    PipelineStats,
+    RetryPolicy,
+)
 
-__all__ = ["generate_user_pdf"]
+__all__ = [
+    "PDFBytes",
+    "generate_user_pdf",
+    "RenderPoolBusyError",
+    "EnqueueFailedError",
+    "JobNotFoundError",
+    "PDFRenderPool",
+    "RenderPoolStats",
+    "PDFCache",
+    "PDFCacheStats",
+    "profile_cache_key",
+    "stream_pdf_archive",
+    "SingleFlight",
+    "SingleFlightStats",
+    "SQSEnqueueBatcher",
+    "EnqueueBatcherStats",
+    "PDFJob",
+    "PDFJobPipeline",
+    "PipelineStageConfig",
+    "PipelineStats",
+    "RetryPolicy",
+]
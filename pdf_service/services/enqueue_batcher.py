@@ -0,0 +1,142 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+
+from pdf_service.services.exceptions import EnqueueFailedError
+from pdf_service.storage.interfaces import (
+    SQS_MAX_BATCH_SIZE,
+    SQSStorageInterface,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class EnqueueBatcherStats:
+    """
+    Point-in-time snapshot of the enqueue batcher.
+    """
+
+    pending: int
+    batches_sent: int
+    messages_sent: int
+    messages_failed: int
+    avg_batch_size: float
+
+
+class SQSEnqueueBatcher:
+    """
+    Collects enqueue calls for up to ``flush_window`` seconds or
+    ``max_batch_size`` messages and sends them with one batch call.
+
+    Every caller waits only for its own entry: ``enqueue`` returns the
+    message id once SQS acknowledged that entry, or raises
+    EnqueueFailedError if that entry (or the whole batch call) failed.
+    A caller that gives up early does not un-send its message.
+    """
+
+    def __init__(
+        self,
+        sqs_manager: SQSStorageInterface,
+        max_batch_size: int = SQS_MAX_BATCH_SIZE,
+        flush_window: float = 0.005,
+    ):
+        self._sqs = sqs_manager
+        self._max_batch_size = max(1, min(max_batch_size, SQS_MAX_BATCH_SIZE))
+        self._flush_window = max(0.0, flush_window)
+        self._pending: list[tuple[dict, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushes: set[asyncio.Task] = set()
+        self._closed = False
+
+        self._batches_sent = 0
+        self._messages_sent = 0
+        self._messages_failed = 0
+
+    async def enqueue(self, body: dict) -> str | None:
+        """
+        Queue one message and wait until SQS acknowledged it.
+
+        Raises:
+            EnqueueFailedError: If the message was rejected or the batcher
+                is shut down.
+        """
+        if self._closed:
+            raise EnqueueFailedError("PDF job queue is shutting down.")
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((body, future))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._flush_window, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while self._pending:
+            batch = self._pending[: self._max_batch_size]
+            self._pending = self._pending[self._max_batch_size :]
+            task = asyncio.create_task(self._send(batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _send(self, batch: list[tuple[dict, asyncio.Future]]) -> None:
+        self._batches_sent += 1
+        try:
+            results = await self._sqs.send_messages_batch(
+                [body for body, _ in batch]
+            )
+        except Exception as error:
+            logger.error(f"Batch enqueue of {len(batch)} jobs failed: {error}")
+            self._messages_failed += len(batch)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(EnqueueFailedError(str(error)))
+            return
+
+        for (_, future), result in zip(batch, results):
+            if result.success:
+                self._messages_sent += 1
+            else:
+                self._messages_failed += 1
+            if future.done():
+                continue
+            if result.success:
+                future.set_result(result.message_id)
+            else:
+                future.set_exception(
+                    EnqueueFailedError(
+                        f"Failed to enqueue PDF job: {result.error_code} "
+                        f"{result.error_message}"
+                    )
+                )
+
+    def stats(self) -> EnqueueBatcherStats:
+        messages = self._messages_sent + self._messages_failed
+        avg_batch = (
+            messages / self._batches_sent if self._batches_sent else 0.0
+        )
+        return EnqueueBatcherStats(
+            pending=len(self._pending),
+            batches_sent=self._batches_sent,
+            messages_sent=self._messages_sent,
+            messages_failed=self._messages_failed,
+            avg_batch_size=round(avg_batch, 2),
+        )
+
+    async def aclose(self) -> None:
+        """
+        Stop accepting jobs, send everything still pending and wait for
+        every batch call in flight.
+        """
+        self._closed = True
+        self._flush()
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
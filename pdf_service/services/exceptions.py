@@ -0,0 +1,24 @@
+class RenderPoolBusyError(Exception):
+    """Raised when the PDF render pool has no free in-flight slot."""
+
+    def __init__(
+        self,
+        message: str = "PDF renderer is busy, please retry later.",
+        retry_after: int = 1,
+    ):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class EnqueueFailedError(Exception):
+    """Raised when a job could not be sent to the queue."""
+
+    def __init__(self, message: str = "Failed to enqueue PDF job."):
+        super().__init__(message)
+
+
+class JobNotFoundError(Exception):
+    """Raised when a background job is unknown or its status expired."""
+
+    def __init__(self, message: str = "PDF job not found."):
+        super().__init__(message)
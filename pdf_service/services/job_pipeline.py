@@ -0,0 +1,568 @@
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Awaitable, Callable
+
+from pdf_service.schemas import UserReadSchema
+from pdf_service.services.pdf_cache import PDFCache, profile_cache_key
+from pdf_service.services.pdf_service import PDFBytes
+from pdf_service.storage.interfaces import (
+    SQS_MAX_BATCH_SIZE,
+    JobState,
+    JobStatusStoreInterface,
+    S3StorageInterface,
+    SQSStorageInterface,
+)
+
+logger = logging.getLogger(__name__)
+
+FETCH_ERROR_BACKOFF_SECONDS = 5
+
+
+@dataclass
+class PDFJob:
+    """
+    One queue message travelling through the pipeline.
+    """
+
+    job_id: str
+    user: UserReadSchema
+    receipt_handle: str
+    message_id: str | None = None
+    body: str | None = None
+    # Delivery attempt, from the ApproximateReceiveCount attribute.
+    receive_count: int = 1
+    pdf_bytes: PDFBytes | None = None
+    # Copy of a job already in flight, acked without being processed.
+    duplicate: bool = False
+
+    @property
+    def file_name(self) -> str:
+        return f"{self.job_id}.pdf"
+
+    @cached_property
+    def content_key(self) -> str:
+        return profile_cache_key(self.user)
+
+    @classmethod
+    def from_message(cls, message: dict) -> "PDFJob":
+        body = json.loads(message["Body"])
+        return cls(
+            job_id=body["job_id"],
+            user=UserReadSchema(**body["user_data"]),
+            receipt_handle=message["ReceiptHandle"],
+            message_id=message.get("MessageId"),
+            body=message["Body"],
+            receive_count=receive_count(message),
+        )
+
+
+def receive_count(message: dict) -> int:
+    attributes = message.get("Attributes", {})
+    return int(attributes.get("ApproximateReceiveCount", 1))
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Exponential backoff for failed jobs, applied through the message
+    visibility timeout.
+    """
+
+    max_attempts: int = 5
+    base_delay: int = 5
+    max_delay: int = 900
+
+    def delay(self, attempt: int) -> int:
+        return min(self.base_delay * 2 ** max(0, attempt - 1), self.max_delay)
+
+
+@dataclass(frozen=True)
+class PipelineStageConfig:
+    """
+    Number of concurrent tasks per pipeline stage.
+    """
+
+    fetch: int = 1
+    render: int = 1
+    upload: int = 4
+    ack: int = 1
+
+
+@dataclass(frozen=True)
+class PipelineStats:
+    """
+    Point-in-time snapshot of the worker pipeline.
+    """
+
+    received: int
+    completed: int
+    failed: int
+    retried: int
+    dead_lettered: int
+    deduplicated: int
+    cache_hits: int
+    in_flight: int
+    visibility_extensions: int
+    render_queue: int
+    upload_queue: int
+    ack_queue: int
+
+
+class PDFJobPipeline:
+    """
+    Worker pipeline: fetch -> render -> upload -> ack.
+
+    Each stage runs its own pool of tasks and hands jobs to the next one
+    through a bounded queue, so SQS long-polls and S3 uploads overlap with
+    rendering and a slow stage back-pressures the ones before it.
+
+    A job failing in any stage is handled on its own: it is made visible
+    again after a backoff delay set through its visibility timeout, and
+    after ``retry_policy.max_attempts`` deliveries (or right away for a
+    message that cannot be parsed) it is moved to the ``dead_letter``
+    queue. Other jobs keep flowing meanwhile. Without a ``dead_letter``
+    queue, exhausted jobs are left to the queue's redrive policy.
+
+    Every job taken off SQS stays leased until it is settled: a heartbeat
+    extends the visibility timeout of all in-flight jobs to
+    ``visibility_timeout`` every ``heartbeat_interval`` seconds, so a job
+    waiting behind slow renders or uploads is never redelivered to another
+    worker. Failed jobs give the lease back right away (through the retry
+    backoff), and jobs still in flight at shutdown are released with a
+    zero timeout.
+
+    A job identical (same ``job_id`` and profile content) to one already
+    in flight in this worker, e.g. a duplicate within one received batch,
+    is acked without being rendered. It counts as ``deduplicated`` only,
+    so ``completed`` (and with it worker recycling) tracks real work.
+
+    When a ``job_store`` is given, every job's ``rendering``/``done``/
+    ``failed`` transitions are written to it.
+    """
+
+    def __init__(
+        self,
+        sqs_manager: SQSStorageInterface,
+        s3_manager: S3StorageInterface,
+        pdf_cache: PDFCache,
+        render: Callable[[UserReadSchema], Awaitable[PDFBytes]],
+        stages: PipelineStageConfig = PipelineStageConfig(),
+        queue_size: int = 20,
+        receive_batch_size: int = 10,
+        stats_interval: float = 30.0,
+        drain_timeout: float = 30.0,
+        job_store: JobStatusStoreInterface | None = None,
+        dead_letter: SQSStorageInterface | None = None,
+        retry_policy: RetryPolicy = RetryPolicy(),
+        visibility_timeout: int = 60,
+        heartbeat_interval: float = 10.0,
+    ):
+        self._sqs = sqs_manager
+        self._s3 = s3_manager
+        self._cache = pdf_cache
+        self._render = render
+        self._stages = stages
+        self._receive_batch_size = max(1, min(receive_batch_size, 10))
+        self._stats_interval = stats_interval
+        self._drain_timeout = drain_timeout
+        self._job_store = job_store
+        self._dead_letter = dead_letter
+        self._retry_policy = retry_policy
+        self._visibility_timeout = visibility_timeout
+        self._heartbeat_interval = heartbeat_interval
+
+        self._render_queue: asyncio.Queue[PDFJob] = asyncio.Queue(queue_size)
+        self._upload_queue: asyncio.Queue[PDFJob] = asyncio.Queue(queue_size)
+        self._ack_queue: asyncio.Queue[PDFJob] = asyncio.Queue(queue_size)
+
+        self._received = 0
+        self._completed = 0
+        self._failed = 0
+        self._retried = 0
+        self._dead_lettered = 0
+        self._deduplicated = 0
+        self._cache_hits = 0
+        self._visibility_extensions = 0
+
+        # Jobs received and not yet settled, by receipt handle.
+        self._in_flight: dict[str, PDFJob] = {}
+        # Receipt handle of the in-flight job per (job_id, content_key).
+        self._active: dict[tuple[str, str], str] = {}
+        # Orders heartbeat extensions before the changes of settling jobs,
+        # so a late heartbeat never overrides a retry backoff or release.
+        self._visibility_lock = asyncio.Lock()
+
+    async def _fetch(self) -> None:
+        while True:
+            try:
+                messages = await self._sqs.receive_messages(
+                    max_messages=self._receive_batch_size
+                )
+            except Exception as error:
+                logger.error(f"Worker error: {error}")
+                await asyncio.sleep(FETCH_ERROR_BACKOFF_SECONDS)
+                continue
+
+            for message in messages:
+                try:
+                    job = PDFJob.from_message(message)
+                except Exception as error:
+                    # Retrying cannot fix a malformed payload.
+                    self._failed += 1
+                    logger.error(f"Invalid job message: {error}")
+                    await self._move_to_dead_letter(
+                        receipt_handle=message["ReceiptHandle"],
+                        message_id=message.get("MessageId"),
+                        body=message.get("Body"),
+                        attempts=receive_count(message),
+                        reason=f"Invalid job message: {error}",
+                    )
+                    continue
+
+                self._received += 1
+                key = (job.job_id, job.content_key)
+                if key in self._active:
+                    self._deduplicated += 1
+                    job.duplicate = True
+                    logger.info(
+                        f"Job {job.job_id} is already in flight, acking it."
+                    )
+                    await self._ack_queue.put(job)
+                    continue
+
+                self._active[key] = job.receipt_handle
+                self._in_flight[job.receipt_handle] = job
+                logger.info(f"Processing job: {job.job_id}")
+                await self._render_queue.put(job)
+
+    async def _set_state(
+        self, job: PDFJob, state: JobState, error: str | None = None
+    ) -> None:
+        # Status is informational: a store outage must not fail the job.
+        if self._job_store is None:
+            return
+        try:
+            await self._job_store.set_state(job.job_id, state, error)
+        except Exception as store_error:
+            logger.warning(
+                f"Job {job.job_id} status update failed: {store_error}"
+            )
+
+    async def _move_to_dead_letter(
+        self,
+        receipt_handle: str,
+        message_id: str | None,
+        body: str | None,
+        attempts: int,
+        reason: str,
+    ) -> bool:
+        if self._dead_letter is None:
+            return False
+        try:
+            [sent] = await self._dead_letter.send_messages_batch(
+                [
+                    {
+                        "source_message_id": message_id,
+                        "attempts": attempts,
+                        "error": reason,
+                        "body": body,
+                    }
+                ]
+            )
+            if not sent.success:
+                raise RuntimeError(f"{sent.error_code} {sent.error_message}")
+            [deleted] = await self._sqs.delete_messages_batch([receipt_handle])
+            if not deleted.success:
+                raise RuntimeError(
+                    f"{deleted.error_code} {deleted.error_message}"
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            # The message reappears once its visibility timeout expires.
+            logger.error(
+                f"Dead-lettering message {message_id} failed: {error}"
+            )
+            return False
+
+        self._dead_lettered += 1
+        logger.warning(
+            f"Message {message_id} moved to dead-letter queue: {reason}"
+        )
+        return True
+
+    def _settle(self, job: PDFJob) -> None:
+        self._in_flight.pop(job.receipt_handle, None)
+        key = (job.job_id, job.content_key)
+        if self._active.get(key) == job.receipt_handle:
+            del self._active[key]
+
+    async def _retry_later(self, job: PDFJob, delay: int) -> None:
+        try:
+            async with self._visibility_lock:
+                [result] = await self._sqs.change_visibility_batch(
+                    [(job.receipt_handle, delay)]
+                )
+            if not result.success:
+                raise RuntimeError(
+                    f"{result.error_code} {result.error_message}"
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            logger.error(f"Job {job.job_id} backoff failed: {error}")
+            return
+        self._retried += 1
+
+    async def _handle_failure(self, job: PDFJob, error: Exception) -> None:
+        self._settle(job)
+        self._failed += 1
+        reason = str(error) or type(error).__name__
+        attempt = job.receive_count
+        if attempt >= self._retry_policy.max_attempts and (
+            await self._move_to_dead_letter(
+                receipt_handle=job.receipt_handle,
+                message_id=job.message_id,
+                body=job.body,
+                attempts=attempt,
+                reason=reason,
+            )
+        ):
+            logger.error(
+                f"Job {job.job_id} failed on final attempt {attempt}: {reason}"
+            )
+            await self._set_state(job, JobState.FAILED, reason)
+            return
+
+        delay = self._retry_policy.delay(attempt)
+        logger.warning(
+            f"Job {job.job_id} failed on attempt {attempt}, "
+            f"retrying in {delay}s: {reason}"
+        )
+        await self._retry_later(job, delay)
+        await self._set_state(
+            job, JobState.QUEUED, f"Attempt {attempt} failed: {reason}"
+        )
+
+    async def _render_job(self, job: PDFJob) -> None:
+        await self._set_state(job, JobState.RENDERING)
+        if await self._cache.copy_to(job.content_key, job.file_name):
+            self._cache_hits += 1
+            logger.info(f"Job {job.job_id} served from PDF cache.")
+            await self._set_state(job, JobState.DONE)
+            await self._ack_queue.put(job)
+            return
+
+        job.pdf_bytes = await self._render(job.user)
+        await self._upload_queue.put(job)
+
+    async def _upload_job(self, job: PDFJob) -> None:
+        await self._s3.upload_file(job.file_name, job.pdf_bytes)
+        await self._cache.put(job.content_key, job.pdf_bytes)
+        job.pdf_bytes = None
+        await self._set_state(job, JobState.DONE)
+        await self._ack_queue.put(job)
+
+    async def _ack(self) -> None:
+        """
+        Ack stage: delete finished jobs from SQS, up to ten per call.
+        """
+        while True:
+            jobs = [await self._ack_queue.get()]
+            while (
+                len(jobs) < SQS_MAX_BATCH_SIZE and not self._ack_queue.empty()
+            ):
+                jobs.append(self._ack_queue.get_nowait())
+            for job in jobs:
+                self._settle(job)
+            try:
+                results = await self._sqs.delete_messages_batch(
+                    [job.receipt_handle for job in jobs]
+                )
+                for job, result in zip(jobs, results):
+                    if result.success:
+                        if not job.duplicate:
+                            self._completed += 1
+                            logger.info(
+                                f"Job {job.job_id} completed successfully."
+                            )
+                    else:
+                        if not job.duplicate:
+                            self._failed += 1
+                        logger.error(
+                            f"Job {job.job_id} ack failed: {result.error_code} "
+                            f"{result.error_message}"
+                        )
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                self._failed += sum(not job.duplicate for job in jobs)
+                logger.error(f"Ack of {len(jobs)} jobs failed: {error}")
+            finally:
+                for _ in jobs:
+                    self._ack_queue.task_done()
+
+    async def _consume(
+        self,
+        queue: asyncio.Queue[PDFJob],
+        handle: Callable[[PDFJob], Awaitable[None]],
+    ) -> None:
+        while True:
+            job = await queue.get()
+            try:
+                await handle(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                job.pdf_bytes = None
+                await self._handle_failure(job, error)
+            finally:
+                queue.task_done()
+
+    async def _heartbeat(self) -> None:
+        """
+        Extend the lease of every in-flight job, up to ten per call.
+        """
+        while True:
+            await asyncio.sleep(self._heartbeat_interval)
+            if not self._in_flight:
+                continue
+            handles = list(self._in_flight)
+            try:
+                async with self._visibility_lock:
+                    results = await self._sqs.change_visibility_batch(
+                        [
+                            (handle, self._visibility_timeout)
+                            for handle in handles
+                        ]
+                    )
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                logger.error(f"Visibility heartbeat failed: {error}")
+                continue
+
+            for handle, result in zip(handles, results):
+                if result.success:
+                    self._visibility_extensions += 1
+                elif handle in self._in_flight:
+                    # Usually the lease already expired and the message was
+                    # handed to another consumer.
+                    logger.warning(
+                        f"Job {self._in_flight[handle].job_id} lease extension "
+                        f"failed: {result.error_code} {result.error_message}"
+                    )
+
+    async def _release_in_flight(self) -> None:
+        """
+        Make unsettled jobs visible again right away, for other workers.
+        """
+        if not self._in_flight:
+            return
+        handles = list(self._in_flight)
+        self._in_flight.clear()
+        try:
+            async with self._visibility_lock:
+                await self._sqs.change_visibility_batch(
+                    [(handle, 0) for handle in handles]
+                )
+            logger.info(f"Released {len(handles)} unfinished jobs back to SQS")
+        except Exception as error:
+            logger.error(
+                f"Releasing {len(handles)} unfinished jobs failed: {error}"
+            )
+
+    async def _report(self) -> None:
+        last_completed, last_time = self._completed, time.perf_counter()
+        while True:
+            await asyncio.sleep(self._stats_interval)
+            now = time.perf_counter()
+            rate = (self._completed - last_completed) / (now - last_time)
+            last_completed, last_time = self._completed, now
+
+            stats = self.stats()
+            logger.info(
+                f"Worker throughput: {rate:.2f} jobs/s "
+                f"(completed={stats.completed}, failed={stats.failed}, "
+                f"retried={stats.retried}, dead_lettered={stats.dead_lettered}, "
+                f"deduplicated={stats.deduplicated}, "
+                f"cache_hits={stats.cache_hits}, in_flight={stats.in_flight}, "
+                f"queues render/upload/ack="
+                f"{stats.render_queue}/{stats.upload_queue}/{stats.ack_queue})"
+            )
+
+    def stats(self) -> PipelineStats:
+        return PipelineStats(
+            received=self._received,
+            completed=self._completed,
+            failed=self._failed,
+            retried=self._retried,
+            dead_lettered=self._dead_lettered,
+            deduplicated=self._deduplicated,
+            cache_hits=self._cache_hits,
+            in_flight=len(self._in_flight),
+            visibility_extensions=self._visibility_extensions,
+            render_queue=self._render_queue.qsize(),
+            upload_queue=self._upload_queue.qsize(),
+            ack_queue=self._ack_queue.qsize(),
+        )
+
+    async def _drain(self) -> None:
+        for queue in (self._render_queue, self._upload_queue, self._ack_queue):
+            await queue.join()
+
+    async def run(self) -> None:
+        """
+        Run every stage until cancelled. On cancellation, fetching stops
+        first and jobs already taken off SQS get ``drain_timeout`` seconds
+        to finish; the ones that do not are released back to the queue.
+        """
+        fetchers = [
+            asyncio.create_task(self._fetch())
+            for _ in range(self._stages.fetch)
+        ]
+        consumers = [
+            asyncio.create_task(self._consume(queue, handle))
+            for queue, handle, count in (
+                (self._render_queue, self._render_job, self._stages.render),
+                (self._upload_queue, self._upload_job, self._stages.upload),
+            )
+            for _ in range(max(1, count))
+        ]
+        consumers.extend(
+            asyncio.create_task(self._ack())
+            for _ in range(max(1, self._stages.ack))
+        )
+        consumers.append(asyncio.create_task(self._report()))
+        if self._heartbeat_interval > 0:
+            consumers.append(asyncio.create_task(self._heartbeat()))
+
+        try:
+            # asyncio.wait, unlike gather, leaves the stage tasks running when
+            # run() is cancelled, so they can drain below.
+            done, _ = await asyncio.wait(
+                [*fetchers, *consumers], return_when=asyncio.FIRST_EXCEPTION
+            )
+            for task in done:
+                task.result()
+        except asyncio.CancelledError:
+            logger.info("Worker stopping: draining in-flight jobs...")
+            for task in fetchers:
+                task.cancel()
+            await asyncio.gather(*fetchers, return_exceptions=True)
+            try:
+                await asyncio.wait_for(self._drain(), self._drain_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "Worker drain timed out; unacked jobs will be released"
+                )
+            raise
+        finally:
+            for task in (*fetchers, *consumers):
+                task.cancel()
+            await asyncio.gather(*fetchers, *consumers, return_exceptions=True)
+            await self._release_in_flight()
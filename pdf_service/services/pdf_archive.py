@@ -0,0 +1,127 @@
+import asyncio
+import json
+import logging
+import zipfile
+from typing import AsyncIterator, Awaitable, Callable
+
+from pdf_service.schemas import UserReadSchema
+from pdf_service.services.pdf_service import PDFBytes
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+
+
+class _ChunkSink:
+    """
+    Write-only, unseekable file object for zipfile. Everything written
+    since the last ``drain`` is handed out as one chunk, so the archive is
+    never held in memory as a whole.
+    """
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        chunk = b"".join(self._chunks)
+        self._chunks.clear()
+        return chunk
+
+
+def _entry_name(user: UserReadSchema, index: int, used: set[str]) -> str:
+    name = f"profile_{user.id}.pdf"
+    if name in used:
+        name = f"profile_{user.id}_{index}.pdf"
+    used.add(name)
+    return name
+
+
+async def stream_pdf_archive(
+    users: list[UserReadSchema],
+    render: Callable[[UserReadSchema], Awaitable[PDFBytes]],
+    concurrency: int,
+) -> AsyncIterator[bytes]:
+    """
+    Render ``users`` with at most ``concurrency`` renders in flight and
+    yield a ZIP archive chunk by chunk, one entry per finished render in
+    completion order.
+
+    A failed render does not abort the batch: it is recorded in the
+    ``manifest.json`` entry written last, next to every produced file.
+    """
+    concurrency = max(1, min(concurrency, len(users)))
+    pending = iter(enumerate(users))
+    results: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+
+    async def produce() -> None:
+        for index, user in pending:
+            try:
+                await results.put((index, user, await render(user), None))
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                logger.warning(
+                    f"Batch render failed for user {user.id}: {error}"
+                )
+                await results.put((index, user, None, error))
+
+    producers = [asyncio.create_task(produce()) for _ in range(concurrency)]
+
+    sink = _ChunkSink()
+    manifest: list[dict | None] = [None] * len(users)
+    used_names: set[str] = set()
+    try:
+        with zipfile.ZipFile(
+            sink, "w", compression=zipfile.ZIP_STORED
+        ) as archive:
+            for _ in users:
+                index, user, pdf_bytes, error = await results.get()
+                if error is not None:
+                    manifest[index] = {
+                        "index": index,
+                        "id": user.id,
+                        "status": "failed",
+                        "error": str(error) or type(error).__name__,
+                    }
+                    continue
+
+                name = _entry_name(user, index, used_names)
+                archive.writestr(name, pdf_bytes)
+                manifest[index] = {
+                    "index": index,
+                    "id": user.id,
+                    "status": "ok",
+                    "file": name,
+                }
+                yield sink.drain()
+
+            failed = sum(item["status"] == "failed" for item in manifest)
+            archive.writestr(
+                MANIFEST_NAME,
+                json.dumps(
+                    {
+                        "total": len(users),
+                        "succeeded": len(users) - failed,
+                        "failed": failed,
+                        "items": manifest,
+                    },
+                    indent=2,
+                ),
+            )
+        yield sink.drain()
+    finally:
+        for producer in producers:
+            producer.cancel()
+        await asyncio.gather(*producers, return_exceptions=True)
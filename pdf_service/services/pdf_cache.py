@@ -0,0 +1,230 @@
+import asyncio
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from pdf_service.schemas import UserReadSchema
+from pdf_service.services.pdf_service import PDFBytes
+from pdf_service.services.pdf_template import PROFILE_TEMPLATE_VERSION
+from pdf_service.storage.interfaces import S3StorageInterface
+
+logger = logging.getLogger(__name__)
+
+
+def profile_cache_key(
+    user: UserReadSchema, template_version: str = PROFILE_TEMPLATE_VERSION
+) -> str:
+    """
+    Stable content hash of everything that shapes a profile PDF.
+    """
+    payload = json.dumps(
+        {"template": template_version, "user": user.model_dump(mode="json")},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class PDFCacheStats:
+    """
+    Point-in-time snapshot of the PDF cache.
+    """
+
+    memory_entries: int
+    memory_bytes: int
+    max_memory_bytes: int
+    memory_hits: int
+    s3_hits: int
+    misses: int
+    evictions: int
+    hit_ratio: float
+    miss_ratio: float
+
+
+class PDFCache:
+    """
+    Content-addressed cache of rendered profile PDFs.
+
+    Two tiers: an in-process LRU capped at ``max_memory_bytes`` and, when
+    ``s3_tier`` is on, the bucket itself where every render is stored as
+    ``{s3_prefix}{key}.pdf``. Keys come from profile_cache_key,
+    so identical profiles share one render across requests, worker jobs
+    and processes.
+
+    S3 lookups give up after ``s3_timeout`` seconds and count as misses,
+    and get_or_render stores fresh renders in S3 in the background, so a
+    slow or unreachable bucket never holds up a synchronous render.
+    """
+
+    def __init__(
+        self,
+        s3_manager: S3StorageInterface,
+        max_memory_bytes: int,
+        s3_tier: bool = True,
+        s3_prefix: str = "cache/",
+        s3_timeout: float = 0.5,
+    ):
+        self._s3 = s3_manager
+        self._max_memory_bytes = max(0, max_memory_bytes)
+        self._s3_tier = s3_tier
+        self._s3_prefix = s3_prefix
+        self._s3_timeout = s3_timeout
+        self._pending_stores: set[asyncio.Task] = set()
+        self._entries: OrderedDict[str, PDFBytes] = OrderedDict()
+        self._memory_bytes = 0
+
+        self._memory_hits = 0
+        self._s3_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def object_name(self, key: str) -> str:
+        return f"{self._s3_prefix}{key}.pdf"
+
+    def _get_memory(self, key: str) -> PDFBytes | None:
+        data = self._entries.get(key)
+        if data is not None:
+            self._entries.move_to_end(key)
+        return data
+
+    def _put_memory(self, key: str, data: PDFBytes) -> None:
+        if len(data) > self._max_memory_bytes:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._entries[key] = data
+        self._memory_bytes += len(data)
+
+        while self._memory_bytes > self._max_memory_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self._evictions += 1
+
+    async def get(self, key: str) -> PDFBytes | None:
+        """
+        Look the render up in memory, then in S3. S3 hits are promoted to
+        the memory tier.
+        """
+        data = self._get_memory(key)
+        if data is not None:
+            self._memory_hits += 1
+            return data
+
+        if self._s3_tier:
+            try:
+                data = await asyncio.wait_for(
+                    self._s3.download_file(self.object_name(key)),
+                    self._s3_timeout,
+                )
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"PDF cache S3 lookup timed out after {self._s3_timeout}s"
+                )
+            except Exception as error:
+                logger.warning(f"PDF cache S3 lookup failed: {error}")
+            if data is not None:
+                self._s3_hits += 1
+                self._put_memory(key, data)
+                return data
+
+        self._misses += 1
+        return None
+
+    async def put(self, key: str, data: PDFBytes) -> None:
+        """
+        Store a fresh render in both tiers. A failing S3 tier only costs a
+        future re-render, so its errors are logged, not raised.
+        """
+        self._put_memory(key, data)
+        if self._s3_tier:
+            await self._put_s3(key, data)
+
+    async def _put_s3(self, key: str, data: PDFBytes) -> None:
+        try:
+            await self._s3.upload_file(self.object_name(key), data)
+        except Exception as error:
+            logger.warning(f"PDF cache S3 store failed: {error}")
+
+    def _put_in_background(self, key: str, data: PDFBytes) -> None:
+        self._put_memory(key, data)
+        if self._s3_tier:
+            task = asyncio.ensure_future(self._put_s3(key, data))
+            self._pending_stores.add(task)
+            task.add_done_callback(self._pending_stores.discard)
+
+    async def get_or_render(
+        self,
+        user: UserReadSchema,
+        render: Callable[[UserReadSchema], Awaitable[PDFBytes]],
+    ) -> PDFBytes:
+        """
+        Return the cached render of ``user``, rendering it on a miss. The
+        render is returned without waiting for its S3 store.
+        """
+        key = profile_cache_key(user)
+        data = await self.get(key)
+        if data is None:
+            data = await render(user)
+            self._put_in_background(key, data)
+        return data
+
+    async def copy_to(self, key: str, file_name: str) -> bool:
+        """
+        Store the cached render for ``key`` in S3 under ``file_name``
+        without rendering. S3 hits are copied server-side.
+
+        Returns False on a miss.
+        """
+        data = self._get_memory(key)
+        if data is not None:
+            self._memory_hits += 1
+            await self._s3.upload_file(file_name, data)
+            return True
+
+        if self._s3_tier and await self._s3.copy_file(
+            self.object_name(key), file_name
+        ):
+            self._s3_hits += 1
+            return True
+
+        self._misses += 1
+        return False
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._memory_bytes = 0
+
+    async def aclose(self, timeout: float = 5.0) -> None:
+        """
+        Give background S3 stores ``timeout`` seconds to finish, cancel
+        the rest and empty the memory tier.
+        """
+        if self._pending_stores:
+            _, pending = await asyncio.wait(
+                self._pending_stores, timeout=timeout
+            )
+            for task in pending:
+                task.cancel()
+        self.clear()
+
+    def stats(self) -> PDFCacheStats:
+        hits = self._memory_hits + self._s3_hits
+        lookups = hits + self._misses
+        return PDFCacheStats(
+            memory_entries=len(self._entries),
+            memory_bytes=self._memory_bytes,
+            max_memory_bytes=self._max_memory_bytes,
+            memory_hits=self._memory_hits,
+            s3_hits=self._s3_hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            hit_ratio=round(hits / lookups, 4) if lookups else 0.0,
+            miss_ratio=round(self._misses / lookups, 4) if lookups else 0.0,
+        )
@@ -1,38 +1,34 @@
-from fpdf import FPDF, XPos, YPos
-from io import BytesIO
+from fpdf import FPDF
 
 from pdf_service.schemas import UserReadSchema
+from pdf_service.services.pdf_template import (
+    get_profile_template,
+    layout_profile,
+    profile_values,
+)
 
+# A finished PDF document: one immutable buffer handed as-is to the HTTP
+# response, the S3 put_object body and the PDF cache, never copied.
+PDFBytes = bytes
 
-def generate_user_pdf(user: UserReadSchema) -> bytes | bytearray | BytesIO:
-    pdf = FPDF()
-    pdf.add_page()
-
-    pdf.set_font("helvetica", "B", 16)
-    pdf.cell(
-        40,
-        10,
-        f"User Profile: {user.name} {user.surname}",
-        new_x=XPos.LMARGIN,
-        new_y=YPos.NEXT,
-    )
-
-    pdf.set_font("helvetica", size=12)
-    pdf.ln(10)
 
-    pdf.cell(0, 10, f"ID: {user.id}", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
-    pdf.cell(0, 10, f"Email: {user.email}", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
-    pdf.cell(
-        0,
-        10,
-        f"Date of Birth: {user.date_of_birth}",
-        new_x=XPos.LMARGIN,
-        new_y=YPos.NEXT,
-    )
-
-    pdf_output = BytesIO()
-    pdf_bytes = pdf.output()
-    pdf_output.write(pdf_bytes)
-    pdf_output.seek(0)
-
-    return pdf_output
+def render_user_pdf_fpdf(user: UserReadSchema) -> PDFBytes:
+    """
+    Build the profile document from scratch with FPDF.
+    """
+    pdf = FPDF()
+    layout_profile(pdf, profile_values(user))
+    return bytes(pdf.output())
+
+
+def generate_user_pdf(user: UserReadSchema) -> PDFBytes:
+    """
+    Render the profile PDF from the compiled template, falling back to a
+    full FPDF render for field values the template cannot encode or when
+    the template could not be compiled.
+    """
+    values = profile_values(user)
+    template = get_profile_template()
+    if template is not None and template.supports(values):
+        return template.render(values)
+    return render_user_pdf_fpdf(user)
@@ -0,0 +1,241 @@
+import hashlib
+import logging
+import re
+import zlib
+from datetime import datetime, timezone
+from functools import lru_cache
+
+from fpdf import FPDF, XPos, YPos
+from fpdf.util import escape_parens
+
+from pdf_service.schemas import UserReadSchema
+
+logger = logging.getLogger(__name__)
+
+PROFILE_FIELDS = ("name", "surname", "id", "email", "date_of_birth")
+# Part of the PDF cache key: bump whenever layout_profile changes the output,
+# together with PROFILE_PDF_VERSION in auth_service, which versions the
+# profile ETags.
+PROFILE_TEMPLATE_VERSION = "1"
+
+_MARKER = "@@{}@@"
+_MARKER_RE = re.compile(rb"@@(\d+)@@")
+_STREAM_RE = re.compile(rb"(\d+) 0 obj\n<<\n/Length (\d+)\n>>\nstream\n")
+_CREATION_DATE_RE = re.compile(rb"/CreationDate \((D:\d{14}Z)\)")
+_ID_RE = re.compile(rb"/ID \[<[0-9A-F]{32}><[0-9A-F]{32}>\]")
+_XREF_ENTRY = "{:010} 00000 n \n"
+# FPDF replaces this alias with the page count at output time.
+_NB_PAGES_ALIAS = "{nb}"
+
+
+def layout_profile(pdf: FPDF, values: dict[str, str]) -> None:
+    """
+    Lay out the profile page. Shared by the FPDF renderer and the template
+    compiler so both always produce the same document.
+    """
+    pdf.add_page()
+
+    pdf.set_font("helvetica", "B", 16)
+    pdf.cell(
+        40,
+        10,
+        f"User Profile: {values['name']} {values['surname']}",
+        new_x=XPos.LMARGIN,
+        new_y=YPos.NEXT,
+    )
+
+    pdf.set_font("helvetica", size=12)
+    pdf.ln(10)
+
+    pdf.cell(0, 10, f"ID: {values['id']}", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+    pdf.cell(
+        0, 10, f"Email: {values['email']}", new_x=XPos.LMARGIN, new_y=YPos.NEXT
+    )
+    pdf.cell(
+        0,
+        10,
+        f"Date of Birth: {values['date_of_birth']}",
+        new_x=XPos.LMARGIN,
+        new_y=YPos.NEXT,
+    )
+
+
+def profile_values(user: UserReadSchema) -> dict[str, str]:
+    return {field: f"{getattr(user, field)}" for field in PROFILE_FIELDS}
+
+
+def _is_template_safe(value: str) -> bool:
+    """
+    True if FPDF would write ``value`` verbatim (after paren escaping):
+    printable latin-1 only, no soft hyphens, no page-count alias.
+    """
+    if _NB_PAGES_ALIAS in value:
+        return False
+    for char in value:
+        code = ord(char)
+        if not (
+            0x20 <= code <= 0x7E or (0xA0 <= code <= 0xFF and code != 0xAD)
+        ):
+            return False
+    return True
+
+
+class CompiledProfileTemplate:
+    """
+    The profile document rendered once by FPDF with marker text in place of
+    every field, split into static byte chunks.
+
+    Rendering a user only escapes the five fields, joins the page content
+    stream, compresses it and rewrites the byte offsets that follow it
+    (``/Length``, xref table, ``startxref``) plus ``/CreationDate`` and
+    ``/ID``. Fonts, page tree and layout are never recomputed.
+    """
+
+    def __init__(self):
+        pdf = FPDF()
+        pdf.set_compression(False)
+        layout_profile(
+            pdf,
+            {
+                field: _MARKER.format(i)
+                for i, field in enumerate(PROFILE_FIELDS)
+            },
+        )
+        document = bytes(pdf.output())
+
+        stream_match = _STREAM_RE.search(
+            document, 0, document.index(_MARKER.format(0).encode())
+        )
+        stream_start = stream_match.end()
+        stream_end = stream_start + int(stream_match.group(2))
+        stream_trailer = b"\nendstream\nendobj\n"
+        if (
+            document[stream_end : stream_end + len(stream_trailer)]
+            != stream_trailer
+        ):
+            raise ValueError("Unexpected FPDF content stream layout")
+
+        self._object_id = int(stream_match.group(1))
+        self._head = document[: stream_match.start()]
+
+        # Page content stream: static chunks interleaved with field indexes.
+        content = document[stream_start:stream_end]
+        self._chunks: list[bytes] = []
+        self._slots: list[int] = []
+        position = 0
+        for marker in _MARKER_RE.finditer(content):
+            self._chunks.append(content[position : marker.start()])
+            self._slots.append(int(marker.group(1)))
+            position = marker.end()
+        self._chunks.append(content[position:])
+
+        # Objects after the content stream, up to the xref table.
+        xref_start = document.index(b"\nxref\n") + 1
+        tail = document[stream_end + len(stream_trailer) : xref_start]
+        date_match = _CREATION_DATE_RE.search(tail)
+        self._tail_before_date = tail[: date_match.start(1)]
+        self._tail_after_date = tail[date_match.end(1) :]
+
+        # xref offsets relative to the start of the document (before the
+        # content stream) or to the end of the content stream object.
+        xref_lines = document[xref_start:].split(b"\n")
+        count = int(xref_lines[1].split()[1])
+        offsets = [int(line.split()[0]) for line in xref_lines[3 : 2 + count]]
+        tail_offset = stream_end + len(stream_trailer)
+        self._xref_head = (
+            xref_lines[0] + b"\n" + xref_lines[1] + b"\n" + xref_lines[2]
+        )
+        self._offsets = [
+            (
+                (offset, False)
+                if offset < tail_offset
+                else (offset - tail_offset, True)
+            )
+            for offset in offsets
+        ]
+
+        trailer = document[document.index(b"trailer\n", xref_start) :]
+        trailer = trailer[: trailer.index(b"startxref\n")]
+        id_match = _ID_RE.search(trailer)
+        self._trailer_before_id = trailer[: id_match.start()]
+        self._trailer_after_id = trailer[id_match.end() :]
+
+    def supports(self, values: dict[str, str]) -> bool:
+        return all(_is_template_safe(value) for value in values.values())
+
+    def render(
+        self, values: dict[str, str], creation_date: datetime | None = None
+    ) -> bytes:
+        """
+        Fill the template. Callers must check ``supports`` first.
+        """
+        fields = [
+            escape_parens(values[field]).encode("latin-1")
+            for field in PROFILE_FIELDS
+        ]
+        parts = [self._chunks[0]]
+        for slot, chunk in zip(self._slots, self._chunks[1:]):
+            parts.append(fields[slot])
+            parts.append(chunk)
+        stream = zlib.compress(b"".join(parts))
+
+        stream_header = (
+            f"{self._object_id} 0 obj\n<<\n/Filter /FlateDecode\n"
+            f"/Length {len(stream)}\n>>\nstream\n".encode()
+        )
+        stream_footer = b"\nendstream\nendobj\n"
+        created_at = creation_date or datetime.now(timezone.utc)
+        # Kept as parts: the document is assembled in a single join below.
+        body = (
+            self._head,
+            stream_header,
+            stream,
+            stream_footer,
+            self._tail_before_date,
+            created_at.strftime("D:%Y%m%d%H%M%SZ").encode(),
+            self._tail_after_date,
+        )
+        body_length = sum(map(len, body))
+
+        tail_offset = sum(map(len, body[:4]))
+        xref = "".join(
+            _XREF_ENTRY.format(offset + tail_offset if in_tail else offset)
+            for offset, in_tail in self._offsets
+        ).encode()
+
+        # Same file identifier FPDF derives: MD5 of the body plus the
+        # creation timestamp.
+        file_id = hashlib.md5(usedforsecurity=False)
+        for part in body:
+            file_id.update(part)
+        file_id.update(created_at.strftime("%Y%m%d%H%M%S").encode())
+        file_id = file_id.hexdigest().upper()
+
+        return b"".join(
+            (
+                *body,
+                self._xref_head,
+                b"\n",
+                xref,
+                self._trailer_before_id,
+                f"/ID [<{file_id}><{file_id}>]".encode(),
+                self._trailer_after_id,
+                f"startxref\n{body_length}\n%%EOF\n".encode(),
+            )
+        )
+
+
+@lru_cache
+def get_profile_template() -> CompiledProfileTemplate | None:
+    """
+    Compile the profile template once per process.
+
+    Returns None if FPDF's output no longer has the layout the template
+    is cut from (e.g. after an fpdf2 upgrade); callers then render every
+    document with FPDF.
+    """
+    try:
+        return CompiledProfileTemplate()
+    except Exception:
+        logger.exception("Cannot compile the profile PDF template, using FPDF")
+        return None
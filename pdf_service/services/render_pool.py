@@ -0,0 +1,210 @@
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+
+from pdf_service.schemas import UserReadSchema
+from pdf_service.services.exceptions import RenderPoolBusyError
+from pdf_service.services.pdf_service import PDFBytes, generate_user_pdf
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RenderPoolStats:
+    """
+    Point-in-time snapshot of the render pool.
+    """
+
+    workers: int
+    max_in_flight: int
+    in_flight: int
+    queued: int
+    completed: int
+    failed: int
+    rejected: int
+    restarts: int
+    avg_queue_wait_ms: float
+    max_queue_wait_ms: float
+    avg_render_ms: float
+    max_render_ms: float
+
+
+def _timed_render(user: UserReadSchema) -> tuple[PDFBytes, float]:
+    """
+    Runs in a pool process: render and measure pure render time.
+    """
+    started_at = time.perf_counter()
+    pdf = generate_user_pdf(user)
+    return pdf, time.perf_counter() - started_at
+
+
+def _warm_up() -> None:
+    """
+    No-op run in every pool process at start-up.
+    """
+
+
+class PDFRenderPool:
+    """
+    Renders PDFs in a process pool so FPDF layout and compression never
+    run on the event loop.
+
+    At most ``max_in_flight`` renders are admitted (running or waiting for
+    one of the ``workers`` processes). Further calls are rejected with
+    RenderPoolBusyError so callers can answer 503 instead of queueing
+    without limit, unless they ask to wait for a free slot (batches).
+
+    If a pool process dies (e.g. OOM-killed), the renders it broke fail
+    and the pool is replaced with a fresh one for the next calls.
+    """
+
+    def __init__(self, workers: int, max_in_flight: int, retry_after: int = 1):
+        self._workers = max(1, workers)
+        self._max_in_flight = max(self._workers, max_in_flight)
+        self._retry_after = retry_after
+        self._executor: ProcessPoolExecutor | None = None
+        self._slots = asyncio.Semaphore(self._workers)
+        self._capacity = asyncio.Condition()
+
+        self._in_flight = 0
+        self._queued = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._restarts = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._total_render = 0.0
+        self._max_render = 0.0
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: forking a process that runs an event loop and threads
+            # is unsafe.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def _replace_broken(self, executor: ProcessPoolExecutor) -> None:
+        # Several renders fail on the same broken pool; replace it once.
+        if self._executor is not executor:
+            return
+        logger.error("PDF render pool broke (a process died), replacing it")
+        executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+        self._restarts += 1
+
+    async def start(self) -> None:
+        """
+        Spawn the pool processes up front so the first requests do not pay
+        for process start-up.
+        """
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(executor, _warm_up)
+                for _ in range(self._workers)
+            )
+        )
+        logger.info(f"PDF render pool started with {self._workers} processes")
+
+    async def render(
+        self, user: UserReadSchema, wait: bool = False
+    ) -> PDFBytes:
+        """
+        Render a profile PDF in the pool. With ``wait`` a call arriving at
+        the admission limit waits for a free slot instead of failing.
+
+        Raises:
+            RenderPoolBusyError: If ``max_in_flight`` renders are already
+                admitted and ``wait`` is False.
+        """
+        if self._in_flight < self._max_in_flight:
+            self._in_flight += 1
+        elif wait:
+            async with self._capacity:
+                await self._capacity.wait_for(
+                    lambda: self._in_flight < self._max_in_flight
+                )
+                self._in_flight += 1
+        else:
+            self._rejected += 1
+            raise RenderPoolBusyError(retry_after=self._retry_after)
+
+        try:
+            return await self._render(user)
+        finally:
+            self._in_flight -= 1
+            async with self._capacity:
+                self._capacity.notify()
+
+    async def _render(self, user: UserReadSchema) -> PDFBytes:
+        self._queued += 1
+        enqueued_at = time.perf_counter()
+        try:
+            await self._slots.acquire()
+        finally:
+            self._queued -= 1
+
+        wait = time.perf_counter() - enqueued_at
+        self._total_wait += wait
+        self._max_wait = max(self._max_wait, wait)
+
+        executor = self._get_executor()
+        try:
+            loop = asyncio.get_running_loop()
+            pdf, render_time = await loop.run_in_executor(
+                executor, _timed_render, user
+            )
+        except BrokenProcessPool:
+            self._failed += 1
+            self._replace_broken(executor)
+            raise
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            self._slots.release()
+
+        self._completed += 1
+        self._total_render += render_time
+        self._max_render = max(self._max_render, render_time)
+        return pdf
+
+    def stats(self) -> RenderPoolStats:
+        started = self._completed + self._failed
+        avg_wait = self._total_wait / started if started else 0.0
+        avg_render = (
+            self._total_render / self._completed if self._completed else 0.0
+        )
+        return RenderPoolStats(
+            workers=self._workers,
+            max_in_flight=self._max_in_flight,
+            in_flight=self._in_flight,
+            queued=self._queued,
+            completed=self._completed,
+            failed=self._failed,
+            rejected=self._rejected,
+            restarts=self._restarts,
+            avg_queue_wait_ms=round(avg_wait * 1000, 3),
+            max_queue_wait_ms=round(self._max_wait * 1000, 3),
+            avg_render_ms=round(avg_render * 1000, 3),
+            max_render_ms=round(self._max_render * 1000, 3),
+        )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            logger.info("Shutting down PDF render pool")
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,73 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SingleFlightStats:
+    """
+    Point-in-time snapshot of a single-flight group.
+    """
+
+    in_flight: int
+    calls: int
+    executions: int
+    coalesced: int
+    coalesced_ratio: float
+
+
+class SingleFlight(Generic[T]):
+    """
+    Runs at most one call per key at a time: callers arriving while a call
+    for their key is in flight await that call and share its result (or
+    its exception) instead of starting their own.
+
+    The call runs as its own task, so a caller that disconnects does not
+    cancel it for the others.
+    """
+
+    def __init__(self):
+        self._calls: dict[str, asyncio.Task[T]] = {}
+        self._total_calls = 0
+        self._executions = 0
+        self._coalesced = 0
+
+    def _forget(self, key: str, task: asyncio.Task[T]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled() and task.exception() is not None:
+            # Retrieved here so a call whose callers all left is not
+            # reported as "exception was never retrieved".
+            logger.debug(
+                f"Single-flight call {key} failed: {task.exception()}"
+            )
+
+    async def run(self, key: str, call: Callable[[], Awaitable[T]]) -> T:
+        self._total_calls += 1
+        task = self._calls.get(key)
+        if task is None:
+            self._executions += 1
+            task = asyncio.ensure_future(call())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self._coalesced += 1
+        return await asyncio.shield(task)
+
+    def stats(self) -> SingleFlightStats:
+        return SingleFlightStats(
+            in_flight=len(self._calls),
+            calls=self._total_calls,
+            executions=self._executions,
+            coalesced=self._coalesced,
+            coalesced_ratio=(
+                round(self._coalesced / self._total_calls, 4)
+                if self._total_calls
+                else 0.0
+            ),
+        )
@@ -0,0 +1,64 @@
+import logging
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator
+
+import aioboto3
+from aiobotocore.config import AioConfig
+
+logger = logging.getLogger(__name__)
+
+
+class AWSClient:
+    """
+    One aiobotocore client per service, entered once and reused.
+
+    Between ``start`` and ``aclose`` every ``client()`` call borrows the
+    same client and its connection pool. Outside of that window (scripts,
+    tests) each call opens and closes a short-lived client as before.
+    """
+
+    def __init__(
+        self,
+        session: aioboto3.Session,
+        service_name: str,
+        endpoint_url: str,
+        region_name: str | None = None,
+        config: AioConfig | None = None,
+    ):
+        self._session = session
+        self._service_name = service_name
+        self._endpoint_url = endpoint_url
+        self._region_name = region_name
+        self._config = config
+        self._stack: AsyncExitStack | None = None
+        self._client: Any = None
+
+    def _open(self):
+        return self._session.client(
+            self._service_name,
+            endpoint_url=self._endpoint_url,
+            region_name=self._region_name,
+            config=self._config,
+        )
+
+    async def start(self) -> None:
+        if self._client is not None:
+            return
+        stack = AsyncExitStack()
+        self._client = await stack.enter_async_context(self._open())
+        self._stack = stack
+        logger.info(f"{self._service_name} client started")
+
+    @asynccontextmanager
+    async def client(self) -> AsyncIterator[Any]:
+        if self._client is not None:
+            yield self._client
+            return
+        async with self._open() as client:
+            yield client
+
+    async def aclose(self) -> None:
+        if self._stack is not None:
+            stack, self._stack, self._client = self._stack, None, None
+            await stack.aclose()
+            logger.info(f"{self._service_name} client closed")
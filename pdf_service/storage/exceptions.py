@@ -40,3 +40,10 @@ class S3PermissionError(BaseS3Error):
 
     def __init__(self, message="Insufficient permissions to access S3 resource."):
         super().__init__(message)
+
+
+class S3RangeNotSatisfiableError(BaseS3Error):
+    """Raised when the requested byte range lies outside the file."""
+
+    def __init__(self, message="Requested range not satisfiable."):
+        super().__init__(message)
@@ -1,4 +1,45 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import AsyncIterator, Awaitable, Callable
+
+# Hard limit of every SQS batch API.
+SQS_MAX_BATCH_SIZE = 10
+
+
+@dataclass(frozen=True)
+class SQSBatchEntryResult:
+    """
+    Outcome of one entry of an SQS batch call.
+
+    ``index`` is the position of the entry in the caller's list.
+    """
+
+    index: int
+    success: bool
+    message_id: str | None = None
+    error_code: str | None = None
+    error_message: str | None = None
+
+
+@dataclass
+class S3FileStream:
+    """
+    An open S3 object: its metadata and the body as chunks.
+
+    ``content_range`` is set when a byte range was served. ``aclose``
+    releases the underlying connection; iterating ``chunks`` to the end
+    or closing it early does so too.
+    """
+
+    chunks: AsyncIterator[bytes]
+    content_length: int | None
+    content_range: str | None
+    etag: str | None
+    content_type: str | None
+    last_modified: datetime | None
+    aclose: Callable[[], Awaitable[None]]
 
 
 class S3StorageInterface(ABC):
@@ -14,13 +55,50 @@ class S3StorageInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def download_file(self, file_name: str) -> bytes | None:
+        """
+        Downloads a file from the storage.
+
+        :param file_name: The name of the file stored in the bucket.
+        :return: The file data, or None if the file does not exist.
+        """
+        pass
+
+    @abstractmethod
+    async def open_file(
+        self, file_name: str, byte_range: str | None = None
+    ) -> S3FileStream:
+        """
+        Opens a file for streaming, optionally only a byte range of it.
+
+        :param file_name: The name of the file stored in the bucket.
+        :param byte_range: An HTTP ``Range`` header value, e.g. ``bytes=0-99``.
+        :return: The open file stream.
+        :raises S3FileNotFoundError: If the file does not exist.
+        :raises S3RangeNotSatisfiableError: If the range lies outside the file.
+        """
+        pass
+
+    @abstractmethod
+    async def copy_file(self, source_name: str, file_name: str) -> bool:
+        """
+        Copies a file inside the storage without downloading it.
+
+        :param source_name: The name of the existing file.
+        :param file_name: The name of the copy.
+        :return: False if the source file does not exist.
+        """
+        pass
+
     @abstractmethod
     async def get_file_url(self, file_name: str) -> str:
         """
-        Generate a public URL for a file stored in the S3-compatible storage.
+        Generate a short-lived presigned GET URL for a file stored in the
+        S3-compatible storage.
 
         :param file_name: The name of the file stored in the bucket.
-        :return: The full URL to access the file.
+        :return: The full URL to download the file without credentials.
         """
         pass
 
@@ -37,13 +115,38 @@ class SQSStorageInterface(ABC):
         pass
 
     @abstractmethod
-    async def receive_messages(self, max_msg: int = 1) -> dict:
+    async def send_messages_batch(self, data: list[dict]) -> list[SQSBatchEntryResult]:
+        """
+        Sends messages to the queue in batches of up to ten.
+
+        :param data: The messages to be sent.
+        :return: One result per message, in input order.
+        """
+        pass
+
+    @abstractmethod
+    async def receive_messages(self, max_messages: int = 1) -> list[dict]:
         """
-        Receive a message from a queue.
+        Receive messages from a queue.
 
-        :param max_msg:  The maximum number of messages to be received.
+        :param max_messages:  The maximum number of messages to be received
+            (up to ten).
 
-        :return: Response from the queue.
+        :return: Messages from the queue, with the ``ApproximateReceiveCount``
+            system attribute.
+        """
+        pass
+
+    @abstractmethod
+    async def change_visibility_batch(
+        self, entries: list[tuple[str, int]]
+    ) -> list[SQSBatchEntryResult]:
+        """
+        Changes the visibility timeout of received messages in batches of up
+        to ten. A timeout of zero makes a message visible again right away.
+
+        :param entries: ``(receipt handle, timeout in seconds)`` pairs.
+        :return: One result per entry, in input order.
         """
         pass
 
@@ -55,3 +158,120 @@ class SQSStorageInterface(ABC):
         :param handler:  The handler to be deleted.
         """
         pass
+
+    @abstractmethod
+    async def delete_messages_batch(
+        self, handlers: list[str]
+    ) -> list[SQSBatchEntryResult]:
+        """
+        Deletes processed messages in batches of up to ten.
+
+        :param handlers:  The receipt handles to be deleted.
+        :return: One result per handle, in input order.
+        """
+        pass
+
+
+class JobState(str, Enum):
+    QUEUED = "queued"
+    RENDERING = "rendering"
+    DONE = "done"
+    FAILED = "failed"
+
+    @property
+    def is_final(self) -> bool:
+        return self in (JobState.DONE, JobState.FAILED)
+
+
+@dataclass(frozen=True)
+class JobStatus:
+    """
+    Latest known state of a background PDF job.
+
+    ``version`` grows by one on every transition, so a client can ask to
+    be woken up only by changes it has not seen yet. ``fingerprint``
+    identifies the job payload it was enqueued with.
+    """
+
+    job_id: str
+    state: JobState
+    version: int
+    updated_at: float
+    error: str | None = None
+    fingerprint: str | None = None
+
+    def duplicates(self, fingerprint: str, window: float, now: float) -> bool:
+        """
+        True if enqueueing ``fingerprint`` again now would redo this job:
+        same payload, not failed, last updated within ``window`` seconds.
+        """
+        return (
+            self.fingerprint == fingerprint
+            and self.state is not JobState.FAILED
+            and now - self.updated_at <= window
+        )
+
+
+class JobStatusStoreInterface(ABC):
+
+    @abstractmethod
+    async def set_state(
+        self, job_id: str, state: JobState, error: str | None = None
+    ) -> JobStatus:
+        """
+        Records a state transition of a job.
+
+        :param job_id: The job identifier.
+        :param state: The new state.
+        :param error: Failure reason, for ``JobState.FAILED``.
+        :return: The stored status.
+        """
+        pass
+
+    @abstractmethod
+    async def claim(
+        self, job_id: str, fingerprint: str, window: float
+    ) -> tuple[JobStatus, bool]:
+        """
+        Atomically records a job as queued, unless the same payload is
+        already queued, rendering or done within ``window`` seconds.
+
+        :param job_id: The job identifier.
+        :param fingerprint: Content hash of the job payload.
+        :param window: Deduplication window, in seconds.
+        :return: The current status and whether this call claimed the job
+            (False for a duplicate).
+        """
+        pass
+
+    @abstractmethod
+    async def get(self, job_id: str) -> JobStatus | None:
+        """
+        Returns the current status of a job.
+
+        :param job_id: The job identifier.
+        :return: The status, or None if the job is unknown or expired.
+        """
+        pass
+
+    @abstractmethod
+    async def wait_for_update(
+        self, job_id: str, after_version: int, timeout: float
+    ) -> JobStatus | None:
+        """
+        Waits until the job moves past ``after_version`` or the timeout
+        expires.
+
+        :param job_id: The job identifier.
+        :param after_version: The last version the caller has seen.
+        :param timeout: Maximum time to wait, in seconds.
+        :return: The current status, or None if the job is unknown.
+        """
+        pass
+
+    @abstractmethod
+    async def aclose(self) -> None:
+        """
+        Releases the backend.
+        """
+        pass
@@ -0,0 +1,335 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from pdf_service.storage.interfaces import (
+    JobState,
+    JobStatus,
+    JobStatusStoreInterface,
+)
+
+_SQLITE_PURGE_INTERVAL_SECONDS = 60.0
+
+_SQLITE_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS pdf_jobs (
+        job_id TEXT PRIMARY KEY,
+        state TEXT NOT NULL,
+        version INTEGER NOT NULL,
+        updated_at REAL NOT NULL,
+        error TEXT,
+        fingerprint TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS pdf_jobs_updated_at ON pdf_jobs (updated_at)",
+)
+
+_SQLITE_UPSERT = """
+    INSERT INTO pdf_jobs (job_id, state, version, updated_at, error, fingerprint)
+    VALUES (?, ?, 1, ?, ?, ?)
+    ON CONFLICT (job_id) DO UPDATE SET
+        state = excluded.state,
+        version = pdf_jobs.version + 1,
+        updated_at = excluded.updated_at,
+        error = excluded.error,
+        fingerprint = COALESCE(excluded.fingerprint, pdf_jobs.fingerprint)
+    RETURNING version, fingerprint
+"""
+
+_SQLITE_SELECT = """
+    SELECT state, version, updated_at, error, fingerprint FROM pdf_jobs
+    WHERE job_id = ? AND updated_at >= ?
+"""
+
+
+class _NotifyingJobStatusStore(JobStatusStoreInterface):
+    """
+    Long-poll support shared by the backends.
+
+    Waiters on a job are woken as soon as it changes in this process. With
+    a ``poll_interval`` they also re-read the backend at that pace, which
+    picks up changes written by other processes (the worker).
+    """
+
+    def __init__(self, poll_interval: float | None = None):
+        self._poll_interval = poll_interval
+        self._events: dict[str, tuple[asyncio.Event, int]] = {}
+
+    def _notify(self, job_id: str) -> None:
+        entry = self._events.pop(job_id, None)
+        if entry is not None:
+            entry[0].set()
+
+    def _subscribe(self, job_id: str) -> asyncio.Event:
+        event, waiters = self._events.get(job_id, (None, 0))
+        if event is None:
+            event = asyncio.Event()
+        self._events[job_id] = (event, waiters + 1)
+        return event
+
+    def _unsubscribe(self, job_id: str, event: asyncio.Event) -> None:
+        entry = self._events.get(job_id)
+        if entry is None or entry[0] is not event:
+            return
+        if entry[1] > 1:
+            self._events[job_id] = (event, entry[1] - 1)
+        else:
+            del self._events[job_id]
+
+    async def wait_for_update(
+        self, job_id: str, after_version: int, timeout: float
+    ) -> JobStatus | None:
+        deadline = time.monotonic() + timeout
+        while True:
+            # Subscribe before reading, so a change landing in between
+            # still wakes this waiter.
+            event = self._subscribe(job_id)
+            try:
+                status = await self.get(job_id)
+                if (
+                    status is None
+                    or status.version > after_version
+                    or status.state.is_final
+                ):
+                    return status
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return status
+                if self._poll_interval:
+                    remaining = min(remaining, self._poll_interval)
+                try:
+                    await asyncio.wait_for(event.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+            finally:
+                self._unsubscribe(job_id, event)
+
+
+class MemoryJobStatusStore(_NotifyingJobStatusStore):
+    """
+    Job statuses kept in this process. Only suitable when the API and the
+    worker share a process, e.g. in tests and single-node setups.
+    """
+
+    def __init__(self, ttl_seconds: float, max_jobs: int = 100_000):
+        super().__init__()
+        self._ttl = ttl_seconds
+        self._max_jobs = max(1, max_jobs)
+        # Ordered by last update, oldest first.
+        self._jobs: OrderedDict[str, JobStatus] = OrderedDict()
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self._ttl
+        while self._jobs:
+            job_id, status = next(iter(self._jobs.items()))
+            if (
+                status.updated_at >= cutoff
+                and len(self._jobs) <= self._max_jobs
+            ):
+                break
+            del self._jobs[job_id]
+
+    def _set_state(
+        self,
+        job_id: str,
+        state: JobState,
+        error: str | None,
+        fingerprint: str | None,
+        now: float,
+    ) -> JobStatus:
+        previous = self._jobs.pop(job_id, None)
+        status = JobStatus(
+            job_id=job_id,
+            state=state,
+            version=(previous.version if previous else 0) + 1,
+            updated_at=now,
+            error=error,
+            fingerprint=fingerprint
+            or (previous.fingerprint if previous else None),
+        )
+        self._jobs[job_id] = status
+        self._expire(now)
+        self._notify(job_id)
+        return status
+
+    async def set_state(
+        self, job_id: str, state: JobState, error: str | None = None
+    ) -> JobStatus:
+        return self._set_state(job_id, state, error, None, time.time())
+
+    async def claim(
+        self, job_id: str, fingerprint: str, window: float
+    ) -> tuple[JobStatus, bool]:
+        now = time.time()
+        current = await self.get(job_id)
+        if current is not None and current.duplicates(
+            fingerprint, window, now
+        ):
+            return current, False
+        return (
+            self._set_state(job_id, JobState.QUEUED, None, fingerprint, now),
+            True,
+        )
+
+    async def get(self, job_id: str) -> JobStatus | None:
+        status = self._jobs.get(job_id)
+        if status is None or status.updated_at < time.time() - self._ttl:
+            return None
+        return status
+
+    async def aclose(self) -> None:
+        self._jobs.clear()
+
+
+class SQLiteJobStatusStore(_NotifyingJobStatusStore):
+    """
+    Job statuses in a SQLite file shared by every process on the node (API
+    and worker containers mount the same volume). Queries run in a thread
+    so the event loop never blocks on the database.
+    """
+
+    def __init__(
+        self, path: str, ttl_seconds: float, poll_interval: float = 0.5
+    ):
+        super().__init__(poll_interval=poll_interval)
+        self._path = path
+        self._ttl = ttl_seconds
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._purged_at = 0.0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(
+                self._path, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA busy_timeout=5000")
+            for statement in _SQLITE_SCHEMA:
+                connection.execute(statement)
+            columns = {
+                row[1]
+                for row in connection.execute("PRAGMA table_info(pdf_jobs)")
+            }
+            if "fingerprint" not in columns:
+                connection.execute(
+                    "ALTER TABLE pdf_jobs ADD COLUMN fingerprint TEXT"
+                )
+            self._connection = connection
+        return self._connection
+
+    def _upsert(
+        self,
+        connection: sqlite3.Connection,
+        job_id: str,
+        state: JobState,
+        error: str | None,
+        fingerprint: str | None,
+        now: float,
+    ) -> JobStatus:
+        version, fingerprint = connection.execute(
+            _SQLITE_UPSERT, (job_id, state.value, now, error, fingerprint)
+        ).fetchone()
+        if now - self._purged_at > _SQLITE_PURGE_INTERVAL_SECONDS:
+            connection.execute(
+                "DELETE FROM pdf_jobs WHERE updated_at < ?", (now - self._ttl,)
+            )
+            self._purged_at = now
+        return JobStatus(
+            job_id=job_id,
+            state=state,
+            version=version,
+            updated_at=now,
+            error=error,
+            fingerprint=fingerprint,
+        )
+
+    def _select(
+        self, connection: sqlite3.Connection, job_id: str
+    ) -> JobStatus | None:
+        row = connection.execute(
+            _SQLITE_SELECT, (job_id, time.time() - self._ttl)
+        ).fetchone()
+        if row is None:
+            return None
+        state, version, updated_at, error, fingerprint = row
+        return JobStatus(
+            job_id=job_id,
+            state=JobState(state),
+            version=version,
+            updated_at=updated_at,
+            error=error,
+            fingerprint=fingerprint,
+        )
+
+    def _set_state(
+        self, job_id: str, state: JobState, error: str | None
+    ) -> JobStatus:
+        with self._lock:
+            return self._upsert(
+                self._connect(), job_id, state, error, None, time.time()
+            )
+
+    def _claim(
+        self, job_id: str, fingerprint: str, window: float
+    ) -> tuple[JobStatus, bool]:
+        with self._lock:
+            connection = self._connect()
+            # IMMEDIATE takes the write lock up front, so two processes
+            # cannot both see the job as absent and both claim it.
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                current = self._select(connection, job_id)
+                if current is not None and current.duplicates(
+                    fingerprint, window, now
+                ):
+                    result = current, False
+                else:
+                    status = self._upsert(
+                        connection,
+                        job_id,
+                        JobState.QUEUED,
+                        None,
+                        fingerprint,
+                        now,
+                    )
+                    result = status, True
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        return result
+
+    def _get(self, job_id: str) -> JobStatus | None:
+        with self._lock:
+            return self._select(self._connect(), job_id)
+
+    async def set_state(
+        self, job_id: str, state: JobState, error: str | None = None
+    ) -> JobStatus:
+        status = await asyncio.to_thread(self._set_state, job_id, state, error)
+        self._notify(job_id)
+        return status
+
+    async def claim(
+        self, job_id: str, fingerprint: str, window: float
+    ) -> tuple[JobStatus, bool]:
+        status, claimed = await asyncio.to_thread(
+            self._claim, job_id, fingerprint, window
+        )
+        if claimed:
+            self._notify(job_id)
+        return status, claimed
+
+    async def get(self, job_id: str) -> JobStatus | None:
+        return await asyncio.to_thread(self._get, job_id)
+
+    async def aclose(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
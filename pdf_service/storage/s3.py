@@ -1,14 +1,39 @@
 import logging
-from typing import Union
+import time
+from collections import OrderedDict
+from contextlib import AsyncExitStack
+from typing import AsyncIterator, Awaitable, Callable, Union
 
 import aioboto3
+from aiobotocore.config import AioConfig
+from botocore.exceptions import ClientError
 
 from pdf_service.config.logging_config import setup_logging
-from pdf_service.storage.interfaces import S3StorageInterface
+from pdf_service.storage.aws_client import AWSClient
+from pdf_service.storage.exceptions import (
+    S3FileNotFoundError,
+    S3RangeNotSatisfiableError,
+)
+from pdf_service.storage.interfaces import S3FileStream, S3StorageInterface
 
 setup_logging()
 logger = logging.getLogger(__name__)
 
+_NOT_FOUND_CODES = {"NoSuchKey", "404", "NotFound"}
+_INVALID_RANGE_CODES = {"InvalidRange", "416"}
+
+
+async def _iter_body(
+    body, chunk_size: int, aclose: Callable[[], Awaitable[None]]
+) -> AsyncIterator[bytes]:
+    try:
+        async for chunk in body.iter_chunks(chunk_size):
+            yield chunk
+    finally:
+        # Also reached when the client disconnects mid-download, where a
+        # response background task would never run.
+        await aclose()
+
 
 class S3StorageClient(S3StorageInterface):
 
@@ -19,28 +44,71 @@ class S3StorageClient(S3StorageInterface):
         secret_key: str,
         bucket_name: str,
         region_name: str,
+        session: aioboto3.Session | None = None,
+        config: AioConfig | None = None,
+        chunk_size: int = 64 * 1024,
+        public_endpoint_url: str | None = None,
+        presigned_url_ttl: int = 300,
+        presigned_url_cache_size: int = 10_000,
     ):
         self._endpoint_url = endpoint_url
         self._access_key = access_key
         self._secret_key = secret_key
         self._bucket_name = bucket_name
         self._region_name = region_name
-        self._session = aioboto3.Session(
+        self._chunk_size = chunk_size
+        self._presigned_url_ttl = presigned_url_ttl
+        self._presigned_url_cache_size = max(0, presigned_url_cache_size)
+        self._presigned_urls: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._session = session or aioboto3.Session(
             aws_access_key_id=self._access_key,
             aws_secret_access_key=self._secret_key,
         )
+        self._aws = AWSClient(
+            session=self._session,
+            service_name="s3",
+            endpoint_url=self._endpoint_url,
+            region_name=self._region_name,
+            config=config,
+        )
+        # Presigned URLs embed the endpoint host, so they are signed for the
+        # endpoint clients can reach, which may differ from the internal one.
+        self._presigner = AWSClient(
+            session=self._session,
+            service_name="s3",
+            endpoint_url=public_endpoint_url or self._endpoint_url,
+            region_name=self._region_name,
+            config=(config or AioConfig()).merge(AioConfig(signature_version="s3v4")),
+        )
 
     @property
     def session(self):
         return self._session
 
+    @property
+    def bucket_name(self) -> str:
+        return self._bucket_name
+
+    def client(self):
+        """
+        Async context manager yielding the shared S3 client.
+        """
+        return self._aws.client()
+
+    async def start(self) -> None:
+        await self._aws.start()
+        await self._presigner.start()
+
+    async def aclose(self) -> None:
+        await self._presigner.aclose()
+        await self._aws.aclose()
+        self._presigned_urls.clear()
+
     async def upload_file(
         self, file_name: str, file_data: Union[bytes, bytearray]
     ) -> None:
         try:
-            async with self._session.client(
-                "s3", endpoint_url=self._endpoint_url
-            ) as client:
+            async with self._aws.client() as client:
                 await client.put_object(
                     Bucket=self._bucket_name,
                     Key=file_name,
@@ -54,5 +122,95 @@ class S3StorageClient(S3StorageInterface):
             logger.error(f"S3 Upload Error: {e}")
             raise
 
+    async def download_file(self, file_name: str) -> bytes | None:
+        try:
+            async with self._aws.client() as client:
+                response = await client.get_object(
+                    Bucket=self._bucket_name, Key=file_name
+                )
+                async with response["Body"] as body:
+                    return await body.read()
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in _NOT_FOUND_CODES:
+                return None
+            logger.error(f"S3 Download Error: {e}")
+            raise
+
+    async def open_file(
+        self, file_name: str, byte_range: str | None = None
+    ) -> S3FileStream:
+        params = {"Bucket": self._bucket_name, "Key": file_name}
+        if byte_range:
+            params["Range"] = byte_range
+
+        # The client context stays open until the stream is closed, so
+        # streaming also works with a short-lived client.
+        stack = AsyncExitStack()
+        try:
+            client = await stack.enter_async_context(self._aws.client())
+            response = await client.get_object(**params)
+        except ClientError as e:
+            await stack.aclose()
+            code = e.response.get("Error", {}).get("Code")
+            if code in _NOT_FOUND_CODES:
+                raise S3FileNotFoundError()
+            if code in _INVALID_RANGE_CODES:
+                raise S3RangeNotSatisfiableError()
+            logger.error(f"S3 Download Error: {e}")
+            raise
+        except BaseException:
+            await stack.aclose()
+            raise
+
+        body = response["Body"]
+        stack.callback(body.close)
+        return S3FileStream(
+            chunks=_iter_body(body, self._chunk_size, stack.aclose),
+            content_length=response.get("ContentLength"),
+            content_range=response.get("ContentRange"),
+            etag=response.get("ETag"),
+            content_type=response.get("ContentType"),
+            last_modified=response.get("LastModified"),
+            aclose=stack.aclose,
+        )
+
+    async def copy_file(self, source_name: str, file_name: str) -> bool:
+        try:
+            async with self._aws.client() as client:
+                await client.copy_object(
+                    Bucket=self._bucket_name,
+                    Key=file_name,
+                    CopySource={"Bucket": self._bucket_name, "Key": source_name},
+                    ContentType="application/pdf",
+                    MetadataDirective="REPLACE",
+                )
+                logger.info(f"File {source_name} copied to {file_name}")
+                return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in _NOT_FOUND_CODES:
+                return False
+            logger.error(f"S3 Copy Error: {e}")
+            raise
+
     async def get_file_url(self, file_name: str) -> str:
-        return f"{self._endpoint_url}/{self._bucket_name}/{file_name}"
+        # A cached URL is reused for the first half of its lifetime, so every
+        # URL handed out stays valid for at least ttl / 2.
+        now = time.monotonic()
+        cached = self._presigned_urls.get(file_name)
+        if cached is not None and cached[0] > now:
+            self._presigned_urls.move_to_end(file_name)
+            return cached[1]
+
+        async with self._presigner.client() as client:
+            url = await client.generate_presigned_url(
+                "get_object",
+                Params={"Bucket": self._bucket_name, "Key": file_name},
+                ExpiresIn=self._presigned_url_ttl,
+            )
+
+        if self._presigned_url_cache_size:
+            self._presigned_urls[file_name] = (now + self._presigned_url_ttl / 2, url)
+            self._presigned_urls.move_to_end(file_name)
+            while len(self._presigned_urls) > self._presigned_url_cache_size:
+                self._presigned_urls.popitem(last=False)
+        return url
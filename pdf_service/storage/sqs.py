@@ -1,14 +1,55 @@
+import asyncio
 import json
 import aioboto3
 import logging
 
+from aiobotocore.config import AioConfig
+
 from pdf_service.config.logging_config import setup_logging
-from pdf_service.storage.interfaces import SQSStorageInterface
+from pdf_service.storage.aws_client import AWSClient
+from pdf_service.storage.interfaces import (
+    SQS_MAX_BATCH_SIZE,
+    SQSBatchEntryResult,
+    SQSStorageInterface,
+)
 
 setup_logging()
 logger = logging.getLogger(__name__)
 
 
+def _batch_results(offset: int, size: int, response: dict) -> list[SQSBatchEntryResult]:
+    """
+    Map a *Batch response back onto the entries of one chunk, in order.
+    Entry ids are the positions inside the chunk.
+    """
+    results: list[SQSBatchEntryResult | None] = [None] * size
+    for entry in response.get("Successful", []):
+        position = int(entry["Id"])
+        results[position] = SQSBatchEntryResult(
+            index=offset + position,
+            success=True,
+            message_id=entry.get("MessageId"),
+        )
+    for entry in response.get("Failed", []):
+        position = int(entry["Id"])
+        results[position] = SQSBatchEntryResult(
+            index=offset + position,
+            success=False,
+            error_code=entry.get("Code"),
+            error_message=entry.get("Message"),
+        )
+    return [
+        result
+        or SQSBatchEntryResult(
+            index=offset + position,
+            success=False,
+            error_code="MissingResult",
+            error_message="Entry missing from the batch response.",
+        )
+        for position, result in enumerate(results)
+    ]
+
+
 class SQSClient(SQSStorageInterface):
     def __init__(
         self,
@@ -17,47 +58,135 @@ class SQSClient(SQSStorageInterface):
         secret_key: str,
         queue_name: str,
         region_name: str,
+        session: aioboto3.Session | None = None,
+        config: AioConfig | None = None,
     ):
         self._endpoint_url = endpoint_url
         self._queue_name = queue_name
         self._region_name = region_name
-        self._session = aioboto3.Session(
+        self._session = session or aioboto3.Session(
             aws_access_key_id=access_key,
             aws_secret_access_key=secret_key,
         )
+        self._aws = AWSClient(
+            session=self._session,
+            service_name="sqs",
+            endpoint_url=self._endpoint_url,
+            region_name=self._region_name,
+            config=config,
+        )
+        self._queue_url: str | None = None
+        self._queue_url_lock = asyncio.Lock()
 
-    async def send_message(self, body: dict) -> None:
-        async with self._session.client(
-            "sqs", endpoint_url=self._endpoint_url, region_name=self._region_name
-        ) as client:
-            result = await client.get_queue_url(QueueName=self._queue_name)
+    def _client(self):
+        return self._aws.client()
+
+    async def start(self) -> None:
+        await self._aws.start()
 
-            queue_url = result["QueueUrl"]
+    async def aclose(self) -> None:
+        await self._aws.aclose()
+
+    async def _get_queue_url(self, client) -> str:
+        """
+        Resolve the queue URL once; it never changes for a queue name.
+        """
+        if self._queue_url is None:
+            async with self._queue_url_lock:
+                if self._queue_url is None:
+                    result = await client.get_queue_url(QueueName=self._queue_name)
+                    self._queue_url = result["QueueUrl"]
+        return self._queue_url
+
+    async def send_message(self, body: dict) -> None:
+        async with self._client() as client:
+            queue_url = await self._get_queue_url(client)
 
             await client.send_message(QueueUrl=queue_url, MessageBody=json.dumps(body))
             logger.info(f"Message sent to SQS: {body.get('job_id')}")
 
-    async def receive_messages(self, max_messages: int = 1) -> list[str]:
-        async with self._session.client(
-            "sqs", endpoint_url=self._endpoint_url, region_name=self._region_name
-        ) as client:
-            result = await client.get_queue_url(QueueName=self._queue_name)
+    async def send_messages_batch(
+        self, bodies: list[dict]
+    ) -> list[SQSBatchEntryResult]:
+        results: list[SQSBatchEntryResult] = []
+        async with self._client() as client:
+            queue_url = await self._get_queue_url(client)
+
+            for offset in range(0, len(bodies), SQS_MAX_BATCH_SIZE):
+                chunk = bodies[offset : offset + SQS_MAX_BATCH_SIZE]
+                response = await client.send_message_batch(
+                    QueueUrl=queue_url,
+                    Entries=[
+                        {"Id": str(position), "MessageBody": json.dumps(body)}
+                        for position, body in enumerate(chunk)
+                    ],
+                )
+                results.extend(_batch_results(offset, len(chunk), response))
+
+        failed = sum(not result.success for result in results)
+        logger.info(f"Batch of {len(bodies)} messages sent to SQS ({failed} failed)")
+        return results
 
-            queue_url = result["QueueUrl"]
+    async def receive_messages(self, max_messages: int = 1) -> list[dict]:
+        async with self._client() as client:
+            queue_url = await self._get_queue_url(client)
 
             response = await client.receive_message(
-                QueueUrl=queue_url, MaxNumberOfMessages=max_messages, WaitTimeSeconds=10
+                QueueUrl=queue_url,
+                MaxNumberOfMessages=max(1, min(max_messages, SQS_MAX_BATCH_SIZE)),
+                WaitTimeSeconds=10,
+                MessageSystemAttributeNames=["ApproximateReceiveCount"],
             )
 
             return response.get("Messages", [])
 
-    async def delete_message(self, receipt_handle: str):
-        async with self._session.client(
-            "sqs", endpoint_url=self._endpoint_url, region_name=self._region_name
-        ) as client:
-            result = await client.get_queue_url(QueueName=self._queue_name)
+    async def change_visibility_batch(
+        self, entries: list[tuple[str, int]]
+    ) -> list[SQSBatchEntryResult]:
+        results: list[SQSBatchEntryResult] = []
+        async with self._client() as client:
+            queue_url = await self._get_queue_url(client)
+
+            for offset in range(0, len(entries), SQS_MAX_BATCH_SIZE):
+                chunk = entries[offset : offset + SQS_MAX_BATCH_SIZE]
+                response = await client.change_message_visibility_batch(
+                    QueueUrl=queue_url,
+                    Entries=[
+                        {
+                            "Id": str(position),
+                            "ReceiptHandle": handle,
+                            "VisibilityTimeout": timeout,
+                        }
+                        for position, (handle, timeout) in enumerate(chunk)
+                    ],
+                )
+                results.extend(_batch_results(offset, len(chunk), response))
 
-            queue_url = result["QueueUrl"]
+        return results
+
+    async def delete_message(self, receipt_handle: str):
+        async with self._client() as client:
+            queue_url = await self._get_queue_url(client)
             await client.delete_message(
                 QueueUrl=queue_url, ReceiptHandle=receipt_handle
             )
+
+    async def delete_messages_batch(
+        self, receipt_handles: list[str]
+    ) -> list[SQSBatchEntryResult]:
+        results: list[SQSBatchEntryResult] = []
+        async with self._client() as client:
+            queue_url = await self._get_queue_url(client)
+
+            for offset in range(0, len(receipt_handles), SQS_MAX_BATCH_SIZE):
+                chunk = receipt_handles[offset : offset + SQS_MAX_BATCH_SIZE]
+                response = await client.delete_message_batch(
+                    QueueUrl=queue_url,
+                    Entries=[
+                        {"Id": str(position), "ReceiptHandle": handle}
+                        for position, handle in enumerate(chunk)
+                    ],
+                )
+                results.extend(_batch_results(offset, len(chunk), response))
+
+        return results
@@ -0,0 +1,224 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+import time
+from dataclasses import dataclass
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+
+from pdf_service.config import PDFSettings, get_settings
+from pdf_service.config.logging_config import setup_logging
+from pdf_service.worker import run_worker
+
+setup_logging()
+logger = logging.getLogger(__name__)
+
+MAX_RESTART_DELAY_SECONDS = 30.0
+# A child that crashes after running this long starts the backoff over.
+HEALTHY_UPTIME_SECONDS = 60.0
+# Extra time on top of the drain timeout before stragglers are killed.
+SHUTDOWN_GRACE_SECONDS = 10.0
+
+
+def process_tree_rss(pid: int) -> int | None:
+    """
+    Resident memory of a process and all its descendants (the render
+    pool), in bytes. None where /proc is not available.
+    """
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    total = 0
+    pending = [pid]
+    try:
+        while pending:
+            current = pending.pop()
+            statm = Path(f"/proc/{current}/statm").read_text().split()
+            total += int(statm[1]) * page_size
+            for task in Path(f"/proc/{current}/task").iterdir():
+                children = (task / "children").read_text().split()
+                pending.extend(int(child) for child in children)
+    except (FileNotFoundError, ProcessLookupError):
+        # The process exited while being measured.
+        return total or None
+    except OSError:
+        return None
+    return total
+
+
+def child_settings(settings: PDFSettings, processes: int) -> PDFSettings:
+    """
+    Split the CPUs between worker processes: unless configured explicitly,
+    each one gets an equal share of render processes and render tasks.
+    """
+    share = max(1, (os.cpu_count() or 1) // processes)
+    update = {
+        name: share
+        for name in ("PDF_RENDER_WORKERS", "PDF_WORKER_RENDER_CONCURRENCY")
+        if name not in settings.model_fields_set
+    }
+    return settings.model_copy(update=update)
+
+
+def _worker_main(settings: PDFSettings, max_jobs: int) -> None:
+    # Ctrl+C reaches the whole process group; shutdown is driven by the
+    # supervisor's SIGTERM instead.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    asyncio.run(run_worker(settings=settings, max_jobs=max_jobs))
+
+
+@dataclass
+class _WorkerSlot:
+    index: int
+    process: BaseProcess | None = None
+    crashes: int = 0
+    started_at: float = 0.0
+    restart_at: float = 0.0
+    recycling: bool = False
+
+
+class WorkerSupervisor:
+    """
+    Runs ``processes`` PDF worker processes and keeps them running.
+
+    A child that exits is started again: right away after a clean exit
+    (recycled after ``max_jobs``), with exponential backoff after a crash.
+    The backoff starts over once a child has run for a while before
+    crashing.
+    A child whose process tree grows past ``max_rss_bytes`` gets SIGTERM
+    and drains like on shutdown before it is replaced. SIGTERM and SIGINT
+    to the supervisor are forwarded to every child as SIGTERM, and
+    children still running after ``shutdown_timeout`` are killed.
+    """
+
+    def __init__(
+        self,
+        settings: PDFSettings,
+        processes: int,
+        max_jobs: int = 0,
+        max_rss_bytes: int = 0,
+        check_interval: float = 2.0,
+        shutdown_timeout: float = 40.0,
+    ):
+        self._processes = max(1, processes)
+        self._settings = child_settings(settings, self._processes)
+        self._max_jobs = max_jobs
+        self._max_rss_bytes = max_rss_bytes
+        self._check_interval = check_interval
+        self._shutdown_timeout = shutdown_timeout
+        self._context = multiprocessing.get_context("fork")
+        self._slots = [_WorkerSlot(index) for index in range(self._processes)]
+        self._stopping = False
+
+    def _start(self, slot: _WorkerSlot) -> None:
+        slot.process = self._context.Process(
+            target=_worker_main,
+            args=(self._settings, self._max_jobs),
+            name=f"pdf-worker-{slot.index}",
+        )
+        slot.process.start()
+        slot.started_at = time.monotonic()
+        slot.recycling = False
+        logger.info(f"Started {slot.process.name} (pid {slot.process.pid})")
+
+    def _reap(self, slot: _WorkerSlot, now: float) -> None:
+        process = slot.process
+        process.join()
+        slot.process = None
+        if process.exitcode == 0 or slot.recycling:
+            slot.crashes = 0
+            slot.restart_at = now
+            logger.info(f"{process.name} exited, replacing it")
+            return
+
+        if now - slot.started_at >= HEALTHY_UPTIME_SECONDS:
+            slot.crashes = 0
+        slot.crashes += 1
+        delay = min(2 ** (slot.crashes - 1), MAX_RESTART_DELAY_SECONDS)
+        slot.restart_at = now + delay
+        logger.error(
+            f"{process.name} crashed with exit code {process.exitcode}, "
+            f"restarting in {delay:.0f}s"
+        )
+
+    def _check_memory(self, slot: _WorkerSlot) -> None:
+        if not self._max_rss_bytes or slot.recycling:
+            return
+        rss = process_tree_rss(slot.process.pid)
+        if rss is not None and rss > self._max_rss_bytes:
+            logger.warning(
+                f"{slot.process.name} uses {rss // 2**20} MiB, "
+                f"above {self._max_rss_bytes // 2**20} MiB: recycling it"
+            )
+            slot.recycling = True
+            slot.process.terminate()
+
+    def _request_stop(self, signum: int, frame) -> None:
+        logger.info(f"Supervisor got signal {signum}, stopping workers...")
+        self._stopping = True
+
+    def _shutdown(self) -> None:
+        running = [
+            slot.process for slot in self._slots if slot.process is not None
+        ]
+        for process in running:
+            if process.is_alive():
+                process.terminate()
+
+        deadline = time.monotonic() + self._shutdown_timeout
+        for process in running:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                logger.warning(
+                    f"{process.name} did not drain in time, killing it"
+                )
+                process.kill()
+                process.join()
+
+    def run(self) -> None:
+        previous_handlers = {
+            signum: signal.signal(signum, self._request_stop)
+            for signum in (signal.SIGTERM, signal.SIGINT)
+        }
+        logger.info(
+            f"Supervisor starting {self._processes} PDF worker processes"
+        )
+
+        try:
+            while not self._stopping:
+                now = time.monotonic()
+                for slot in self._slots:
+                    if (
+                        slot.process is not None
+                        and not slot.process.is_alive()
+                    ):
+                        self._reap(slot, now)
+                    if slot.process is None:
+                        if now >= slot.restart_at:
+                            self._start(slot)
+                    else:
+                        self._check_memory(slot)
+                time.sleep(self._check_interval)
+        finally:
+            self._shutdown()
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+        logger.info("Supervisor stopped.")
+
+
+def main() -> None:
+    settings = get_settings()
+    WorkerSupervisor(
+        settings=settings,
+        processes=settings.PDF_SUPERVISOR_PROCESSES,
+        max_jobs=settings.PDF_SUPERVISOR_MAX_JOBS,
+        max_rss_bytes=settings.PDF_SUPERVISOR_MAX_RSS_BYTES,
+        check_interval=settings.PDF_SUPERVISOR_CHECK_INTERVAL_SECONDS,
+        shutdown_timeout=settings.PDF_WORKER_DRAIN_TIMEOUT_SECONDS
+        + SHUTDOWN_GRACE_SECONDS,
+    ).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,54 +1,86 @@
 import asyncio
-import json
 import logging
+import signal
+from functools import partial
 
 from pdf_service.config.logging_config import setup_logging
-from pdf_service.schemas import UserReadSchema
-from pdf_service.services import generate_user_pdf
-from pdf_service.config import get_settings
-from pdf_service.config.dependencies import get_s3_manager, get_sqs_manager
+from pdf_service.services import PDFJobPipeline, PipelineStageConfig, RetryPolicy
+from pdf_service.config import PDFSettings, init_resources, close_resources
 
 setup_logging()
 logger = logging.getLogger(__name__)
 
+RECYCLE_CHECK_INTERVAL_SECONDS = 1.0
 
-async def run_worker():
-    settings = get_settings()
-    s3 = await get_s3_manager(settings)
-    sqs = await get_sqs_manager(settings)
+
+async def _stop_after_jobs(
+    pipeline: PDFJobPipeline, max_jobs: int, worker_task: asyncio.Task
+) -> None:
+    """
+    Cancel the worker (which then drains) once it settled ``max_jobs``.
+    """
+    while True:
+        await asyncio.sleep(RECYCLE_CHECK_INTERVAL_SECONDS)
+        stats = pipeline.stats()
+        if stats.completed + stats.failed >= max_jobs:
+            logger.info(f"PDF Worker recycling after {max_jobs} jobs.")
+            worker_task.cancel()
+            return
+
+
+async def run_worker(settings: PDFSettings | None = None, max_jobs: int = 0):
+    """
+    Run the PDF worker until SIGTERM, or until ``max_jobs`` jobs were
+    settled when it is positive (used by the supervisor to recycle it).
+    """
+    resources = init_resources(settings)
+    settings = resources.settings
+    await resources.start()
+
+    pipeline = PDFJobPipeline(
+        sqs_manager=resources.sqs_manager,
+        s3_manager=resources.s3_manager,
+        pdf_cache=resources.pdf_cache,
+        render=partial(resources.render_pool.render, wait=True),
+        stages=PipelineStageConfig(
+            fetch=settings.PDF_WORKER_FETCH_CONCURRENCY,
+            render=settings.PDF_WORKER_RENDER_CONCURRENCY,
+            upload=settings.PDF_WORKER_UPLOAD_CONCURRENCY,
+            ack=settings.PDF_WORKER_ACK_CONCURRENCY,
+        ),
+        queue_size=settings.PDF_WORKER_QUEUE_SIZE,
+        receive_batch_size=settings.PDF_WORKER_RECEIVE_BATCH_SIZE,
+        stats_interval=settings.PDF_WORKER_STATS_INTERVAL_SECONDS,
+        drain_timeout=settings.PDF_WORKER_DRAIN_TIMEOUT_SECONDS,
+        job_store=resources.job_store,
+        dead_letter=resources.sqs_dead_letter_manager,
+        retry_policy=RetryPolicy(
+            max_attempts=settings.PDF_WORKER_MAX_ATTEMPTS,
+            base_delay=settings.PDF_WORKER_RETRY_BASE_SECONDS,
+            max_delay=settings.PDF_WORKER_RETRY_MAX_SECONDS,
+        ),
+        visibility_timeout=settings.PDF_WORKER_VISIBILITY_TIMEOUT_SECONDS,
+        heartbeat_interval=settings.PDF_WORKER_HEARTBEAT_INTERVAL_SECONDS,
+    )
+
+    worker_task = asyncio.current_task()
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, worker_task.cancel)
+    recycler = (
+        asyncio.create_task(_stop_after_jobs(pipeline, max_jobs, worker_task))
+        if max_jobs > 0
+        else None
+    )
 
     logger.info("PDF Worker started. Waiting for messages...")
 
-    while True:
-        try:
-            messages = await sqs.receive_messages(max_messages=1)
-
-            for msg in messages:
-                body = json.loads(msg["Body"])
-                job_id = body.get("job_id")
-                user_data = body.get("user_data")
-
-                logger.info(f"Processing job: {job_id}")
-
-                pdf_bytes = generate_user_pdf(
-                    UserReadSchema(
-                        id=user_data.get("id"),
-                        name=user_data.get("name"),
-                        surname=user_data.get("surname"),
-                        email=user_data.get("email"),
-                        date_of_birth=user_data.get("date_of_birth"),
-                    )
-                )
-
-                file_name = f"{job_id}.pdf"
-                await s3.upload_file(file_name, pdf_bytes)
-
-                await sqs.delete_message(msg["ReceiptHandle"])
-                logger.info(f"Job {job_id} completed successfully.")
-
-        except Exception as error:
-            logger.error(f"Worker error: {error}")
-            await asyncio.sleep(5)
+    try:
+        await pipeline.run()
+    except asyncio.CancelledError:
+        logger.info("PDF Worker stopped.")
+    finally:
+        if recycler is not None:
+            recycler.cancel()
+        await close_resources()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,16 @@
+from datetime import date, datetime
+
+from auth_service.schemas import UserReadSchema
+
+
+def make_user(
+    user_id: int = 1, updated_at: datetime | None = None
+) -> UserReadSchema:
+    return UserReadSchema(
+        id=user_id,
+        name="Ivan",
+        surname="Tester",
+        email=f"user{user_id}@example.com",
+        date_of_birth=date(1995, 1, 1),
+        updated_at=updated_at,
+    )
@@ -0,0 +1,67 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from auth_service.config import (
+    JWTManagerDep,
+    PasswordHasherDep,
+    Settings,
+    close_resources,
+    get_settings,
+)
+from auth_service.main import lifespan
+from auth_service.security import JWTAuthManager
+
+
+def make_settings() -> Settings:
+    return Settings(
+        POSTGRES_USER="user",
+        POSTGRES_PASSWORD="password",
+        POSTGRES_HOST="db",
+        POSTGRES_DB="db",
+        SECRET_KEY_ACCESS="override_access",
+        PASSWORD_HASH_WORKERS=3,
+        TOKEN_SWEEP_ENABLED=False,
+    )
+
+
+def make_app(settings: Settings) -> FastAPI:
+    app = FastAPI(lifespan=lifespan)
+    app.dependency_overrides[get_settings] = lambda: settings
+
+    @app.get("/probe")
+    def probe(jwt_manager: JWTManagerDep, password_hasher: PasswordHasherDep):
+        return {
+            "token": jwt_manager.create_access_token({"user_id": 1}),
+            "workers": password_hasher.stats().workers,
+        }
+
+    return app
+
+
+def assert_uses(settings: Settings, body: dict) -> None:
+    jwt_manager = JWTAuthManager(
+        secret_key_access=settings.SECRET_KEY_ACCESS,
+        secret_key_refresh=settings.SECRET_KEY_REFRESH,
+        algorithm=settings.JWT_SIGNING_ALGORITHM,
+    )
+    assert jwt_manager.decode_access_token(body["token"])["user_id"] == 1
+    assert body["workers"] == settings.PASSWORD_HASH_WORKERS
+
+
+@pytest.mark.parametrize("run_lifespan", [True, False])
+@pytest.mark.asyncio
+async def test_settings_override_reaches_shared_resources(run_lifespan):
+    settings = make_settings()
+    client = TestClient(make_app(settings))
+    try:
+        if run_lifespan:
+            with client:
+                response = client.get("/probe")
+        else:
+            response = client.get("/probe")
+
+        assert response.status_code == 200
+        assert_uses(settings, response.json())
+    finally:
+        await close_resources()
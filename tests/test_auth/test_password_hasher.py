@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from auth_service.exceptions import PasswordHasherBusyError
+from auth_service.security import AsyncPasswordHasher
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_off_loop():
+    hasher = AsyncPasswordHasher(workers=2, max_queue_size=4)
+    try:
+        hashed = await hasher.hash("StrongPassword123!")
+
+        assert await hasher.verify("StrongPassword123!", hashed)
+        assert not await hasher.verify("WrongPassword123!", hashed)
+
+        stats = hasher.stats()
+        assert stats.completed == 3
+        assert stats.queue_depth == 0
+        assert stats.in_progress == 0
+    finally:
+        hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_queue_is_full():
+    hasher = AsyncPasswordHasher(workers=1, max_queue_size=1)
+    try:
+        results = await asyncio.gather(
+            *(hasher.hash("StrongPassword123!") for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        rejected = [
+            r for r in results if isinstance(r, PasswordHasherBusyError)
+        ]
+        assert len(rejected) == 1
+        assert hasher.stats().rejected == 1
+    finally:
+        hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_process_pool_uses_spawned_workers():
+    hasher = AsyncPasswordHasher(
+        workers=1, max_queue_size=1, use_processes=True
+    )
+    try:
+        hashed = await hasher.hash("StrongPassword123!")
+
+        assert await hasher.verify("StrongPassword123!", hashed)
+        assert hasher._get_executor()._mp_context.get_start_method() == "spawn"
+    finally:
+        hasher.shutdown()
@@ -0,0 +1,92 @@
+import httpx
+import pytest
+import respx
+
+from auth_service.clients import CircuitBreaker, CircuitState, PDFServiceClient
+from auth_service.exceptions import PDFServiceUnavailableError
+
+PDF_URL = "http://pdf_service:8001/pdf/generate"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_client(clock: FakeClock) -> PDFServiceClient:
+    return PDFServiceClient(
+        breaker=CircuitBreaker(
+            failure_threshold=2, recovery_timeout=30, clock=clock
+        ),
+        timeout=1.0,
+        max_connections=10,
+        max_keepalive_connections=5,
+        keepalive_expiry=5.0,
+    )
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_breaker_opens_and_fails_fast():
+    clock = FakeClock()
+    client = make_client(clock)
+    route = respx.post(PDF_URL).mock(side_effect=httpx.ConnectError("down"))
+
+    for _ in range(2):
+        with pytest.raises(PDFServiceUnavailableError):
+            await client.post(PDF_URL, json={}, headers={})
+    assert client.breaker.state is CircuitState.OPEN
+
+    with pytest.raises(PDFServiceUnavailableError):
+        await client.post(PDF_URL, json={}, headers={})
+    assert route.call_count == 2
+
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_successful_probe_closes_breaker():
+    clock = FakeClock()
+    client = make_client(clock)
+    respx.post(PDF_URL).mock(
+        side_effect=[
+            httpx.Response(502),
+            httpx.Response(503),
+            httpx.Response(200, content=b"%PDF"),
+        ]
+    )
+
+    await client.post(PDF_URL, json={}, headers={})
+    await client.post(PDF_URL, json={}, headers={})
+    assert client.breaker.state is CircuitState.OPEN
+
+    clock.now = 31
+    response = await client.post(PDF_URL, json={}, headers={})
+    assert response.status_code == 200
+    assert client.breaker.state is CircuitState.CLOSED
+
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_load_shedding_does_not_open_breaker():
+    clock = FakeClock()
+    client = make_client(clock)
+    respx.post(PDF_URL).mock(
+        return_value=httpx.Response(503, headers={"Retry-After": "1"})
+    )
+
+    for _ in range(5):
+        response = await client.post(PDF_URL, json={}, headers={})
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+
+    assert client.breaker.state is CircuitState.CLOSED
+    assert client.breaker.stats().consecutive_failures == 0
+
+    await client.aclose()
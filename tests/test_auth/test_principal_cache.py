@@ -0,0 +1,44 @@
+from auth_service.security import PrincipalCache
+from tests.test_auth.fakes import make_user
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = PrincipalCache(ttl_seconds=10, max_size=10, clock=clock)
+    cache.set(1, make_user(1))
+
+    clock.now = 9
+    assert cache.get(1).id == 1
+
+    clock.now = 10
+    assert cache.get(1) is None
+    assert cache.stats().size == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = PrincipalCache(ttl_seconds=60, max_size=2)
+    cache.set(1, make_user(1))
+    cache.set(2, make_user(2))
+    cache.get(1)
+    cache.set(3, make_user(3))
+
+    assert cache.get(2) is None
+    assert cache.get(1) is not None
+    assert cache.get(3) is not None
+    assert cache.stats().evictions == 1
+
+
+def test_invalidate_drops_entry():
+    cache = PrincipalCache(ttl_seconds=60, max_size=10)
+    cache.set(1, make_user(1))
+    cache.invalidate(1)
+
+    assert cache.get(1) is None
@@ -0,0 +1,102 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from auth_service.config import Settings
+from auth_service.crud.profile import build_profile_etag, etag_matches
+from auth_service.routers.profile import get_profile, get_profile_in_storage
+from tests.test_auth.fakes import make_user
+
+UPDATED_AT = datetime(2024, 5, 6, 7, 8, 9, tzinfo=timezone.utc)
+
+
+def test_etag_changes_with_user_version_variant_and_template():
+    etag = build_profile_etag(make_user(updated_at=UPDATED_AT), "pdf", "1")
+
+    assert etag.startswith('W/"')
+    assert etag == build_profile_etag(
+        make_user(updated_at=UPDATED_AT), "pdf", "1"
+    )
+    assert etag != build_profile_etag(
+        make_user(updated_at=datetime.now(timezone.utc)), "pdf", "1"
+    )
+    assert etag != build_profile_etag(
+        make_user(updated_at=UPDATED_AT), "html", "1"
+    )
+    assert etag != build_profile_etag(
+        make_user(updated_at=UPDATED_AT), "pdf", "2"
+    )
+    assert build_profile_etag(make_user(updated_at=None), "pdf", "1") is None
+
+
+def test_etag_matches_uses_weak_comparison():
+    etag = build_profile_etag(make_user(updated_at=UPDATED_AT), "pdf", "1")
+    opaque_tag = etag.removeprefix("W/")
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(opaque_tag, etag)
+    assert etag_matches(f'"other", {etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches("*", None)
+
+
+def make_settings() -> Settings:
+    return Settings(
+        POSTGRES_USER="user",
+        POSTGRES_PASSWORD="password",
+        POSTGRES_HOST="db",
+        POSTGRES_DB="db",
+    )
+
+
+@pytest.mark.asyncio
+async def test_profile_answers_304_for_current_etag():
+    settings = make_settings()
+    user = make_user(updated_at=UPDATED_AT)
+    etag = build_profile_etag(user, "pdf", settings.PROFILE_PDF_VERSION)
+
+    # The PDF service is not called for a matching ETag.
+    response = await get_profile(
+        request=None,
+        user=user,
+        settings=settings,
+        pdf_client=None,
+        if_none_match=etag,
+    )
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.headers["Cache-Control"] == settings.PROFILE_CACHE_CONTROL
+
+
+class RecordingPDFClient:
+    def __init__(self):
+        self.calls = []
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        self.calls.append(url)
+        return httpx.Response(202, json={"job_id": "job_1"})
+
+
+@pytest.mark.asyncio
+async def test_profile_in_storage_always_enqueues_without_etag():
+    settings = make_settings()
+    pdf_client = RecordingPDFClient()
+    request = SimpleNamespace(headers={"Authorization": "Bearer token"})
+
+    # Each call enqueues a render job, so it is never answered from cache.
+    for _ in range(2):
+        response = await get_profile_in_storage(
+            request=request,
+            user=make_user(updated_at=UPDATED_AT),
+            settings=settings,
+            pdf_client=pdf_client,
+        )
+        assert response.status_code == 202
+        assert "ETag" not in response.headers
+
+    assert pdf_client.calls == [settings.PDF_SERVICE_URL_IN_STORAGE] * 2
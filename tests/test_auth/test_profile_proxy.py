@@ -0,0 +1,39 @@
+import httpx
+import pytest
+
+from auth_service.routers.profile import _relay_body
+
+
+class ChunkedStream(httpx.AsyncByteStream):
+    def __init__(self, chunks: list[bytes]):
+        self.chunks = chunks
+        self.closed = False
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_relay_body_streams_and_closes_upstream():
+    stream = ChunkedStream([b"%PDF", b"-1"])
+    response = httpx.Response(200, stream=stream)
+
+    assert [chunk async for chunk in _relay_body(response)] == [b"%PDF", b"-1"]
+    assert stream.closed
+
+
+@pytest.mark.asyncio
+async def test_relay_body_closes_upstream_on_client_disconnect():
+    stream = ChunkedStream([b"%PDF", b"-1"])
+    response = httpx.Response(200, stream=stream)
+    body = _relay_body(response)
+
+    assert await anext(body) == b"%PDF"
+    # What Starlette does with the body iterator when the client goes away.
+    await body.aclose()
+
+    assert stream.closed
@@ -0,0 +1,180 @@
+import asyncio
+import hashlib
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+
+from auth_service import sweeper
+from auth_service.config import get_settings
+from auth_service.crud import refresh_token
+from auth_service.crud.token import purge_expired_refresh_tokens
+from auth_service.database.base import Base
+from auth_service.database.engine import AsyncSessionLocal, engine
+from auth_service.database.models import RefreshTokenModel, UserModel
+from auth_service.exceptions import UserBaseException
+from auth_service.schemas import RefreshTokenSchema
+from auth_service.security import JWTAuthManager, hash_token
+
+
+def make_jwt_manager() -> JWTAuthManager:
+    return JWTAuthManager(
+        secret_key_access="access",
+        secret_key_refresh="refresh",
+        algorithm="HS256",
+    )
+
+
+@pytest_asyncio.fixture
+async def user_id():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSessionLocal() as db:
+        user = UserModel.create(
+            email="tokens@example.com",
+            hashed_password="hashed",
+            name="Ivan",
+            surname="Tester",
+            date_of_birth=date(1995, 1, 1),
+        )
+        db.add(user)
+        await db.commit()
+        yield user.id
+    await engine.dispose()
+
+
+async def add_tokens(user_id: int, count: int, expired: bool) -> list[int]:
+    offset = timedelta(days=-1 if expired else 1)
+    async with AsyncSessionLocal() as db:
+        tokens = [
+            RefreshTokenModel(
+                user_id=user_id,
+                token_hash=f"{expired:d}{index:063d}",
+                expires_at=datetime.now(timezone.utc) + offset,
+            )
+            for index in range(count)
+        ]
+        db.add_all(tokens)
+        await db.commit()
+        return [token.id for token in tokens]
+
+
+async def count_tokens() -> int:
+    async with AsyncSessionLocal() as db:
+        return await db.scalar(select(func.count(RefreshTokenModel.id)))
+
+
+@pytest.mark.asyncio
+async def test_purge_deletes_expired_tokens_in_batches(user_id):
+    await add_tokens(user_id, 5, expired=True)
+    await add_tokens(user_id, 2, expired=False)
+
+    async with AsyncSessionLocal() as db:
+        assert await purge_expired_refresh_tokens(db, batch_size=3) == 3
+    async with AsyncSessionLocal() as db:
+        assert await purge_expired_refresh_tokens(db, batch_size=3) == 2
+    async with AsyncSessionLocal() as db:
+        assert await purge_expired_refresh_tokens(db, batch_size=3) == 0
+
+    assert await count_tokens() == 2
+
+
+@pytest.mark.asyncio
+async def test_purge_skips_rows_locked_by_another_sweeper(user_id):
+    locked_id, *_ = await add_tokens(user_id, 3, expired=True)
+
+    async with AsyncSessionLocal() as other_sweeper:
+        await other_sweeper.execute(
+            select(RefreshTokenModel)
+            .where(RefreshTokenModel.id == locked_id)
+            .with_for_update()
+        )
+        async with AsyncSessionLocal() as db:
+            deleted = await asyncio.wait_for(
+                purge_expired_refresh_tokens(db, batch_size=10), 5
+            )
+        await other_sweeper.rollback()
+
+    assert deleted == 2
+    assert await count_tokens() == 1
+
+
+@pytest.mark.asyncio
+async def test_sweeper_keeps_running_after_unexpected_error(monkeypatch):
+    sweeps = []
+
+    async def flaky_sweep(batch_size: int, batch_pause: float) -> int:
+        sweeps.append(batch_size)
+        if len(sweeps) == 1:
+            raise RuntimeError("unexpected")
+        if len(sweeps) == 3:
+            raise asyncio.CancelledError
+        return 0
+
+    monkeypatch.setattr(sweeper, "sweep_expired_tokens", flaky_sweep)
+    settings = get_settings().model_copy(
+        update={"TOKEN_SWEEP_INTERVAL_SECONDS": 0}
+    )
+
+    with pytest.raises(asyncio.CancelledError):
+        await sweeper.run_sweeper(settings)
+
+    assert len(sweeps) == 3
+
+
+def test_refresh_tokens_carry_distinct_jti_that_round_trips():
+    jwt_manager = make_jwt_manager()
+    data = {"user_id": 1, "email": "tokens@example.com"}
+
+    first = jwt_manager.create_refresh_token(data)
+    second = jwt_manager.create_refresh_token(data)
+    payload = jwt_manager.decode_refresh_token(first)
+
+    assert first != second
+    assert payload["jti"] != jwt_manager.decode_refresh_token(second)["jti"]
+    assert (payload["user_id"], payload["email"]) == (1, "tokens@example.com")
+
+
+def test_refresh_token_is_stored_as_sha256_digest():
+    token = make_jwt_manager().create_refresh_token({"user_id": 1})
+
+    stored = RefreshTokenModel.create(user_id=1, token=token)
+
+    assert stored.token_hash == hash_token(token)
+    assert stored.token_hash == hashlib.sha256(token.encode()).hexdigest()
+    assert len(stored.token_hash) == 64
+
+
+@pytest.mark.asyncio
+async def test_refresh_looks_token_up_by_digest(user_id):
+    jwt_manager = make_jwt_manager()
+    token = jwt_manager.create_refresh_token(
+        {"user_id": user_id, "email": "tokens@example.com"}
+    )
+    async with AsyncSessionLocal() as db:
+        db.add(RefreshTokenModel.create(user_id=user_id, token=token))
+        await db.commit()
+
+    async with AsyncSessionLocal() as db:
+        response = await refresh_token(
+            RefreshTokenSchema(refresh_token=token),
+            jwt_manager,
+            get_settings(),
+            db,
+        )
+        assert jwt_manager.decode_access_token(response.access_token)[
+            "user_id"
+        ] == (user_id)
+
+        unknown = jwt_manager.create_refresh_token(
+            {"user_id": user_id, "email": "tokens@example.com"}
+        )
+        with pytest.raises(UserBaseException):
+            await refresh_token(
+                RefreshTokenSchema(refresh_token=unknown),
+                jwt_manager,
+                get_settings(),
+                db,
+            )
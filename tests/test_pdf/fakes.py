@@ -0,0 +1,146 @@
+import asyncio
+import re
+
+from pdf_service.schemas import UserReadSchema
+from pdf_service.storage.exceptions import (
+    S3FileNotFoundError,
+    S3RangeNotSatisfiableError,
+)
+from pdf_service.storage.interfaces import (
+    S3FileStream,
+    S3StorageInterface,
+    SQSBatchEntryResult,
+    SQSStorageInterface,
+)
+
+
+def make_user(
+    user_id: int = 1, name: str = "Ivan", email: str | None = None
+) -> UserReadSchema:
+    return UserReadSchema(
+        id=user_id,
+        name=name,
+        surname="Tester",
+        email=email or f"user{user_id}@example.com",
+        date_of_birth="1995-01-01",
+    )
+
+
+class FakeS3(S3StorageInterface):
+    def __init__(self):
+        self.files: dict[str, bytes] = {}
+        self.closed_streams = 0
+
+    async def upload_file(
+        self, file_name: str, file_data: bytes | bytearray
+    ) -> None:
+        self.files[file_name] = bytes(file_data)
+
+    async def download_file(self, file_name: str) -> bytes | None:
+        return self.files.get(file_name)
+
+    async def open_file(
+        self, file_name: str, byte_range: str | None = None
+    ) -> S3FileStream:
+        if file_name not in self.files:
+            raise S3FileNotFoundError()
+        data = self.files[file_name]
+        content_range = None
+        if byte_range:
+            start, end = map(
+                int, re.fullmatch(r"bytes=(\d+)-(\d+)", byte_range).groups()
+            )
+            if start >= len(data):
+                raise S3RangeNotSatisfiableError()
+            end = min(end, len(data) - 1)
+            content_range = f"bytes {start}-{end}/{len(data)}"
+            data = data[start : end + 1]
+
+        async def aclose():
+            self.closed_streams += 1
+
+        async def chunks():
+            try:
+                for offset in range(0, len(data), 4):
+                    yield data[offset : offset + 4]
+            finally:
+                await aclose()
+
+        return S3FileStream(
+            chunks=chunks(),
+            content_length=len(data),
+            content_range=content_range,
+            etag='"etag"',
+            content_type="application/pdf",
+            last_modified=None,
+            aclose=aclose,
+        )
+
+    async def copy_file(self, source_name: str, file_name: str) -> bool:
+        if source_name not in self.files:
+            return False
+        self.files[file_name] = self.files[source_name]
+        return True
+
+    async def get_file_url(self, file_name: str) -> str:
+        return f"https://s3.test/bucket/{file_name}?X-Amz-Signature=fake"
+
+
+class FakeSQS(SQSStorageInterface):
+    def __init__(self, messages: list[dict] | None = None):
+        self.messages = messages or []
+        self.deleted: list[str] = []
+        self.sent: list[dict] = []
+        self.sent_batches: list[list[dict]] = []
+        self.visibility_changes: list[tuple[str, int]] = []
+
+    async def send_message(self, data: dict) -> None:
+        self.sent.append(data)
+        await asyncio.sleep(0)
+
+    async def send_messages_batch(
+        self, data: list[dict]
+    ) -> list[SQSBatchEntryResult]:
+        self.sent_batches.append(data)
+        await asyncio.sleep(0)
+        return [
+            SQSBatchEntryResult(
+                index=index,
+                success=body.get("job_id") != "poison",
+                message_id=f"message_{body.get('job_id')}",
+                error_code=(
+                    None if body.get("job_id") != "poison" else "Invalid"
+                ),
+            )
+            for index, body in enumerate(data)
+        ]
+
+    async def receive_messages(self, max_messages: int = 1) -> list[dict]:
+        batch, self.messages = (
+            self.messages[:max_messages],
+            self.messages[max_messages:],
+        )
+        if not batch:
+            await asyncio.sleep(0.01)
+        return batch
+
+    async def change_visibility_batch(
+        self, entries: list[tuple[str, int]]
+    ) -> list[SQSBatchEntryResult]:
+        self.visibility_changes.extend(entries)
+        return [
+            SQSBatchEntryResult(index=index, success=True)
+            for index in range(len(entries))
+        ]
+
+    async def delete_message(self, receipt_handle: str) -> None:
+        self.deleted.append(receipt_handle)
+
+    async def delete_messages_batch(
+        self, handlers: list[str]
+    ) -> list[SQSBatchEntryResult]:
+        self.deleted.extend(handlers)
+        return [
+            SQSBatchEntryResult(index=index, success=True)
+            for index in range(len(handlers))
+        ]
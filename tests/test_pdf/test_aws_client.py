@@ -0,0 +1,52 @@
+import pytest
+
+from pdf_service.storage.aws_client import AWSClient
+
+
+class FakeSession:
+    def __init__(self):
+        self.opened = 0
+        self.closed = 0
+
+    def client(self, service_name: str, **kwargs):
+        session = self
+
+        class Context:
+            async def __aenter__(self):
+                session.opened += 1
+                return object()
+
+            async def __aexit__(self, *exc_info):
+                session.closed += 1
+                return False
+
+        return Context()
+
+
+@pytest.mark.asyncio
+async def test_started_client_is_entered_once_and_reused():
+    session = FakeSession()
+    aws = AWSClient(session, "s3", "http://s3")
+    await aws.start()
+
+    async with aws.client() as first:
+        pass
+    async with aws.client() as second:
+        pass
+
+    assert first is second
+    assert (session.opened, session.closed) == (1, 0)
+
+    await aws.aclose()
+    assert session.closed == 1
+
+
+@pytest.mark.asyncio
+async def test_client_outside_start_is_short_lived():
+    session = FakeSession()
+    aws = AWSClient(session, "sqs", "http://sqs")
+
+    async with aws.client():
+        pass
+
+    assert (session.opened, session.closed) == (1, 1)
@@ -0,0 +1,49 @@
+import asyncio
+
+import pytest
+
+from pdf_service.services import EnqueueFailedError, SQSEnqueueBatcher
+from tests.test_pdf.fakes import FakeSQS
+
+
+@pytest.mark.asyncio
+async def test_concurrent_enqueues_share_batches():
+    sqs = FakeSQS()
+    batcher = SQSEnqueueBatcher(sqs, max_batch_size=10, flush_window=0.01)
+
+    message_ids = await asyncio.gather(
+        *(batcher.enqueue({"job_id": str(i)}) for i in range(25))
+    )
+
+    assert message_ids == [f"message_{i}" for i in range(25)]
+    assert [len(batch) for batch in sqs.sent_batches] == [10, 10, 5]
+    assert batcher.stats().avg_batch_size == pytest.approx(8.33)
+
+
+@pytest.mark.asyncio
+async def test_failed_entry_only_fails_its_caller():
+    batcher = SQSEnqueueBatcher(FakeSQS(), flush_window=0.01)
+
+    results = await asyncio.gather(
+        batcher.enqueue({"job_id": "ok"}),
+        batcher.enqueue({"job_id": "poison"}),
+        return_exceptions=True,
+    )
+
+    assert results[0] == "message_ok"
+    assert isinstance(results[1], EnqueueFailedError)
+    assert batcher.stats().messages_failed == 1
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_pending_jobs_and_rejects_new_ones():
+    sqs = FakeSQS()
+    batcher = SQSEnqueueBatcher(sqs, flush_window=60)
+
+    pending = asyncio.create_task(batcher.enqueue({"job_id": "1"}))
+    await asyncio.sleep(0)
+    await batcher.aclose()
+
+    assert await pending == "message_1"
+    with pytest.raises(EnqueueFailedError):
+        await batcher.enqueue({"job_id": "2"})
@@ -0,0 +1,206 @@
+import asyncio
+import json
+from functools import partial
+
+import pytest
+
+from pdf_service.schemas import UserReadSchema
+from pdf_service.services import (
+    PDFCache,
+    PDFJobPipeline,
+    PDFRenderPool,
+    PipelineStageConfig,
+    RetryPolicy,
+)
+from pdf_service.storage.interfaces import JobState
+from pdf_service.storage.job_store import MemoryJobStatusStore
+from tests.test_pdf.fakes import FakeS3, FakeSQS
+
+
+def make_message(user_id: int, receive_count: int = 1) -> dict:
+    user = {
+        "id": user_id,
+        "name": "Ivan",
+        "surname": "Tester",
+        "email": f"user{user_id}@example.com",
+        "date_of_birth": "1995-01-01",
+    }
+    return {
+        "Body": json.dumps({"job_id": f"job_{user_id}", "user_data": user}),
+        "ReceiptHandle": f"handle_{user_id}",
+        "MessageId": f"message_{user_id}",
+        "Attributes": {"ApproximateReceiveCount": str(receive_count)},
+    }
+
+
+async def run_until(pipeline: PDFJobPipeline, done) -> None:
+    task = asyncio.create_task(pipeline.run())
+    for _ in range(500):
+        if done():
+            break
+        await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+@pytest.mark.asyncio
+async def test_pipeline_renders_uploads_and_acks_every_job():
+    sqs = FakeSQS([make_message(i) for i in range(25)] + [make_message(3)])
+    s3 = FakeS3()
+    job_store = MemoryJobStatusStore(ttl_seconds=60)
+    renders = []
+
+    async def render(user: UserReadSchema) -> bytes:
+        renders.append(user.id)
+        await asyncio.sleep(0.001)
+        if user.id == 7:
+            raise ValueError("boom")
+        return f"%PDF-{user.id}".encode()
+
+    pipeline = PDFJobPipeline(
+        sqs_manager=sqs,
+        s3_manager=s3,
+        pdf_cache=PDFCache(s3, max_memory_bytes=1024),
+        render=render,
+        stages=PipelineStageConfig(fetch=1, render=4, upload=2, ack=1),
+        queue_size=2,
+        job_store=job_store,
+    )
+    await run_until(
+        pipeline,
+        lambda: pipeline.stats().completed + pipeline.stats().deduplicated
+        == 25,
+    )
+
+    stats = pipeline.stats()
+    assert (stats.received, stats.failed) == (26, 1)
+    # The second job_3 is either acked as a duplicate or served from cache.
+    assert stats.completed + stats.deduplicated == 25
+    assert "handle_7" not in sqs.deleted
+    assert sqs.visibility_changes == [("handle_7", 5)]
+    assert s3.files["job_3.pdf"] == b"%PDF-3"
+    assert "job_7.pdf" not in s3.files
+    assert (await job_store.get("job_3")).state is JobState.DONE
+    retried = await job_store.get("job_7")
+    assert (retried.state, retried.error) == (
+        JobState.QUEUED,
+        "Attempt 1 failed: boom",
+    )
+
+
+@pytest.mark.asyncio
+async def test_exhausted_and_malformed_messages_go_to_dead_letter_queue():
+    poison = {"Body": "not json", "ReceiptHandle": "handle_poison"}
+    sqs = FakeSQS([make_message(1, receive_count=2), make_message(2), poison])
+    dead_letter = FakeSQS()
+    s3 = FakeS3()
+    job_store = MemoryJobStatusStore(ttl_seconds=60)
+
+    async def render(user: UserReadSchema) -> bytes:
+        raise ValueError("boom")
+
+    pipeline = PDFJobPipeline(
+        sqs_manager=sqs,
+        s3_manager=s3,
+        pdf_cache=PDFCache(s3, max_memory_bytes=1024),
+        render=render,
+        job_store=job_store,
+        dead_letter=dead_letter,
+        retry_policy=RetryPolicy(max_attempts=2, base_delay=10),
+    )
+    await run_until(pipeline, lambda: pipeline.stats().failed == 3)
+
+    stats = pipeline.stats()
+    assert (stats.retried, stats.dead_lettered) == (1, 2)
+    assert sqs.visibility_changes == [("handle_2", 10)]
+    assert sorted(sqs.deleted) == ["handle_1", "handle_poison"]
+    records = [
+        record for batch in dead_letter.sent_batches for record in batch
+    ]
+    assert {record["body"] for record in records} == {
+        "not json",
+        make_message(1)["Body"],
+    }
+    assert (await job_store.get("job_1")).state is JobState.FAILED
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_extends_leases_and_shutdown_releases_them():
+    sqs = FakeSQS([make_message(1), make_message(2)])
+    s3 = FakeS3()
+    release_render = asyncio.Event()
+
+    async def render(user: UserReadSchema) -> bytes:
+        await release_render.wait()
+        return b"%PDF"
+
+    pipeline = PDFJobPipeline(
+        sqs_manager=sqs,
+        s3_manager=s3,
+        pdf_cache=PDFCache(s3, max_memory_bytes=1024),
+        render=render,
+        visibility_timeout=45,
+        heartbeat_interval=0.01,
+        drain_timeout=0.05,
+    )
+    await run_until(
+        pipeline, lambda: pipeline.stats().visibility_extensions >= 4
+    )
+
+    assert ("handle_1", 45) in sqs.visibility_changes
+    assert ("handle_2", 45) in sqs.visibility_changes
+    assert sqs.visibility_changes[-2:] == [("handle_1", 0), ("handle_2", 0)]
+    assert pipeline.stats().in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_duplicates_in_one_batch_are_acked_without_rendering():
+    sqs = FakeSQS([make_message(1), make_message(2), make_message(1)])
+    sqs.messages[2]["ReceiptHandle"] = "handle_1_again"
+    s3 = FakeS3()
+    renders = []
+
+    async def render(user: UserReadSchema) -> bytes:
+        renders.append(user.id)
+        await asyncio.sleep(0.01)
+        return f"%PDF-{user.id}".encode()
+
+    pipeline = PDFJobPipeline(
+        sqs_manager=sqs,
+        s3_manager=s3,
+        pdf_cache=PDFCache(s3, max_memory_bytes=0, s3_tier=False),
+        render=render,
+    )
+    await run_until(pipeline, lambda: len(sqs.deleted) == 3)
+
+    stats = pipeline.stats()
+    assert sorted(renders) == [1, 2]
+    assert (stats.completed, stats.deduplicated) == (2, 1)
+    assert sorted(sqs.deleted) == ["handle_1", "handle_1_again", "handle_2"]
+
+
+@pytest.mark.asyncio
+async def test_render_stage_waits_for_a_smaller_render_pool():
+    sqs = FakeSQS([make_message(i) for i in range(8)])
+    s3 = FakeS3()
+    render_pool = PDFRenderPool(workers=1, max_in_flight=1)
+
+    async def render(user: UserReadSchema) -> bytes:
+        await asyncio.sleep(0.001)
+        return f"%PDF-{user.id}".encode()
+
+    render_pool._render = render
+    pipeline = PDFJobPipeline(
+        sqs_manager=sqs,
+        s3_manager=s3,
+        pdf_cache=PDFCache(s3, max_memory_bytes=0, s3_tier=False),
+        render=partial(render_pool.render, wait=True),
+        stages=PipelineStageConfig(fetch=1, render=4, upload=2, ack=1),
+    )
+    await run_until(pipeline, lambda: pipeline.stats().completed == 8)
+
+    stats = pipeline.stats()
+    assert (stats.completed, stats.failed) == (8, 0)
+    assert render_pool.stats().rejected == 0
+    assert sqs.visibility_changes == []
@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+from pdf_service.config.dependencies import get_job_store
+from pdf_service.pdf_main import app
+from pdf_service.storage.interfaces import JobState
+from pdf_service.storage.job_store import MemoryJobStatusStore
+
+
+@pytest_asyncio.fixture
+async def job_store():
+    store = MemoryJobStatusStore(ttl_seconds=60)
+    app.dependency_overrides[get_job_store] = lambda: store
+    yield store
+    app.dependency_overrides.pop(get_job_store)
+
+
+@pytest_asyncio.fixture
+async def client():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.mark.asyncio
+async def test_unknown_job_is_404(job_store, client):
+    response = await client.get("/pdf/jobs/missing")
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_long_poll_returns_on_transition(job_store, client):
+    await job_store.set_state("job", JobState.QUEUED)
+
+    async def finish() -> None:
+        await asyncio.sleep(0.05)
+        await job_store.set_state("job", JobState.DONE)
+
+    finisher = asyncio.create_task(finish())
+    response = await client.get(
+        "/pdf/jobs/job", params={"wait": 5, "version": 1}
+    )
+    await finisher
+
+    assert response.status_code == 200
+    assert response.json()["state"] == "done"
+    assert response.json()["version"] == 2
+
+
+@pytest.mark.asyncio
+async def test_sse_streams_until_final_state(job_store, client):
+    await job_store.set_state("job", JobState.QUEUED)
+
+    async def advance() -> None:
+        await asyncio.sleep(0.05)
+        await job_store.set_state("job", JobState.RENDERING)
+        await job_store.set_state("job", JobState.DONE)
+
+    advancer = asyncio.create_task(advance())
+    response = await client.get(
+        "/pdf/jobs/job", headers={"Accept": "text/event-stream"}
+    )
+    await advancer
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [
+        line
+        for line in response.text.splitlines()
+        if line.startswith("data: ")
+    ]
+    assert '"state": "queued"' in events[0]
+    assert '"state": "done"' in events[-1]
@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from pdf_service.storage.interfaces import JobState
+from pdf_service.storage.job_store import (
+    MemoryJobStatusStore,
+    SQLiteJobStatusStore,
+)
+
+
+@pytest_asyncio.fixture(params=["memory", "sqlite"])
+async def store(request, tmp_path):
+    if request.param == "memory":
+        store = MemoryJobStatusStore(ttl_seconds=60)
+    else:
+        store = SQLiteJobStatusStore(
+            str(tmp_path / "jobs.sqlite3"), ttl_seconds=60, poll_interval=0.05
+        )
+    yield store
+    await store.aclose()
+
+
+@pytest.mark.asyncio
+async def test_transitions_bump_version(store):
+    assert await store.get("job") is None
+
+    await store.set_state("job", JobState.QUEUED)
+    failed = await store.set_state("job", JobState.FAILED, "boom")
+
+    assert (failed.version, failed.error) == (2, "boom")
+    assert await store.get("job") == failed
+
+
+@pytest.mark.asyncio
+async def test_waiter_wakes_on_transition(store):
+    queued = await store.set_state("job", JobState.QUEUED)
+
+    waiter = asyncio.create_task(
+        store.wait_for_update("job", queued.version, 5)
+    )
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    await store.set_state("job", JobState.RENDERING)
+    status = await asyncio.wait_for(waiter, 1)
+    assert status.state is JobState.RENDERING
+
+
+@pytest.mark.asyncio
+async def test_wait_times_out_with_unchanged_status(store):
+    queued = await store.set_state("job", JobState.QUEUED)
+
+    status = await store.wait_for_update("job", queued.version, 0.05)
+
+    assert status == queued
+
+
+@pytest.mark.asyncio
+async def test_sqlite_waiter_sees_other_process_writes(tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    api = SQLiteJobStatusStore(path, ttl_seconds=60, poll_interval=0.02)
+    worker = SQLiteJobStatusStore(path, ttl_seconds=60)
+
+    queued = await api.set_state("job", JobState.QUEUED)
+    waiter = asyncio.create_task(api.wait_for_update("job", queued.version, 5))
+    await worker.set_state("job", JobState.DONE)
+
+    status = await asyncio.wait_for(waiter, 1)
+    assert status.state is JobState.DONE
+    await api.aclose()
+    await worker.aclose()
+
+
+@pytest.mark.asyncio
+async def test_claim_deduplicates_identical_jobs_within_window(store):
+    first, claimed = await store.claim("job", "content-a", window=60)
+    duplicate, duplicate_claimed = await store.claim(
+        "job", "content-a", window=60
+    )
+    changed, changed_claimed = await store.claim("job", "content-b", window=60)
+
+    assert (claimed, duplicate_claimed, changed_claimed) == (True, False, True)
+    assert duplicate == first
+    assert changed.fingerprint == "content-b"
+
+    await store.set_state("job", JobState.FAILED, "boom")
+    _, retried = await store.claim("job", "content-b", window=60)
+    assert retried
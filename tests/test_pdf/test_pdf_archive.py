@@ -0,0 +1,77 @@
+import asyncio
+import io
+import json
+import zipfile
+
+import pytest
+
+from pdf_service.config import PDFSettings
+from pdf_service.crud import prepare_profile_pdf_batch_response
+from pdf_service.schemas import UserReadSchema
+from pdf_service.services import (
+    PDFCache,
+    PDFRenderPool,
+    SingleFlight,
+    stream_pdf_archive,
+)
+from tests.test_pdf.fakes import FakeS3, make_user
+
+
+@pytest.mark.asyncio
+async def test_archive_streams_entries_and_reports_failures():
+    users = [make_user(1), make_user(2), make_user(3), make_user(1)]
+
+    async def render(user: UserReadSchema) -> bytes:
+        if user.id == 2:
+            raise ValueError("boom")
+        return f"%PDF-{user.id}".encode()
+
+    chunks = [chunk async for chunk in stream_pdf_archive(users, render, 2)]
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+
+    assert len(chunks) > 1
+    assert sorted(archive.namelist()) == [
+        "manifest.json",
+        "profile_1.pdf",
+        "profile_1_3.pdf",
+        "profile_3.pdf",
+    ]
+    assert archive.read("profile_3.pdf") == b"%PDF-3"
+
+    manifest = json.loads(archive.read("manifest.json"))
+    assert (manifest["total"], manifest["succeeded"], manifest["failed"]) == (
+        4,
+        3,
+        1,
+    )
+    assert manifest["items"][1] == {
+        "index": 1,
+        "id": 2,
+        "status": "failed",
+        "error": "boom",
+    }
+
+
+@pytest.mark.asyncio
+async def test_batch_items_wait_for_render_pool_capacity():
+    render_pool = PDFRenderPool(workers=1, max_in_flight=1)
+
+    async def slow_render(user: UserReadSchema) -> bytes:
+        await asyncio.sleep(0.001)
+        return f"%PDF-{user.id}".encode()
+
+    render_pool._render = slow_render
+    response = await prepare_profile_pdf_batch_response(
+        [make_user(user_id) for user_id in range(8)],
+        render_pool,
+        PDFCache(FakeS3(), max_memory_bytes=1024, s3_tier=False),
+        SingleFlight(),
+        PDFSettings(PDF_BATCH_CONCURRENCY=4),
+    )
+    body = b"".join([chunk async for chunk in response.body_iterator])
+
+    manifest = json.loads(
+        zipfile.ZipFile(io.BytesIO(body)).read("manifest.json")
+    )
+    assert (manifest["succeeded"], manifest["failed"]) == (8, 0)
+    assert render_pool.stats().rejected == 0
@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from pdf_service.schemas import UserReadSchema
+from pdf_service.services import PDFCache, profile_cache_key
+from tests.test_pdf.fakes import FakeS3, make_user
+
+
+def test_cache_key_depends_on_fields_and_template_version():
+    user = make_user()
+
+    assert profile_cache_key(user) == profile_cache_key(make_user())
+    assert profile_cache_key(user) != profile_cache_key(
+        make_user(name="Petro")
+    )
+    assert profile_cache_key(user) != profile_cache_key(
+        user, template_version="2"
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_or_render_renders_once():
+    renders = []
+
+    async def render(user: UserReadSchema) -> bytes:
+        renders.append(user.id)
+        return b"%PDF-1"
+
+    cache = PDFCache(FakeS3(), max_memory_bytes=1024)
+    user = make_user()
+
+    assert await cache.get_or_render(user, render) == b"%PDF-1"
+    assert await cache.get_or_render(user, render) == b"%PDF-1"
+
+    assert renders == [1]
+    stats = cache.stats()
+    assert (stats.memory_hits, stats.misses, stats.hit_ratio) == (1, 1, 0.5)
+
+
+@pytest.mark.asyncio
+async def test_memory_tier_respects_byte_cap():
+    cache = PDFCache(FakeS3(), max_memory_bytes=10, s3_tier=False)
+    await cache.put("a", b"12345")
+    await cache.put("b", b"12345")
+    await cache.put("c", b"12345")
+
+    assert await cache.get("a") is None
+    assert await cache.get("c") == b"12345"
+    assert cache.stats().memory_bytes == 10
+    assert cache.stats().evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_s3_tier_is_shared_between_processes():
+    s3 = FakeS3()
+    await PDFCache(s3, max_memory_bytes=1024).put("key", b"pdf")
+
+    other_process = PDFCache(s3, max_memory_bytes=1024)
+    assert await other_process.get("key") == b"pdf"
+    assert await other_process.get("key") == b"pdf"
+
+    stats = other_process.stats()
+    assert (stats.s3_hits, stats.memory_hits) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_copy_to_stores_job_file_without_render():
+    s3 = FakeS3()
+    await PDFCache(s3, max_memory_bytes=1024).put("key", b"pdf")
+    cache = PDFCache(s3, max_memory_bytes=1024)
+
+    assert await cache.copy_to("key", "job.pdf")
+    assert s3.files["job.pdf"] == b"pdf"
+    assert not await cache.copy_to("missing", "other.pdf")
+
+
+class SlowS3(FakeS3):
+    def __init__(self):
+        super().__init__()
+        self.release = asyncio.Event()
+
+    async def download_file(self, file_name: str) -> bytes | None:
+        await self.release.wait()
+        return await super().download_file(file_name)
+
+    async def upload_file(
+        self, file_name: str, file_data: bytes | bytearray
+    ) -> None:
+        await self.release.wait()
+        await super().upload_file(file_name, file_data)
+
+
+@pytest.mark.asyncio
+async def test_get_or_render_does_not_wait_on_slow_s3():
+    async def render(user: UserReadSchema) -> bytes:
+        return b"%PDF-1"
+
+    s3 = SlowS3()
+    cache = PDFCache(s3, max_memory_bytes=1024, s3_timeout=0.01)
+    user = make_user()
+
+    data = await asyncio.wait_for(cache.get_or_render(user, render), 1)
+
+    assert data == b"%PDF-1"
+    assert cache.stats().misses == 1
+    assert s3.files == {}
+
+    s3.release.set()
+    await cache.aclose()
+    assert s3.files == {cache.object_name(profile_cache_key(user)): b"%PDF-1"}
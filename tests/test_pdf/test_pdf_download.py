@@ -0,0 +1,88 @@
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+from pdf_service.config import PDFSettings
+from pdf_service.config.dependencies import get_s3_manager, get_settings
+from pdf_service.crud import retrieve_profile_pdf
+from pdf_service.pdf_main import app
+from tests.test_pdf.fakes import FakeS3
+
+DOCUMENT = b"%PDF-1.3 stored profile"
+
+
+@pytest.fixture
+def s3() -> FakeS3:
+    s3 = FakeS3()
+    s3.files["profile.pdf"] = DOCUMENT
+    app.dependency_overrides[get_s3_manager] = lambda: s3
+    yield s3
+    app.dependency_overrides.pop(get_s3_manager)
+
+
+@pytest_asyncio.fixture
+async def client():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.mark.asyncio
+async def test_download_streams_whole_file(s3, client):
+    response = await client.get("/pdf/profile.pdf")
+
+    assert response.status_code == 200
+    assert response.content == DOCUMENT
+    assert response.headers["content-length"] == str(len(DOCUMENT))
+    assert response.headers["etag"] == '"etag"'
+    assert response.headers["accept-ranges"] == "bytes"
+    assert s3.closed_streams == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_is_closed_when_client_disconnects(s3):
+    response = await retrieve_profile_pdf(file_id="profile.pdf", s3_manager=s3)
+
+    assert await anext(response.body_iterator) == DOCUMENT[:4]
+    # What Starlette does with the body iterator when the client goes away.
+    await response.body_iterator.aclose()
+
+    assert s3.closed_streams == 1
+
+
+@pytest.mark.asyncio
+async def test_range_request_returns_partial_content(s3, client):
+    response = await client.get(
+        "/pdf/profile.pdf", headers={"Range": "bytes=0-7"}
+    )
+
+    assert response.status_code == 206
+    assert response.content == DOCUMENT[:8]
+    assert response.headers["content-range"] == f"bytes 0-7/{len(DOCUMENT)}"
+    assert response.headers["content-length"] == "8"
+
+
+@pytest.mark.asyncio
+async def test_missing_file_and_bad_range(s3, client):
+    missing = await client.get("/pdf/missing.pdf")
+    bad_range = await client.get(
+        "/pdf/profile.pdf", headers={"Range": "bytes=1000-2000"}
+    )
+
+    assert missing.status_code == 404
+    assert bad_range.status_code == 416
+
+
+@pytest.mark.asyncio
+async def test_redirect_mode_answers_with_presigned_url(s3, client):
+    app.dependency_overrides[get_settings] = lambda: PDFSettings(
+        PDF_DOWNLOAD_MODE="redirect"
+    )
+    try:
+        response = await client.get("/pdf/profile.pdf")
+    finally:
+        app.dependency_overrides.pop(get_settings)
+
+    assert response.status_code == 302
+    assert response.headers["location"] == await s3.get_file_url("profile.pdf")
+    assert s3.closed_streams == 0
@@ -0,0 +1,64 @@
+import re
+from datetime import datetime, timezone
+
+import pytest
+from fpdf import FPDF
+
+from pdf_service.schemas import UserReadSchema
+from pdf_service.services import generate_user_pdf
+from pdf_service.services import pdf_template
+from pdf_service.services.pdf_service import render_user_pdf_fpdf
+from pdf_service.services.pdf_template import (
+    get_profile_template,
+    layout_profile,
+    profile_values,
+)
+from tests.test_pdf.fakes import make_user
+
+CREATED_AT = datetime(2024, 5, 6, 7, 8, 9, tzinfo=timezone.utc)
+
+
+def render_with_fpdf(user: UserReadSchema) -> bytes:
+    pdf = FPDF()
+    pdf.set_creation_date(CREATED_AT)
+    layout_profile(pdf, profile_values(user))
+    return bytes(pdf.output())
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["Ivan", "O'Neil (Jr) \\ x", "Zoë Ñandú", "A" * 300, ""],
+)
+def test_template_matches_fpdf_output(name):
+    user = make_user(name=name)
+    values = profile_values(user)
+    template = get_profile_template()
+
+    assert template.supports(values)
+    assert template.render(values, CREATED_AT) == render_with_fpdf(user)
+
+
+@pytest.mark.parametrize("name", ["tab\there", "page {nb}", "soft\xadhyphen"])
+def test_unsupported_values_fall_back_to_fpdf(name):
+    user = make_user(name=name)
+
+    assert not get_profile_template().supports(profile_values(user))
+
+    strip = re.compile(rb"D:\d{14}Z|/ID \[<\w+><\w+>\]")
+    expected = strip.sub(b"", render_user_pdf_fpdf(user))
+    assert strip.sub(b"", generate_user_pdf(user)) == expected
+
+
+def test_template_compile_failure_falls_back_to_fpdf(monkeypatch):
+    def unexpected_layout():
+        raise ValueError("Unexpected FPDF content stream layout")
+
+    monkeypatch.setattr(
+        pdf_template, "CompiledProfileTemplate", unexpected_layout
+    )
+    get_profile_template.cache_clear()
+    try:
+        assert get_profile_template() is None
+        assert generate_user_pdf(make_user()).startswith(b"%PDF")
+    finally:
+        get_profile_template.cache_clear()
@@ -0,0 +1,65 @@
+import json
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from pdf_service.config import PDFResources, PDFSettings
+from pdf_service.crud import generate_profile_pdf_in_storage
+from pdf_service.services import SQSEnqueueBatcher
+from pdf_service.storage.job_store import MemoryJobStatusStore
+from tests.test_pdf.fakes import FakeSQS, make_user
+
+
+def make_s3_manager(**overrides):
+    settings = PDFSettings(**overrides)
+    return PDFResources(settings).s3_manager
+
+
+@pytest.mark.asyncio
+async def test_presigned_url_targets_public_endpoint():
+    s3_manager = make_s3_manager(
+        AWS_PUBLIC_ENDPOINT_URL="http://files.example.com",
+        PDF_PRESIGNED_URL_TTL_SECONDS=120,
+    )
+
+    url = urlparse(await s3_manager.get_file_url("profile.pdf"))
+    query = parse_qs(url.query)
+
+    assert url.netloc == "files.example.com"
+    assert url.path.endswith("/profile.pdf")
+    assert query["X-Amz-Expires"] == ["120"]
+    assert "X-Amz-Signature" in query
+    await s3_manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_presigned_urls_are_cached_per_file():
+    s3_manager = make_s3_manager(PDF_PRESIGNED_URL_CACHE_SIZE=1)
+
+    first = await s3_manager.get_file_url("a.pdf")
+    assert await s3_manager.get_file_url("a.pdf") is first
+
+    await s3_manager.get_file_url("b.pdf")
+    assert await s3_manager.get_file_url("a.pdf") is not first
+    await s3_manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_enqueue_links_to_download_endpoint_in_redirect_mode():
+    settings = PDFSettings(
+        PDF_DOWNLOAD_MODE="redirect",
+        PDF_PUBLIC_BASE_URL="https://pdf.example.com",
+    )
+    user = make_user()
+
+    response = await generate_profile_pdf_in_storage(
+        user_data=user,
+        enqueue_batcher=SQSEnqueueBatcher(FakeSQS(), flush_window=0),
+        job_store=MemoryJobStatusStore(ttl_seconds=60),
+        settings=settings,
+    )
+
+    # Presigned only on download, so the link outlives a slow job.
+    assert json.loads(response.body)["link"] == (
+        "https://pdf.example.com/pdf/profile_Ivan_Tester_1.pdf"
+    )
@@ -0,0 +1,75 @@
+import asyncio
+import os
+import signal
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from pdf_service.schemas import UserReadSchema
+from pdf_service.services import PDFRenderPool, RenderPoolBusyError
+from tests.test_pdf.fakes import make_user
+
+
+@pytest.mark.asyncio
+async def test_rejects_renders_past_admission_limit():
+    pool = PDFRenderPool(workers=1, max_in_flight=2, retry_after=3)
+    release = asyncio.Event()
+
+    async def blocked_render(user: UserReadSchema) -> bytes:
+        await release.wait()
+        return b"%PDF"
+
+    pool._render = blocked_render
+    admitted = [
+        asyncio.create_task(pool.render(make_user())) for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+
+    with pytest.raises(RenderPoolBusyError) as error:
+        await pool.render(make_user())
+    assert error.value.retry_after == 3
+    assert (pool.stats().in_flight, pool.stats().rejected) == (2, 1)
+
+    release.set()
+    assert await asyncio.gather(*admitted) == [b"%PDF", b"%PDF"]
+    assert pool.stats().in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_waiting_render_takes_the_next_free_slot():
+    pool = PDFRenderPool(workers=1, max_in_flight=1)
+    release = asyncio.Event()
+
+    async def blocked_render(user: UserReadSchema) -> bytes:
+        await release.wait()
+        return b"%PDF"
+
+    pool._render = blocked_render
+    admitted = asyncio.create_task(pool.render(make_user()))
+    await asyncio.sleep(0)
+    waiting = asyncio.create_task(pool.render(make_user(), wait=True))
+    await asyncio.sleep(0)
+
+    assert not waiting.done()
+    release.set()
+    assert await asyncio.gather(admitted, waiting) == [b"%PDF", b"%PDF"]
+    assert (pool.stats().rejected, pool.stats().in_flight) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_replaces_pool_after_a_process_dies():
+    pool = PDFRenderPool(workers=1, max_in_flight=4)
+    await pool.start()
+    try:
+        assert (await pool.render(make_user())).startswith(b"%PDF")
+
+        for pid in list(pool._executor._processes):
+            os.kill(pid, signal.SIGKILL)
+        with pytest.raises(BrokenProcessPool):
+            await pool.render(make_user())
+
+        assert (await pool.render(make_user())).startswith(b"%PDF")
+        stats = pool.stats()
+        assert (stats.completed, stats.failed, stats.restarts) == (2, 1, 1)
+    finally:
+        pool.shutdown()
@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+
+from pdf_service.crud.profile import render_profile_pdf
+from pdf_service.schemas import UserReadSchema
+from pdf_service.services import (
+    PDFCache,
+    PDFRenderPool,
+    RenderPoolBusyError,
+    SingleFlight,
+)
+from tests.test_pdf.fakes import FakeS3, make_user
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def render() -> bytes:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return b"%PDF"
+
+    callers = [
+        asyncio.create_task(flight.run("key", render)) for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    assert flight.stats().in_flight == 1
+
+    release.set()
+    results = await asyncio.gather(*callers)
+
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+    stats = flight.stats()
+    assert (stats.in_flight, stats.executions, stats.coalesced) == (0, 1, 4)
+
+
+@pytest.mark.asyncio
+async def test_failure_reaches_every_caller_and_is_not_cached():
+    flight = SingleFlight()
+
+    async def fail() -> bytes:
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        flight.run("key", fail),
+        flight.run("key", fail),
+        return_exceptions=True,
+    )
+    assert [str(result) for result in results] == ["boom", "boom"]
+
+    async def render() -> bytes:
+        return b"%PDF"
+
+    assert await flight.run("key", render) == b"%PDF"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_call():
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def render() -> bytes:
+        await release.wait()
+        return b"%PDF"
+
+    first = asyncio.create_task(flight.run("key", render))
+    second = asyncio.create_task(flight.run("key", render))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == b"%PDF"
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+@pytest.mark.asyncio
+async def test_waiting_and_non_waiting_renders_are_not_shared():
+    render_pool = PDFRenderPool(workers=1, max_in_flight=1)
+    release = asyncio.Event()
+
+    async def blocked_render(user: UserReadSchema) -> bytes:
+        await release.wait()
+        return f"%PDF-{user.id}".encode()
+
+    render_pool._render = blocked_render
+    pdf_cache = PDFCache(FakeS3(), max_memory_bytes=1024, s3_tier=False)
+    flight = SingleFlight()
+    busy = asyncio.create_task(render_pool.render(make_user(0)))
+    await asyncio.sleep(0)
+
+    user = make_user(1)
+    single = asyncio.create_task(
+        render_profile_pdf(user, render_pool, pdf_cache, flight)
+    )
+    batch_item = asyncio.create_task(
+        render_profile_pdf(
+            user, render_pool, pdf_cache, flight, wait_for_capacity=True
+        )
+    )
+
+    with pytest.raises(RenderPoolBusyError):
+        await single
+    assert not batch_item.done()
+
+    release.set()
+    assert await batch_item == b"%PDF-1"
+    await busy
+    assert flight.stats().coalesced == 0
@@ -0,0 +1,101 @@
+import pytest
+
+from pdf_service.config import PDFResources, PDFSettings
+from pdf_service.storage.sqs import SQSClient
+
+
+class FakeBotoSQS:
+    def __init__(self):
+        self.calls: list[str] = []
+        self.batch_sizes: list[int] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def get_queue_url(self, QueueName: str) -> dict:
+        self.calls.append("get_queue_url")
+        return {"QueueUrl": f"http://sqs/{QueueName}"}
+
+    async def send_message_batch(
+        self, QueueUrl: str, Entries: list[dict]
+    ) -> dict:
+        self.calls.append("send_message_batch")
+        self.batch_sizes.append(len(Entries))
+        failed = [
+            entry for entry in Entries if '"poison"' in entry["MessageBody"]
+        ]
+        return {
+            "Successful": [
+                {"Id": entry["Id"], "MessageId": f"m{entry['Id']}"}
+                for entry in Entries
+                if entry not in failed
+            ],
+            "Failed": [
+                {"Id": entry["Id"], "Code": "InvalidMessage", "Message": "bad"}
+                for entry in failed
+            ],
+        }
+
+    async def delete_message_batch(
+        self, QueueUrl: str, Entries: list[dict]
+    ) -> dict:
+        self.calls.append("delete_message_batch")
+        self.batch_sizes.append(len(Entries))
+        return {"Successful": [{"Id": entry["Id"]} for entry in Entries]}
+
+    async def change_message_visibility_batch(
+        self, QueueUrl: str, Entries: list[dict]
+    ) -> dict:
+        self.calls.append("change_message_visibility_batch")
+        self.batch_sizes.append(len(Entries))
+        self.visibility_timeouts = [
+            entry["VisibilityTimeout"] for entry in Entries
+        ]
+        return {"Successful": [{"Id": entry["Id"]} for entry in Entries]}
+
+
+@pytest.fixture
+def sqs_client(monkeypatch) -> tuple[SQSClient, FakeBotoSQS]:
+    boto = FakeBotoSQS()
+    client = PDFResources(PDFSettings()).sqs_manager
+    monkeypatch.setattr(client, "_client", lambda: boto)
+    return client, boto
+
+
+@pytest.mark.asyncio
+async def test_send_batch_chunks_by_ten_and_reports_each_entry(sqs_client):
+    client, boto = sqs_client
+    bodies = [{"job_id": str(i)} for i in range(23)]
+    bodies[12] = {"job_id": "poison"}
+
+    results = await client.send_messages_batch(bodies)
+
+    assert boto.batch_sizes == [10, 10, 3]
+    assert [result.index for result in results] == list(range(23))
+    assert [result.index for result in results if not result.success] == [12]
+    assert results[12].error_code == "InvalidMessage"
+    assert results[13].message_id == "m3"
+
+
+@pytest.mark.asyncio
+async def test_queue_url_is_resolved_once(sqs_client):
+    client, boto = sqs_client
+
+    await client.send_messages_batch([{"job_id": "1"}])
+    results = await client.delete_messages_batch(["a", "b"])
+
+    assert all(result.success for result in results)
+    assert boto.calls.count("get_queue_url") == 1
+
+
+@pytest.mark.asyncio
+async def test_change_visibility_batch_keeps_per_entry_timeouts(sqs_client):
+    client, boto = sqs_client
+
+    results = await client.change_visibility_batch([("a", 0), ("b", 30)])
+
+    assert [result.success for result in results] == [True, True]
+    assert boto.visibility_timeouts == [0, 30]
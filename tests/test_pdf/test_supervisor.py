@@ -0,0 +1,70 @@
+import os
+import sys
+import threading
+import time
+
+from pdf_service.config import PDFSettings
+from pdf_service import supervisor
+from pdf_service.supervisor import (
+    WorkerSupervisor,
+    child_settings,
+    process_tree_rss,
+)
+
+
+def test_children_split_cpus_unless_configured():
+    settings = child_settings(PDFSettings(PDF_RENDER_WORKERS=3), processes=64)
+
+    assert settings.PDF_RENDER_WORKERS == 3
+    assert settings.PDF_WORKER_RENDER_CONCURRENCY == 1
+
+
+def test_process_tree_rss_measures_current_process():
+    rss = process_tree_rss(os.getpid())
+
+    assert rss is None or rss > 0
+
+
+def test_supervisor_replaces_exited_and_crashed_children(
+    monkeypatch, tmp_path
+):
+    starts = tmp_path / "starts"
+
+    def fake_worker(settings: PDFSettings, max_jobs: int) -> None:
+        with starts.open("a") as log:
+            log.write(f"{os.getpid()}\n")
+        time.sleep(0.05)
+        sys.exit(1 if len(starts.read_text().split()) == 1 else 0)
+
+    monkeypatch.setattr(supervisor, "_worker_main", fake_worker)
+    workers = WorkerSupervisor(PDFSettings(), processes=1, check_interval=0.02)
+    threading.Timer(1.5, lambda: setattr(workers, "_stopping", True)).start()
+
+    workers.run()
+
+    # First child crashed (restarted after 1s backoff), then clean
+    # recycles are replaced right away.
+    assert len(starts.read_text().split()) >= 3
+
+
+class _FakeProcess:
+    name = "pdf-worker-0"
+    exitcode = 1
+
+    def join(self) -> None:
+        pass
+
+
+def test_crash_backoff_resets_after_healthy_uptime():
+    workers = WorkerSupervisor(PDFSettings(), processes=1)
+    slot = workers._slots[0]
+    slot.crashes = 5
+
+    slot.process, slot.started_at = _FakeProcess(), 100.0
+    workers._reap(slot, now=101.0)
+    assert (slot.crashes, slot.restart_at) == (6, 101.0 + 30)
+
+    slot.process, slot.started_at = _FakeProcess(), 200.0
+    workers._reap(slot, now=200.0 + supervisor.HEALTHY_UPTIME_SECONDS)
+    assert slot.crashes == 1
+    assert slot.restart_at == 201.0 + supervisor.HEALTHY_UPTIME_SECONDS